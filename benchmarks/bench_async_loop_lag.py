@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Event Loop Lag Benchmark - ModernLogger
+
+Runs an asyncio producer that logs 50 messages every millisecond (50k
+messages/sec) for a few seconds while a monitor coroutine measures how
+late its 1 ms sleeps wake up. Compares no logging, a FileLogger and a
+console on a slow stream (1 ms per write, like a backed-up pipe) called
+inline, and the same two sinks behind an AsyncLogger. Reports loop lag
+percentiles and the message rate actually achieved.
+"""
+
+import sys
+import os
+import io
+import time
+import asyncio
+import tempfile
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import AsyncLogger, FileLogger, ConsoleLogger
+
+DURATION = 3.0
+TICK = 0.001
+MESSAGES_PER_TICK = 50
+
+
+class SlowStream(io.StringIO):
+    """Stream whose writes block for a millisecond, like a pipe whose reader is behind"""
+
+    def write(self, data):
+        time.sleep(0.001)
+        return super().write(data)
+
+
+async def measure(logger):
+    """Log at the target rate for DURATION seconds and return (lag samples in ms, messages/s)"""
+    lags = []
+    done = False
+
+    async def monitor():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append((time.perf_counter() - start - TICK) * 1000)
+
+    async def produce():
+        sent = 0
+        start = time.perf_counter()
+        next_tick = start
+        while time.perf_counter() - start < DURATION:
+            if logger is not None:
+                for _ in range(MESSAGES_PER_TICK):
+                    logger.info("request %d handled in %.2f ms", sent, 1.5)
+                    sent += 1
+            else:
+                sent += MESSAGES_PER_TICK
+            next_tick += TICK
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+        return sent / (time.perf_counter() - start)
+
+    monitor_task = asyncio.create_task(monitor())
+    rate = await produce()
+    done = True
+    await monitor_task
+    return lags, rate
+
+
+def percentile(samples, fraction):
+    """Return a percentile of a list of samples"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def main():
+    print("⏱️  Event Loop Lag Benchmark")
+    print("=" * 30)
+    print(f"   Target {MESSAGES_PER_TICK * int(1 / TICK):,} messages/s for {DURATION:.0f} s, 1 ms monitor tick")
+
+    with tempfile.TemporaryDirectory() as directory:
+        scenarios = (
+            ("no logging", lambda: None),
+            ("FileLogger inline", lambda: FileLogger(filename=os.path.join(directory, "inline.log"), mode="w")),
+            ("slow console inline", lambda: ConsoleLogger(stream=SlowStream(), use_colors=False)),
+            ("AsyncLogger(file)", lambda: AsyncLogger(
+                logger=FileLogger(filename=os.path.join(directory, "async.log"), mode="w"))),
+            ("AsyncLogger(slow console)", lambda: AsyncLogger(
+                logger=ConsoleLogger(stream=SlowStream(), use_colors=False))),
+        )
+        for label, make in scenarios:
+            logger = make()
+            lags, rate = await measure(logger)
+            dropped = ""
+            if isinstance(logger, AsyncLogger):
+                await logger.aclose()
+                dropped = f", {logger.dropped_count:,} dropped"
+            elif logger is not None:
+                logger.close()
+            print(f"   {label:<26} lag p50 {percentile(lags, 0.5):>6.3f} ms  p99 {percentile(lags, 0.99):>7.3f} ms  "
+                  f"max {max(lags):>7.2f} ms  {rate:>8,.0f} msgs/s{dropped}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Binary Log Benchmark - ModernLogger
+
+Writes the same records with an async FileLogger (text) and an async
+BinaryFileLogger, then compares file size, re-parsing the text log line
+by line with reading the binary log through BinaryLogReader, and reports
+MB/s for full iteration, counting, a level filter, a rare-level filter
+and a 1% time-range query, plus converting the binary log to CSV.
+"""
+
+import sys
+import os
+import re
+import time
+import random
+import tempfile
+from datetime import datetime
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import Logger, FileLogger, BinaryFileLogger, BinaryLogReader
+
+RECORDS = 500_000
+LINE = re.compile(r"\[(.+?)\] \[(\w+)\]\s+(.*)")
+
+
+def write(logger):
+    """Log RECORDS records and return (records/s, first and last record time)"""
+    rng = random.Random(7)
+    levels = (Logger.DEBUG, Logger.INFO, Logger.INFO, Logger.INFO, Logger.WARNING, Logger.ERROR)
+    first = time.time()
+    start = time.perf_counter()
+    for i in range(RECORDS):
+        # A few CRITICAL records, clustered like a real incident
+        level = Logger.CRITICAL if 300_000 <= i < 300_050 else levels[rng.randrange(6)]
+        logger._log(level, "request %d for client 10.0.%d.%d handled in %d ms", i, i % 256, i % 100, i % 997)
+    logger.close()
+    return RECORDS / (time.perf_counter() - start), first, time.time()
+
+
+def parse_text(filename):
+    """Re-parse a text log into (created, level name, message) tuples"""
+    parsed = []
+    with open(filename, encoding="utf-8") as f:
+        for line in f:
+            match = LINE.match(line)
+            if match:
+                created = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S").timestamp()
+                parsed.append((created, match.group(2), match.group(3)))
+    return len(parsed)
+
+
+def timed(size, run):
+    """Run a read and return (result, MB/s over the whole file)"""
+    start = time.perf_counter()
+    result = run()
+    return result, size / (time.perf_counter() - start) / 1e6
+
+
+def main():
+    print("📦 Binary Log Benchmark")
+    print("=" * 30)
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_file = os.path.join(directory, "app.log")
+        binary_file = os.path.join(directory, "app.mlog")
+        text_rate, _, _ = write(FileLogger(filename=text_file, mode="w", level=Logger.DEBUG, async_mode=True))
+        binary_rate, first, last = write(BinaryFileLogger(filename=binary_file, mode="w", level=Logger.DEBUG,
+                                                          async_mode=True))
+        text_size = os.path.getsize(text_file)
+        binary_size = os.path.getsize(binary_file)
+        print(f"   {RECORDS:,} records")
+        print(f"   write   text   {text_rate:>10,.0f} records/s  {text_size / 1e6:>6.1f} MB")
+        print(f"   write   binary {binary_rate:>10,.0f} records/s  {binary_size / 1e6:>6.1f} MB "
+              f"({binary_size / text_size:.0%} of text)")
+
+        count, rate = timed(text_size, lambda: parse_text(text_file))
+        print(f"   text re-parse                 {rate:>9,.0f} MB/s  {count:>8,} records")
+
+        window = (first + (last - first) * 0.50, first + (last - first) * 0.51)
+        with BinaryLogReader(binary_file) as reader:
+            reads = (
+                ("iterate all records", lambda: sum(1 for _ in reader)),
+                ("count all records", lambda: reader.count()),
+                ("records >= WARNING", lambda: sum(1 for _ in reader.records(Logger.WARNING))),
+                ("records >= CRITICAL", lambda: sum(1 for _ in reader.records(Logger.CRITICAL))),
+                ("1% time range", lambda: sum(1 for _ in reader.records(start_time=window[0], end_time=window[1]))),
+            )
+            for label, run in reads:
+                count, rate = timed(binary_size, run)
+                print(f"   binary {label:<22} {rate:>9,.0f} MB/s  {count:>8,} records")
+
+            csv_file = os.path.join(directory, "app.csv")
+            start = time.perf_counter()
+            reader.export(csv_file, "csv")
+            print(f"   binary -> csv export          {time.perf_counter() - start:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Duplicate Coalescing Benchmark - ModernLogger
+
+Simulates retry loops that log the same error over and over through a
+MultiLogger fanning out to a FileLogger and an in-memory ConsoleLogger, and
+reports calls per second, lines written and records stored with coalescing
+off and on. Each burst repeats one message many times before an occasional
+status line breaks the run.
+"""
+
+import sys
+import os
+import io
+import time
+import tempfile
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import MultiLogger, FileLogger, ConsoleLogger
+
+CALLS = 200_000
+RUN_LENGTH = 5_000  # Identical messages before a status line breaks the run
+
+
+def run(directory, window):
+    """Log a retry storm and return (calls/s, file lines, records stored)"""
+    filename = os.path.join(directory, f"coalesce_{window}.log")
+    file_log = FileLogger(filename=filename, mode="w")
+    console = ConsoleLogger(stream=io.StringIO(), use_colors=False)
+    logger = MultiLogger(loggers=[file_log, console])
+    logger.set_max_records(CALLS)
+    logger.set_coalescing(window)
+
+    start = time.perf_counter()
+    for i in range(CALLS):
+        if i % RUN_LENGTH == 0:
+            logger.info(f"attempt batch {i // RUN_LENGTH} started")
+        logger.error("connection refused: upstream 10.0.0.7:5432")
+    logger.flush()
+    elapsed = time.perf_counter() - start
+    logger.close()
+
+    with open(filename, encoding="utf-8") as f:
+        lines = sum(1 for _ in f)
+    return CALLS / elapsed, lines, len(logger.get_records())
+
+
+def main():
+    print("🔁 Duplicate Coalescing Benchmark")
+    print("=" * 30)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, window in (("coalescing off", None), ("1 s window", 1.0)):
+            rate, lines, records = run(directory, window)
+            print(f"   {label:<15} {rate:>10,.0f} calls/s, {lines:>8,} file lines, {records:>8,} records stored")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Log Collector Benchmark - ModernLogger
+
+Measures aggregate lines per second written by a LogCollector while 1, 4
+and 16 producer processes log through CollectorLogger, and checks that no
+lines are lost or interleaved.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import multiprocessing
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import LogCollector
+
+PRODUCERS = [1, 4, 16]
+MESSAGES = 200_000  # Total per run, split across producers
+
+
+def produce(logger, producer_id, count):
+    """Log count messages from a worker process"""
+    for i in range(count):
+        logger.info(f"producer {producer_id} message {i}")
+
+
+def run(producers, directory):
+    """Run one benchmark round and return (lines written, elapsed seconds)"""
+    filename = os.path.join(directory, f"collector_{producers}.log")
+    per_producer = MESSAGES // producers
+
+    start = time.perf_counter()
+    with LogCollector(filename=filename, mode="w") as collector:
+        logger = collector.get_logger()
+        workers = [multiprocessing.Process(target=produce, args=(logger, p, per_producer))
+                   for p in range(producers)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    elapsed = time.perf_counter() - start
+
+    with open(filename, encoding="utf-8") as f:
+        lines = [line for line in f if line.rstrip().endswith(tuple("0123456789"))]
+    assert len(lines) == per_producer * producers, "lines were lost"
+    return len(lines), elapsed
+
+
+def main():
+    print("🏭 Log Collector Benchmark")
+    print("=" * 30)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for producers in PRODUCERS:
+            lines, elapsed = run(producers, directory)
+            print(f"   {producers:>2} producers: {lines:>8,} lines in {elapsed:>6.2f} s "
+                  f"({lines / elapsed:>10,.0f} lines/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Columnar Query Benchmark - ModernLogger
+
+Fills a RecordStore and a ColumnarRecordStore with 1M records and times
+level, time-range and logger-name queries through Logger.get_records.
+Install numpy to enable the vectorized columnar path.
+"""
+
+import sys
+import os
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import Logger, RecordStore, ColumnarRecordStore
+from modern_logger.logger import LogRecord
+from modern_logger import record_store
+
+RECORDS = 1_000_000
+LEVELS = [Logger.DEBUG, Logger.INFO, Logger.WARNING, Logger.ERROR, Logger.CRITICAL]
+
+
+def build_logger(store, start):
+    """Create a logger whose store holds RECORDS synthetic records"""
+    logger = Logger(level=Logger.DEBUG)
+    logger.set_record_store(store)
+    for i in range(RECORDS):
+        level = LEVELS[i % len(LEVELS)]
+        store.append(LogRecord(start + i * 0.001, level, Logger.LEVEL_NAMES[level],
+                               "benchmark message", f"service-{i % 8}"))
+    return logger
+
+
+def main():
+    print("🗂️ Columnar Query Benchmark")
+    print("=" * 30)
+    print(f"numpy available: {record_store.np is not None}")
+
+    start = time.time()
+    queries = {
+        "level >= CRITICAL, last 100": dict(level_filter=Logger.CRITICAL, limit=100),
+        "1 second time range": dict(start_time=start + 500, end_time=start + 501),
+        "logger name + level, last 10": dict(logger_name="service-3", level_filter=Logger.ERROR, limit=10),
+    }
+
+    for label, store in (("RecordStore", RecordStore(RECORDS)), ("ColumnarRecordStore", ColumnarRecordStore(RECORDS))):
+        logger = build_logger(store, start)
+        print(f"\n{label} ({len(store):,} records)")
+        for name, query in queries.items():
+            t0 = time.perf_counter()
+            results = logger.get_records(**query)
+            elapsed = (time.perf_counter() - t0) * 1000
+            print(f"   {name:<32} {len(results):>6} records {elapsed:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
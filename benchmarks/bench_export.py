@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Export Benchmark - ModernLogger
+
+Exports a large record history in every supported format and reports
+elapsed time and peak memory allocated during the export. Exporters
+stream records, so peak memory should not grow with the record count.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import tracemalloc
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import Logger
+from modern_logger.logger import LogRecord
+
+COUNTS = [100_000, 400_000]
+
+
+def build_logger(count):
+    """Create a logger holding count synthetic records"""
+    logger = Logger(level=Logger.DEBUG)
+    logger.set_max_records(count)
+    start = time.time()
+    for i in range(count):
+        logger._records.append(LogRecord(start + i * 0.001, Logger.INFO, "INFO", f"benchmark message {i}", "Bench"))
+    return logger
+
+
+def main():
+    print("📤 Export Benchmark")
+    print("=" * 30)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in COUNTS:
+            logger = build_logger(count)
+            print(f"\n{count:,} records")
+            for format_type in Logger.EXPORT_FORMATS:
+                path = os.path.join(directory, f"export.{format_type}")
+                tracemalloc.start()
+                t0 = time.perf_counter()
+                logger.export_log(path, format_type)
+                elapsed = time.perf_counter() - t0
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                size = os.path.getsize(path)
+                print(f"   {format_type:<6} {elapsed:>7.2f} s   peak {peak / 1e6:>6.1f} MB   file {size / 1e6:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
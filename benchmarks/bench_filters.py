@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Flood Filter Benchmark - ModernLogger
+
+Floods a FileLogger with calls from a misbehaving endpoint, a few message
+templates with changing arguments, and reports calls per second, lines
+written and the cost of one filter check for no filter, a per-level rate
+limit, DEBUG/INFO sampling and a per-template rate limit.
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import FileLogger, Logger, RateLimitFilter, SamplingFilter, KeyRateLimitFilter
+
+CALLS = 200_000
+CHECKS = 1_000_000
+TEMPLATES = ("upstream %s timed out after %d ms", "retrying request %s (attempt %d)", "cache miss for %s (%d bytes)")
+
+
+def flood(directory, label, log_filter):
+    """Log CALLS flood messages and return (calls/s, lines written)"""
+    filename = os.path.join(directory, f"{label}.log")
+    logger = FileLogger(filename=filename, mode="w", level=Logger.DEBUG)
+    if log_filter is not None:
+        logger.add_filter(log_filter)
+
+    start = time.perf_counter()
+    for i in range(CALLS):
+        logger.info(TEMPLATES[i % len(TEMPLATES)], f"10.0.0.{i % 250}", i)
+    elapsed = time.perf_counter() - start
+    logger.close()
+
+    with open(filename, encoding="utf-8") as f:
+        lines = sum(1 for _ in f)
+    return CALLS / elapsed, lines
+
+
+def check_cost(log_filter):
+    """Return nanoseconds per allow() call"""
+    allow = log_filter.allow
+    start = time.perf_counter()
+    for _ in range(CHECKS):
+        allow(Logger.INFO, TEMPLATES[0])
+    return (time.perf_counter() - start) * 1e9 / CHECKS
+
+
+def main():
+    print("🚦 Flood Filter Benchmark")
+    print("=" * 30)
+
+    filters = (
+        ("no filter", lambda: None),
+        ("rate limit 1000/s", lambda: RateLimitFilter(1000)),
+        ("sampling 1%", lambda: SamplingFilter(0.01)),
+        ("per-template 100/s", lambda: KeyRateLimitFilter(100)),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for index, (label, make) in enumerate(filters):
+            rate, lines = flood(directory, f"flood_{index}", make())
+            log_filter = make()
+            cost = f", {check_cost(log_filter):>4.0f} ns/check" if log_filter is not None else ""
+            print(f"   {label:<20} {rate:>10,.0f} calls/s, {lines:>8,} lines written{cost}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+GUI Flush Benchmark - ModernLogger
+
+Sends 10k messages to the QTextEdit-based ModernLogger in bursts, letting
+the event loop run between bursts as a busy application would, and reports
+the UI-thread time spent until every message is displayed, plus the worst
+single-flush stall from flush_metrics(). Compares the default flush (next
+event loop pass, one append per message, forced repaint) with frame-paced
+flushing at 60 and 30 Hz (one edit block per frame), with and without the
+widget pumping the event loop itself. Runs headless with
+QT_QPA_PLATFORM=offscreen.
+"""
+
+import sys
+import os
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from modern_logger.gui_logger import ModernLogger
+
+MESSAGES = 10_000
+BURST = 50           # Messages logged between event loop passes
+BURST_GAP = 0.002    # Seconds the producer is idle between bursts
+
+
+def run(app, flush_rate, auto_process_events):
+    """Stream MESSAGES into a new widget and return (UI-thread seconds, flushes, worst flush ms)"""
+    widget = ModernLogger(flush_rate=flush_rate, auto_process_events=auto_process_events)
+    widget.resize(800, 600)
+    widget.show()
+    app.processEvents()
+
+    flushes = 0
+    original = widget._process_batch
+
+    def counted():
+        nonlocal flushes
+        if widget._pending_batch:
+            flushes += 1
+        original()
+
+    # Count both timer-driven and synchronous flushes
+    widget._process_batch = counted
+    widget._batch_timer.timeout.disconnect()
+    widget._batch_timer.timeout.connect(counted)
+
+    busy = 0.0
+    for burst in range(MESSAGES // BURST):
+        start = time.perf_counter()
+        for i in range(BURST):
+            widget.append_message(f"Processing item {burst * BURST + i} of the benchmark workload")
+        app.processEvents()
+        busy += time.perf_counter() - start
+        time.sleep(BURST_GAP)
+
+    # Let the last frame flush
+    while widget._pending_batch:
+        start = time.perf_counter()
+        app.processEvents()
+        busy += time.perf_counter() - start
+        time.sleep(BURST_GAP)
+
+    widget.close()
+    return busy, flushes, widget.flush_metrics()['max_flush_ms']
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("🎞️ GUI Flush Benchmark")
+    print("=" * 30)
+
+    modes = (
+        ("next event loop pass", None, True),
+        ("next pass, no event pumping", None, False),
+        ("frame-paced 60 Hz", 60, True),
+        ("frame-paced 30 Hz", 30, True),
+        ("60 Hz, no event pumping", 60, False),
+        ("30 Hz, no event pumping", 30, False),
+    )
+    for label, rate, pump in modes:
+        busy, flushes, worst = run(app, rate, pump)
+        print(f"   {label:<28} {busy * 1000:>9.1f} ms UI-thread time per {MESSAGES:,} messages "
+              f"({flushes:,} flushes, worst flush {worst:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Loading Queue Benchmark - ModernLogger
+
+Queues messages on a QTextEdit-based ModernLogger in loading mode, then
+ends loading and reports the longest single UI-thread stall until every
+queued message is shown and the memory held by the queue. Compares the
+bounded queue drained in chunks across event loop passes with the old
+approach of an unbounded queue appended message by message inside
+set_loading_off. Runs headless with QT_QPA_PLATFORM=offscreen.
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QTextEdit
+
+from modern_logger.gui_logger import ModernLogger
+
+QUEUED = [5_000, 20_000, 200_000]
+LEGACY_MAX = 20_000  # The old drain takes minutes beyond this
+
+
+def new_widget(app):
+    """Create a widget that leaves painting to the event loop"""
+    widget = ModernLogger(auto_process_events=False)
+    widget.resize(800, 600)
+    widget.show()
+    app.processEvents()
+    return widget
+
+
+def run_legacy(app, count):
+    """Return (worst stall ms, queue KiB) for an unbounded queue drained in one loop"""
+    widget = new_widget(app)
+    tracemalloc.start()
+    queued = [f"[2024-01-01 00:00:00] Processing item {i} of the loading workload" for i in range(count)]
+    memory = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for message in queued:
+        QTextEdit.append(widget, message)
+    stall = time.perf_counter() - start
+    app.processEvents()
+    widget.close()
+    return stall * 1000, memory
+
+
+def run_bounded(app, count):
+    """Return (worst stall ms, queue KiB) for the bounded queue drained in chunks"""
+    widget = new_widget(app)
+    widget.set_loading_on()
+    tracemalloc.start()
+    for i in range(count):
+        widget.append_message(f"Processing item {i} of the loading workload")
+    memory = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+
+    widget.reset_flush_metrics()
+    start = time.perf_counter()
+    widget.set_loading_off("Loading complete")
+    worst = time.perf_counter() - start
+    while widget._pending_batch:
+        start = time.perf_counter()
+        app.processEvents()
+        worst = max(worst, time.perf_counter() - start)
+    widget.close()
+    return worst * 1000, memory
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("⏸️ Loading Queue Benchmark")
+    print("=" * 30)
+
+    for count in QUEUED:
+        for label, run in (("unbounded, one loop", run_legacy),
+                           ("bounded, chunked", run_bounded)):
+            if run is run_legacy and count > LEGACY_MAX:
+                print(f"   {count:>7,} queued, {label:<20} skipped")
+                continue
+            stall, memory = run(app, count)
+            print(f"   {count:>7,} queued, {label:<20} worst stall {stall:>8.1f} ms, "
+                  f"queue {memory:>8,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
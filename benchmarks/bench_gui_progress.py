@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Inline Progress Benchmark - ModernLogger
+
+Calls update_progress in a tight loop on a QTextEdit-based ModernLogger whose
+document is already at its 5,000-block limit, and keeps logging so older
+blocks are evicted while progress runs. Compares the time spent in the
+progress calls and the number of rewrites of the coalesced, cursor-anchored
+progress line (in a tight loop a render falls due once per frame and runs
+inside update_progress) with the old approach of looking the block up by
+number and rewriting it on every call, then shows several concurrent lines
+on ModernLogView. Runs headless with QT_QPA_PLATFORM=offscreen.
+"""
+
+import sys
+import os
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QTextCursor
+
+from modern_logger.gui_logger import ModernLogger
+from modern_logger.gui_log_view import ModernLogView
+
+UPDATES = 20_000
+LOG_EVERY = 50  # One regular message per this many progress updates
+LINES = 4
+
+
+def legacy_update(widget, block_number, text):
+    """Rewrite a progress block found by number on every call, as update_progress used to"""
+    doc = widget.document()
+    block = doc.findBlockByNumber(block_number)
+    if not block.isValid():
+        # The number went stale after eviction; fall back to the last block
+        block_number = doc.blockCount() - 1
+        block = doc.findBlockByNumber(block_number)
+    cursor = QTextCursor(block)
+    cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+    cursor.insertText(text)
+    return block_number
+
+
+def new_widget(app):
+    """Create a ModernLogger filled to its block limit"""
+    widget = ModernLogger(auto_process_events=False)
+    widget.resize(800, 600)
+    widget.show()
+    widget._insert_batch([f"history line {i}" for i in range(5000)])
+    app.processEvents()
+    return widget
+
+
+def count_writes(widget):
+    """Count progress lines written to the widget"""
+    writes = [0]
+    original = widget._write_progress_line
+
+    def counted(line, text=None):
+        writes[0] += 1
+        original(line, text)
+
+    widget._write_progress_line = counted
+    return writes
+
+
+def run_legacy(app):
+    """Return (microseconds per update, document rewrites)"""
+    widget = new_widget(app)
+    block_number = widget.document().blockCount() - 1
+    elapsed = 0.0
+    for i in range(UPDATES):
+        start = time.perf_counter()
+        block_number = legacy_update(widget, block_number, f"Progress: {i}/{UPDATES}")
+        elapsed += time.perf_counter() - start
+        if i % LOG_EVERY == 0:
+            widget.append_message(f"Processing item {i}")
+            app.processEvents()
+    widget.close()
+    return elapsed * 1e6 / UPDATES, UPDATES
+
+
+def run_coalesced(app):
+    """Return (microseconds per update, document rewrites)"""
+    widget = new_widget(app)
+    widget.set_loading_on(passthrough_messages=True, inline_update=True)
+    writes = count_writes(widget)
+    elapsed = 0.0
+    for i in range(UPDATES):
+        start = time.perf_counter()
+        widget.update_progress(i, UPDATES)
+        elapsed += time.perf_counter() - start
+        if i % LOG_EVERY == 0:
+            widget.append_message(f"Processing item {i}")
+            app.processEvents()
+    widget.set_loading_off()
+    widget.close()
+    return elapsed * 1e6 / UPDATES, writes[0]
+
+
+def run_view(app):
+    """Return (microseconds per update, row rewrites) for LINES concurrent progress lines"""
+    view = ModernLogView()
+    view.resize(800, 600)
+    view.show()
+    line_ids = [view.add_progress_line(f"Task {n}", UPDATES) for n in range(LINES)]
+    writes = count_writes(view)
+    elapsed = 0.0
+    for i in range(UPDATES):
+        start = time.perf_counter()
+        view.update_progress(i, line_id=line_ids[i % LINES])
+        elapsed += time.perf_counter() - start
+        if i % LOG_EVERY == 0:
+            view.append_message(f"Processing item {i}")
+            app.processEvents()
+    for line_id in line_ids:
+        view.end_progress_line(line_id)
+    view.close()
+    return elapsed * 1e6 / UPDATES, writes[0]
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("⏳ Inline Progress Benchmark")
+    print("=" * 30)
+
+    for label, run in (("block lookup per call", run_legacy),
+                       ("anchored + coalesced", run_coalesced),
+                       (f"ModernLogView, {LINES} lines", run_view)):
+        us, writes = run(app)
+        print(f"   {label:<26} {us:>8.2f} us per update ({writes:,} rewrites for {UPDATES:,} updates)")
+
+
+if __name__ == "__main__":
+    main()
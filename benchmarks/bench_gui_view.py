@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+GUI View Benchmark - ModernLogger
+
+Streams log lines into the QTextEdit-based ModernLogger and the virtualized
+ModernLogView in batches of 100, processing events after each batch as a
+running application would, and reports the UI-thread time per batch. The
+view is then filled to 1M lines to show that batch cost does not grow with
+history. Runs headless with QT_QPA_PLATFORM=offscreen.
+"""
+
+import sys
+import os
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from modern_logger.gui_logger import ModernLogger
+from modern_logger.gui_log_view import ModernLogView
+
+BATCH = 100
+LINES = 20_000
+HISTORY = 1_000_000
+
+
+def stream(widget, app, lines):
+    """Append lines in batches and return the mean milliseconds per batch"""
+    start = time.perf_counter()
+    for i in range(lines):
+        widget.append_message(f"Processing item {i} of the benchmark workload")
+        if i % BATCH == BATCH - 1:
+            app.processEvents()
+    return (time.perf_counter() - start) * 1000 / (lines / BATCH)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("🖥️ GUI View Benchmark")
+    print("=" * 30)
+
+    for label, widget in (("ModernLogger (QTextEdit)", ModernLogger(auto_process_events=False)),
+                          ("ModernLogView", ModernLogView())):
+        widget.resize(800, 600)
+        widget.show()
+        ms = stream(widget, app, LINES)
+        print(f"   {label:<26} {LINES:,} lines: {ms:>7.2f} ms per {BATCH}-line batch")
+
+    view = ModernLogView(max_lines=HISTORY)
+    view.resize(800, 600)
+    view.show()
+    view._model.append_lines([(time.time(), f"history line {i}") for i in range(HISTORY)])
+    app.processEvents()
+    ms = stream(view, app, LINES)
+    print(f"   {'ModernLogView (1M full)':<26} {LINES:,} lines: {ms:>7.2f} ms per {BATCH}-line batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Loading Indicator Benchmark - ModernLogger
+
+Times one animation frame of ColorfulLineIndicator at several widths, using
+the cached gradient strips versus rebuilding both gradients every frame as
+the indicator used to. Runs headless with QT_QPA_PLATFORM=offscreen.
+"""
+
+import sys
+import os
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtGui import QImage
+
+from modern_logger.gui_logger import ColorfulLineIndicator
+
+FRAMES = 500
+WIDTHS = [400, 1200, 3840]
+
+
+def time_frames(indicator, image, rebuild):
+    """Return the mean milliseconds per rendered frame"""
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        if rebuild:
+            indicator._strip_key = None
+        indicator._segment_position = (frame * 0.7) % 100
+        indicator.render(image)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("🌈 Loading Indicator Benchmark")
+    print("=" * 30)
+
+    for width in WIDTHS:
+        host = QWidget()
+        host.resize(width, 20)
+        indicator = ColorfulLineIndicator(host)
+        indicator.setFixedWidth(width)
+        indicator.show()
+        host.show()
+        app.processEvents()
+
+        image = QImage(width, indicator.height(), QImage.Format_ARGB32_Premultiplied)
+        rebuilt = time_frames(indicator, image, rebuild=True)
+        cached = time_frames(indicator, image, rebuild=False)
+        print(f"   {width:>5} px: rebuilt {rebuilt:>6.3f} ms/frame, cached {cached:>6.3f} ms/frame "
+              f"({rebuilt / cached:>5.1f}x)")
+        host.close()
+
+
+if __name__ == "__main__":
+    main()
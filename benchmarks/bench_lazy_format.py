@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Lazy Formatting Benchmark - ModernLogger
+
+Measures disabled DEBUG calls per second on an INFO logger. The baseline
+is the old calling convention: the caller builds an f-string (here with a
+dict and a float, as typical debug output does) and the logger discards it
+after its level check. It is compared with passing %-style and {}-style
+arguments, a zero-argument callable, and guarding with is_enabled_for(),
+none of which build the message.
+"""
+
+import sys
+import os
+import io
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import Logger, ConsoleLogger
+
+CALLS = 1_000_000
+
+
+def main():
+    logger = ConsoleLogger(level=Logger.INFO, stream=io.StringIO())
+    state = {"id": 42, "items": list(range(8)), "status": "retrying"}
+    elapsed_ms = 12.3456
+
+    def before():
+        for _ in range(CALLS):
+            # Old API: only a pre-built string, discarded inside _log
+            logger._log(Logger.DEBUG, f"request {state} took {elapsed_ms:.2f} ms")
+
+    def percent_args():
+        for _ in range(CALLS):
+            logger.debug("request %s took %.2f ms", state, elapsed_ms)
+
+    def brace_args():
+        for _ in range(CALLS):
+            logger.debug("request {} took {:.2f} ms", state, elapsed_ms)
+
+    def callable_message():
+        for _ in range(CALLS):
+            logger.debug(lambda: f"request {state} took {elapsed_ms:.2f} ms")
+
+    def guarded():
+        for _ in range(CALLS):
+            if logger.is_enabled_for(Logger.DEBUG):
+                logger.debug(f"request {state} took {elapsed_ms:.2f} ms")
+
+    print("💤 Lazy Formatting Benchmark")
+    print("=" * 30)
+
+    baseline = None
+    for label, run in (("f-string (before)", before),
+                       ("%-style args", percent_args),
+                       ("{}-style args", brace_args),
+                       ("callable", callable_message),
+                       ("is_enabled_for guard", guarded)):
+        start = time.perf_counter()
+        run()
+        rate = CALLS / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"   {label:<22} {rate:>12,.0f} disabled DEBUG calls/s ({rate / baseline:>5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Log Index Benchmark - ModernLogger
+
+Writes a large text log with an async FileLogger, then compares a
+line-by-line scan that parses every line with LogFileReader: building the
+index on first open, reopening with the saved index, and level,
+rare-level and 1% time-range queries and counts. Reports the time for
+each and the records found.
+"""
+
+import sys
+import os
+import re
+import time
+import random
+import tempfile
+from datetime import datetime
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import Logger, FileLogger, LogFileReader
+from modern_logger.logger import LogRecord
+
+RECORDS = 1_000_000
+LINE = re.compile(r"\[(.+?)\] \[(\w+)\]\s+(.*)")
+LEVELS = {name: level for level, name in Logger.LEVEL_NAMES.items()}
+
+
+def write(filename, first):
+    """Log RECORDS records, ten per second of log time, starting at first"""
+    rng = random.Random(7)
+    levels = (Logger.DEBUG, Logger.INFO, Logger.INFO, Logger.INFO, Logger.WARNING, Logger.ERROR)
+    logger = FileLogger(filename=filename, mode="w", level=Logger.DEBUG, async_mode=True)
+    for i in range(RECORDS):
+        # A few CRITICAL records, clustered like a real incident
+        level = Logger.CRITICAL if 600_000 <= i < 600_050 else levels[rng.randrange(6)]
+        message = f"request {i} for client 10.0.{i % 256}.{i % 100} handled in {i % 997} ms"
+        logger._emit(LogRecord(first + i / 10, level, Logger.LEVEL_NAMES[level], message, logger.name))
+    logger.close()
+
+
+def scan(filename, level_filter=None, start_time=None, end_time=None):
+    """Count matching records by parsing every line, caching parsed timestamps"""
+    times = {}
+    count = 0
+    with open(filename, encoding="utf-8") as f:
+        for line in f:
+            match = LINE.match(line)
+            if not match or LEVELS.get(match.group(2), 0) < (level_filter or 0):
+                continue
+            created = times.get(match.group(1))
+            if created is None:
+                created = times[match.group(1)] = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S").timestamp()
+            if (start_time is None or created >= start_time) and (end_time is None or created < end_time):
+                count += 1
+    return count
+
+
+def timed(run):
+    """Run a read and return (result, seconds)"""
+    start = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print("🗂️  Log Index Benchmark")
+    print("=" * 30)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "app.log")
+        first = 1_700_000_000.0
+        write(filename, first)
+        size = os.path.getsize(filename)
+        window = (first + RECORDS / 10 * 0.50, first + RECORDS / 10 * 0.51)
+        print(f"   {RECORDS:,} records, {size / 1e6:.1f} MB")
+
+        reader, seconds = timed(lambda: LogFileReader(filename))
+        print(f"   build index                   {seconds:>8.3f} s  {reader.block_count:,} blocks, "
+              f"{os.path.getsize(reader.index_path) / 1e3:.1f} KB index")
+        reader.close()
+        reader, seconds = timed(lambda: LogFileReader(filename))
+        print(f"   reopen with saved index       {seconds * 1000:>8.2f} ms")
+
+        queries = (
+            ("records >= WARNING", {"level_filter": Logger.WARNING}),
+            ("records >= CRITICAL", {"level_filter": Logger.CRITICAL}),
+            ("1% time range", {"start_time": window[0], "end_time": window[1]}),
+        )
+        with reader:
+            for label, query in queries:
+                count, scan_seconds = timed(lambda: scan(filename, **query))
+                found, read_seconds = timed(lambda: sum(1 for _ in reader.records(**query)))
+                counted, count_seconds = timed(lambda: reader.count(**query))
+                assert count == found == counted, (label, count, found, counted)
+                print(f"   {label:<22} scan {scan_seconds:>7.3f} s  records() {read_seconds:>7.3f} s  "
+                      f"count() {count_seconds:>7.4f} s  {count:>8,} records")
+
+
+if __name__ == "__main__":
+    main()
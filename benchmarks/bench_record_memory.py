@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Record Memory Benchmark - ModernLogger
+
+Compares bytes per retained record for the previous LogRecord layout
+(per-instance __dict__ holding a datetime) and the compact __slots__
+layout with an epoch float timestamp, at 10k and 1M records.
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger.logger import Logger, LogRecord
+
+COUNTS = [10_000, 1_000_000]
+
+
+class LegacyLogRecord:
+    """The LogRecord layout used before the compact representation"""
+
+    def __init__(self, timestamp, level, level_name, message, logger_name=""):
+        self.timestamp = timestamp
+        self.level = level
+        self.level_name = level_name
+        self.message = message
+        self.logger_name = logger_name
+
+
+def measure(count, factory):
+    """Return bytes allocated per record while building count records"""
+    message = "benchmark message"  # Shared so only the record layout is measured
+    level_name = Logger.LEVEL_NAMES[Logger.INFO]
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    records = [factory(level_name, message) for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    # Subtract the list holding the records
+    used -= sys.getsizeof(records)
+    del records
+    return used / count
+
+
+def main():
+    print("💾 Record Memory Benchmark")
+    print("=" * 30)
+    print(f"{'records':>10} {'legacy':>14} {'compact':>14} {'saved':>8}")
+
+    legacy = lambda level_name, message: LegacyLogRecord(datetime.now(), Logger.INFO, level_name, message, "Bench")
+    compact = lambda level_name, message: LogRecord(time.time(), Logger.INFO, level_name, message, "Bench")
+
+    for count in COUNTS:
+        legacy_bytes = measure(count, legacy)
+        compact_bytes = measure(count, compact)
+        saved = 100 * (1 - compact_bytes / legacy_bytes)
+        print(f"{count:>10,} {legacy_bytes:>8.1f} B/rec {compact_bytes:>8.1f} B/rec {saved:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
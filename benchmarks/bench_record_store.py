@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Record Store Benchmark - ModernLogger
+
+Measures the per-call cost of appending to a full record store at
+1k, 10k and 1M capacity, comparing the RecordStore ring buffer with the
+previous list + pop(0) approach.
+"""
+
+import sys
+import os
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import Logger, RecordStore
+
+CAPACITIES = [1_000, 10_000, 1_000_000]
+OPERATIONS = 20_000
+
+
+def bench_list(capacity, operations):
+    """Append to a full list, evicting with pop(0) like the old Logger._records"""
+    records = [None] * capacity
+    start = time.perf_counter()
+    for i in range(operations):
+        records.append(i)
+        if len(records) > capacity:
+            records.pop(0)
+    return (time.perf_counter() - start) / operations
+
+
+def bench_ring(capacity, operations):
+    """Append to a full RecordStore ring buffer"""
+    store = RecordStore(capacity)
+    for _ in range(capacity):
+        store.append(None)
+    start = time.perf_counter()
+    for i in range(operations):
+        store.append(i)
+    return (time.perf_counter() - start) / operations
+
+
+def bench_logger(capacity, operations):
+    """Log through a base Logger whose record store is already full"""
+    logger = Logger(level=Logger.INFO)
+    logger.set_max_records(capacity)
+    for _ in range(capacity):
+        logger._records.append(None)
+    start = time.perf_counter()
+    for i in range(operations):
+        logger.info("benchmark message")
+    return (time.perf_counter() - start) / operations
+
+
+def main():
+    print("📦 Record Store Benchmark")
+    print("=" * 30)
+    print(f"{'capacity':>10} {'list+pop(0)':>14} {'RecordStore':>14} {'Logger.info':>14}")
+
+    for capacity in CAPACITIES:
+        list_cost = bench_list(capacity, OPERATIONS)
+        ring_cost = bench_ring(capacity, OPERATIONS)
+        logger_cost = bench_logger(capacity, OPERATIONS)
+        print(f"{capacity:>10,} {list_cost * 1e9:>11.0f} ns {ring_cost * 1e9:>11.0f} ns {logger_cost * 1e9:>11.0f} ns")
+
+    print("\nPer-call cost of the ring buffer should stay flat as capacity grows.")
+
+
+if __name__ == "__main__":
+    main()
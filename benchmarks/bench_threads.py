@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Thread Stress Benchmark - ModernLogger
+
+Logs a fixed total of records from 1 up to 32 threads into a FileLogger
+and a ConsoleLogger on an in-memory stream behind a MultiLogger. Checks
+that no record is lost (stored records, file lines and console lines all
+equal the number of calls, every line is intact and each thread's records
+keep their order) and reports throughput, scaling relative to one thread
+and the hold and wait times of the record-store and sink locks.
+"""
+
+import sys
+import os
+import io
+import time
+import tempfile
+import threading
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import MultiLogger, FileLogger, ConsoleLogger
+
+TOTAL = 320_000
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+def run(directory, threads):
+    """Log TOTAL records from a number of threads, verify them and return (records/s, lock stats)"""
+    filename = os.path.join(directory, f"threads_{threads}.log")
+    file_log = FileLogger(filename=filename, mode="w")
+    console = ConsoleLogger(stream=io.StringIO(), use_colors=False)
+    logger = MultiLogger(loggers=[file_log, console])
+    logger.set_max_records(TOTAL)
+
+    per_thread = TOTAL // threads
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        start_barrier.wait()
+        for i in range(per_thread):
+            logger.info("worker %d record %d", index, i)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.join()
+    elapsed = time.perf_counter() - start
+    logger.close()
+
+    expected = per_thread * threads
+    records = logger.get_records()
+    with open(filename, encoding="utf-8") as f:
+        file_lines = f.read().splitlines()
+    console_lines = console.stream.getvalue().splitlines()
+    assert len(records) == expected, f"{len(records):,} of {expected:,} records stored"
+    assert len(file_lines) == expected, f"{len(file_lines):,} of {expected:,} file lines"
+    assert len(console_lines) == expected, f"{len(console_lines):,} of {expected:,} console lines"
+    assert all(line.endswith(f" record {line.rsplit(' ', 1)[1]}") and line.count("[") == 2
+               for line in file_lines), "interleaved file lines"
+
+    next_index = [0] * threads
+    for record in records:
+        _, index, _, i = record.message.split()
+        index = int(index)
+        assert int(i) == next_index[index], f"worker {index} records out of order"
+        next_index[index] += 1
+
+    return expected / elapsed, logger.lock_stats(), file_log.lock_stats()
+
+
+def main():
+    print("🧵 Thread Stress Benchmark")
+    print("=" * 30)
+    print(f"   {TOTAL:,} records per run, {os.cpu_count()} CPU(s)")
+
+    baseline = None
+    with tempfile.TemporaryDirectory() as directory:
+        for threads in THREAD_COUNTS:
+            rate, multi_stats, file_stats = run(directory, threads)
+            baseline = baseline or rate
+            store = multi_stats['records']
+            sink = file_stats['sink']
+            print(f"   {threads:>2} threads {rate:>10,.0f} records/s ({rate / baseline:>4.2f}x), no records lost | "
+                  f"store lock max {store['hold_max_ms']:.2f} ms hold | "
+                  f"file lock {sink['hold_mean_us']:.1f} us mean hold, "
+                  f"{sink['contended']:,} waits, max {sink['wait_max_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tiered Record Store Benchmark - ModernLogger
+
+Stores 1M records through a Logger with a RecordStore large enough to
+keep them all and with a TieredRecordStore that keeps 10k in memory and
+spills the rest to disk. Reports the per-record store cost, memory still
+allocated afterwards (tracemalloc), disk used, and the time of a full
+JSONL export, a level query, a time-range query and counts across both
+tiers.
+"""
+
+import sys
+import os
+import time
+import random
+import tempfile
+import tracemalloc
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modern_logger import Logger, TieredRecordStore
+from modern_logger.logger import LogRecord
+
+RECORDS = 1_000_000
+HOT_RECORDS = 10_000
+
+
+def fill(logger, records, trace=False):
+    """Store records through the logger and return (µs per record, bytes still allocated if traced)"""
+    if trace:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for record in records:
+        logger._store_record(record)
+    with logger._records_lock:
+        logger._sync_records()
+    elapsed = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return elapsed / RECORDS * 1e6, used
+
+
+def timed(run):
+    """Run a read and return (result, seconds)"""
+    start = time.perf_counter()
+    result = run()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print("🗄️  Tiered Record Store Benchmark")
+    print("=" * 30)
+
+    rng = random.Random(7)
+    levels = (Logger.DEBUG, Logger.INFO, Logger.INFO, Logger.INFO, Logger.WARNING, Logger.ERROR)
+    first = 1_700_000_000.0
+
+    def records():
+        for i in range(RECORDS):
+            level = Logger.CRITICAL if 300_000 <= i < 300_050 else levels[rng.randrange(6)]
+            yield LogRecord(first + i / 100, level, Logger.LEVEL_NAMES[level],
+                            f"request {i} for client 10.0.{i % 256}.{i % 100} handled in {i % 997} ms", "Bench")
+
+    window = (first + RECORDS / 100 * 0.50, first + RECORDS / 100 * 0.51)
+    print(f"   {RECORDS:,} records, {HOT_RECORDS:,} kept in memory by the tiered store")
+
+    with tempfile.TemporaryDirectory() as directory:
+        def keep_everything():
+            logger = Logger("Bench")
+            logger.set_max_records(RECORDS)
+            return logger
+
+        def tiered():
+            logger = Logger("Bench")
+            logger.set_record_store(TieredRecordStore(capacity=HOT_RECORDS, directory=directory))
+            return logger
+
+        for label, make in ((f"RecordStore({RECORDS:,})", keep_everything), ("TieredRecordStore", tiered)):
+            # Timed and traced in separate runs; tracing allocations slows every call down
+            rng.seed(7)
+            logger = make()
+            per_record, _ = fill(logger, records())
+            logger._records.clear()
+            rng.seed(7)
+            logger = make()
+            _, used = fill(logger, records(), trace=True)
+            disk = ""
+            if isinstance(logger._records, TieredRecordStore):
+                disk = f"  {logger._records.disk_bytes / 1e6:.1f} MB on disk"
+            print(f"   {label:<24} {per_record:>6.2f} µs/record  {used / 1e6:>7.1f} MB in memory{disk}")
+        store = logger._records
+
+        reads = (
+            ("export all as jsonl", lambda: logger.export_log(os.path.join(directory, "all.jsonl"), "jsonl")),
+            ("records >= CRITICAL", lambda: len(logger.get_records(level_filter=Logger.CRITICAL))),
+            ("1% time range", lambda: len(logger.get_records(start_time=window[0], end_time=window[1]))),
+            ("count >= WARNING", lambda: store.count(level_filter=Logger.WARNING)),
+            ("count 1% time range", lambda: store.count(start_time=window[0], end_time=window[1])),
+            ("last 100 records", lambda: len(logger.get_records(limit=100))),
+        )
+        for label, run in reads:
+            result, seconds = timed(run)
+            print(f"   {label:<24} {seconds:>8.3f} s  {result}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
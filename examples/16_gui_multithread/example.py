@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 try:
     from modern_logger import ModernLogger
     from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget, QPushButton, QLabel, QHBoxLayout
-    from PySide6.QtCore import QThread, Signal
+    from PySide6.QtCore import QThread
     import time
     
     GUI_AVAILABLE = True
@@ -28,10 +28,10 @@ except ImportError as e:
 
 class MultiWorkerThread(QThread):
     """Worker thread for multithread demonstration"""
-    message_ready = Signal(str, str, int)  # level, message, thread_id
     
-    def __init__(self, thread_id, task_type="general", message_count=10):
+    def __init__(self, logger, thread_id, task_type="general", message_count=10):
         super().__init__()
+        self.logger = logger
         self.thread_id = thread_id
         self.task_type = task_type
         self.message_count = message_count
@@ -58,7 +58,12 @@ class MultiWorkerThread(QThread):
                 level = random.choice(["info", "warning"])
                 message = f"Task {i+1}"
             
-            self.message_ready.emit(level, message, self.thread_id)
+            # Log straight from the worker thread; the GUI widget hands
+            # messages over to the GUI thread itself
+            if level == "info":
+                self.logger.info(f"🔵 [T{self.thread_id}] {message}")
+            else:
+                self.logger.warning(f"🟡 [T{self.thread_id}] {message}")
     
     def stop(self):
         self.running = False
@@ -120,13 +125,7 @@ def main():
                 active_workers = 4
                 
                 for i in range(4):
-                    worker = MultiWorkerThread(i+1, "database", 8)
-                    
-                    def on_message(level, message, thread_id):
-                        if level == "info":
-                            logger.info(f"🔵 [T{thread_id}] {message}")
-                        else:
-                            logger.warning(f"🟡 [T{thread_id}] {message}")
+                    worker = MultiWorkerThread(logger, i+1, "database", 8)
                     
                     def on_finished():
                         nonlocal active_workers
@@ -136,7 +135,6 @@ def main():
                             concurrent_button.setEnabled(True)
                             stop_button.setEnabled(False)
                     
-                    worker.message_ready.connect(on_message)
                     worker.finished.connect(on_finished)
                     workers.append(worker)
                     worker.start()
@@ -6,7 +6,7 @@ This package provides multiple logging options:
 - File logging with rotation support
 - GUI logging with a modern interface and progress indicators
 - Multi-destination logging to any combination of outputs
-- Log export in multiple formats (log, csv, xml, json)
+- Log export in multiple formats (log, csv, xml, json, jsonl, binary)
 
 Examples:
     # Basic console-only logger (default)
@@ -22,6 +22,9 @@ Examples:
     widget = logger.get_gui_widget()  # Get widget for embedding in your app
     logger.info("GUI logging enabled")
 
+    # GUI for high message volumes (only visible rows are rendered)
+    logger = ModernLogger(gui=True, virtualized=True)
+
     # Full logger with all outputs
     logger = ModernLogger(console=True, file="logs/app.log", gui=True)
     logger.info("Logging to all outputs")
@@ -35,6 +38,13 @@ from typing import Optional
 
 # Import core logger components (always available)
 from .logger import Logger, FileLogger, ConsoleLogger, MultiLogger
+from .record_store import RecordStore, ColumnarRecordStore
+from .tiered_store import TieredRecordStore
+from .collector import LogCollector, CollectorLogger
+from .async_logger import AsyncLogger
+from .binary_log import BinaryFileLogger, BinaryLogReader
+from .log_reader import LogFileReader
+from .filters import LogFilter, RateLimitFilter, SamplingFilter, KeyRateLimitFilter
 
 __version__ = "1.0.0"
 
@@ -51,8 +61,19 @@ def _import_gui_components():
             f"Original error: {e}"
         )
 
+def _import_gui_view():
+    """Lazy import of the virtualized GUI log view"""
+    try:
+        from .gui_log_view import ModernLogView
+        return ModernLogView
+    except ImportError as e:
+        raise ImportError(
+            f"GUI components require PySide6. Please install it with: pip install PySide6\n"
+            f"Original error: {e}"
+        )
+
 class ModernLogger:
-    def __init__(self, console=True, file=False, gui=False):
+    def __init__(self, console=True, file=False, gui=False, virtualized=False):
         """
         Initialize ModernLogger with specified outputs.
         
@@ -60,6 +81,8 @@ class ModernLogger:
             console (bool): Enable console output. Defaults to True.
             file (Union[bool, str]): Enable file output. If string, use as file path. Defaults to False.
             gui (bool): Enable GUI output. Defaults to False.
+            virtualized (bool): Use the model/view ModernLogView widget, which keeps up to a
+                million lines and only renders visible rows. Defaults to False.
         """
         self.loggers = []
         self.multi_logger = MultiLogger()
@@ -74,35 +97,71 @@ class ModernLogger:
         if gui:
             # Lazy import GUI components only when needed
             GUIModernLogger, GUILogger = _import_gui_components()
-            self.gui_logger = GUIModernLogger()
+            self.gui_logger = _import_gui_view()() if virtualized else GUIModernLogger()
             self.loggers.append(GUILogger(gui_logger=self.gui_logger))
             
         for logger in self.loggers:
             self.multi_logger.add_logger(logger)
     
-    def debug(self, message):
-        """Log debug message"""
-        self.multi_logger.debug(message)
+    def debug(self, message, *args, **kwargs):
+        """Log debug message (args are formatted only if the message is logged)"""
+        self.multi_logger.debug(message, *args, **kwargs)
     
-    def info(self, message):
-        """Log info message"""
-        self.multi_logger.info(message)
+    def info(self, message, *args, **kwargs):
+        """Log info message (args are formatted only if the message is logged)"""
+        self.multi_logger.info(message, *args, **kwargs)
     
-    def warning(self, message):
-        """Log warning message"""
-        self.multi_logger.warning(message)
+    def warning(self, message, *args, **kwargs):
+        """Log warning message (args are formatted only if the message is logged)"""
+        self.multi_logger.warning(message, *args, **kwargs)
     
-    def error(self, message):
-        """Log error message"""
-        self.multi_logger.error(message)
+    def error(self, message, *args, **kwargs):
+        """Log error message (args are formatted only if the message is logged)"""
+        self.multi_logger.error(message, *args, **kwargs)
     
-    def critical(self, message):
-        """Log critical message"""
-        self.multi_logger.critical(message)
+    def critical(self, message, *args, **kwargs):
+        """Log critical message (args are formatted only if the message is logged)"""
+        self.multi_logger.critical(message, *args, **kwargs)
     
-    def exception(self, message="Exception occurred"):
+    def exception(self, message="Exception occurred", *args, **kwargs):
         """Log exception with traceback"""
-        self.multi_logger.exception(message)
+        self.multi_logger.exception(message, *args, **kwargs)
+    
+    def add_filter(self, log_filter):
+        """
+        Add a flood filter applied before messages reach any output
+        
+        Args:
+            log_filter (LogFilter): RateLimitFilter, SamplingFilter, KeyRateLimitFilter or custom filter
+        """
+        self.multi_logger.add_filter(log_filter)
+    
+    def remove_filter(self, log_filter):
+        """Remove a flood filter"""
+        self.multi_logger.remove_filter(log_filter)
+    
+    def set_format_style(self, style):
+        """
+        Set how positional arguments are merged into messages
+        
+        Args:
+            style (str): '%' for %-style placeholders (the default) or '{' for str.format() placeholders
+        """
+        self.multi_logger.set_format_style(style)
+    
+    def is_enabled_for(self, level):
+        """Check whether a message of a level would be logged"""
+        return self.multi_logger.is_enabled_for(level)
+    
+    def set_coalescing(self, window=1.0):
+        """
+        Collapse runs of identical consecutive messages on every output
+        
+        Args:
+            window (float, optional): Seconds of repeats covered by one "(repeated N more times)"
+                summary, or None to disable. Defaults to 1.0.
+        """
+        self.multi_logger.set_coalescing(window)
     
     def get_gui_widget(self):
         """Get the GUI widget if GUI logging is enabled"""
@@ -116,20 +175,28 @@ class ModernLogger:
             pass
         return None
     
+    def flush(self):
+        """Flush all loggers that buffer output"""
+        self.multi_logger.flush()
+    
     def close(self):
         """Close all loggers and clean up resources"""
         if hasattr(self, 'multi_logger') and self.multi_logger:
             self.multi_logger.close()
     
-    def export_log(self, filepath: str, format_type: str = "log", level_filter: Optional[int] = None, limit: Optional[int] = None) -> bool:
+    def export_log(self, filepath: str, format_type: str = "log", level_filter: Optional[int] = None, limit: Optional[int] = None,
+                   start_time=None, end_time=None, logger_name: Optional[str] = None) -> bool:
         """
         Export log records to file in specified format
         
         Args:
             filepath (str): Output file path
-            format_type (str): Export format ('log', 'csv', 'xml', 'json')
+            format_type (str): Export format ('log', 'csv', 'xml', 'json', 'jsonl', 'binary')
             level_filter (Optional[int]): Minimum level to include (use Logger.DEBUG, Logger.INFO, etc.)
             limit (Optional[int]): Maximum number of records to export
+            start_time (datetime or float, optional): Earliest record time to include (inclusive)
+            end_time (datetime or float, optional): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
             
         Returns:
             bool: True if export successful, False otherwise
@@ -144,20 +211,24 @@ class ModernLogger:
             # Export last 100 logs as XML
             logger.export_log("logs/recent.xml", "xml", limit=100)
         """
-        return self.multi_logger.export_log(filepath, format_type, level_filter, limit)
+        return self.multi_logger.export_log(filepath, format_type, level_filter, limit, start_time, end_time, logger_name)
     
-    def get_records(self, level_filter: Optional[int] = None, limit: Optional[int] = None):
+    def get_records(self, level_filter: Optional[int] = None, limit: Optional[int] = None,
+                    start_time=None, end_time=None, logger_name: Optional[str] = None):
         """
         Get stored log records with optional filtering
         
         Args:
             level_filter (Optional[int]): Minimum level to include
             limit (Optional[int]): Maximum number of records to return
+            start_time (datetime or float, optional): Earliest record time to include (inclusive)
+            end_time (datetime or float, optional): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
             
         Returns:
             List: Filtered log records
         """
-        return self.multi_logger.get_records(level_filter, limit)
+        return self.multi_logger.get_records(level_filter, limit, start_time, end_time, logger_name)
     
     def clear_records(self):
         """Clear all stored log records"""
@@ -171,6 +242,27 @@ class ModernLogger:
             max_records (int): Maximum number of records to keep
         """
         self.multi_logger.set_max_records(max_records)
+    
+    def set_record_store(self, store):
+        """
+        Replace the record store used for get_records and export_log
+        
+        Args:
+            store (RecordStore, ColumnarRecordStore or TieredRecordStore): New record store
+        """
+        self.multi_logger.set_record_store(store)
+
+    def lock_stats(self):
+        """
+        Get lock contention and hold-time statistics of every logger
+
+        Returns:
+            Dict: Logger name -> {'records': ..., 'sink': ...} statistics, see Logger.lock_stats()
+        """
+        stats = {self.multi_logger.name: self.multi_logger.lock_stats()}
+        for logger in self.loggers:
+            stats[logger.name] = logger.lock_stats()
+        return stats
 
 # Function to get GUI components (for advanced users who want direct access)
 def get_gui_components():
@@ -193,6 +285,31 @@ __all__ = [
     'MultiLogger',
     'ModernLogger',
     
+    # asyncio front end
+    'AsyncLogger',
+    
+    # Binary log format
+    'BinaryFileLogger',
+    'BinaryLogReader',
+    
+    # Reading text log files
+    'LogFileReader',
+    
+    # Multi-process logging
+    'LogCollector',
+    'CollectorLogger',
+    
+    # Flood filters
+    'LogFilter',
+    'RateLimitFilter',
+    'SamplingFilter',
+    'KeyRateLimitFilter',
+    
+    # Record storage
+    'RecordStore',
+    'ColumnarRecordStore',
+    'TieredRecordStore',
+    
     # Utility functions
     'get_gui_components',
 ] 
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+asyncio front end for Modern Logger.
+
+Every core logger writes to its destination on the caller's thread, which
+stalls an event loop for as long as the file or console takes. This module
+keeps that I/O off the loop:
+- AsyncLogger, a logger whose calls only enqueue the record; a writer task
+  on the event loop hands batches to a single executor thread that writes
+  them through any wrapped Logger
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from .logger import Logger, LogRecord, ConsoleLogger
+from .writers import BackgroundWriter
+
+
+class AsyncLogger(Logger):
+    """Logger for coroutines: log calls enqueue, an executor thread writes"""
+
+    # Blocking the event loop on a full queue would stall every coroutine
+    OVERFLOW_POLICIES = (BackgroundWriter.DROP_OLDEST, BackgroundWriter.DROP_NEW)
+
+    def __init__(self,
+                 name: str = "AsyncLogger",
+                 level: int = Logger.INFO,
+                 logger: Optional[Logger] = None,
+                 max_queue_size: int = 100000,
+                 batch_size: int = 512,
+                 overflow_policy: str = BackgroundWriter.DROP_OLDEST):
+        """
+        Initialize an asyncio logger
+
+        Args:
+            name (str, optional): Logger name. Defaults to "AsyncLogger".
+            level (int, optional): Minimum log level. Defaults to Logger.INFO.
+            logger (Optional[Logger], optional): Logger that writes the records (FileLogger, ConsoleLogger,
+                MultiLogger, ...). Defaults to None (a ConsoleLogger).
+            max_queue_size (int, optional): Maximum records waiting to be written. Defaults to 100000.
+            batch_size (int, optional): Maximum records handed to the writer thread at once. Defaults to 512.
+            overflow_policy (str, optional): 'drop_oldest' or 'drop_new' when the queue is full. Dropped
+                records are reported by a WARNING record written with the next batch. Defaults to 'drop_oldest'.
+        """
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {overflow_policy}. "
+                             f"Supported policies: {', '.join(self.OVERFLOW_POLICIES)}")
+
+        super().__init__(name, level)
+        self.logger = logger if logger is not None else ConsoleLogger()
+        self.max_queue_size = max(1, max_queue_size)
+        self.batch_size = max(1, batch_size)
+        self.overflow_policy = overflow_policy
+
+        self._queue: deque = deque()
+        self._dropped = 0
+        self._dropped_reported = 0  # Dropped records already reported by a summary record
+        self._closed = False
+        # One writer thread keeps records in order and never runs two writes at once
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-writer")
+
+        # Writer task state, bound to the event loop of the first log call
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wakeup_pending = False
+        self._flush_waiters: List[asyncio.Future] = []
+
+    @property
+    def pending_count(self) -> int:
+        """Number of records waiting to be written"""
+        return len(self._queue)
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of records dropped because the queue was full"""
+        return self._dropped
+
+    def _emit(self, record: LogRecord) -> None:
+        """
+        Store a record and queue it for the writer thread
+
+        From a coroutine this never blocks. Called from another thread, the
+        wake-up is handed to the event loop. With no event loop to write
+        from (before the first loop starts, or after close), the record is
+        written on the caller's thread.
+
+        Args:
+            record (LogRecord): Log record
+        """
+        self._store_record(record)
+
+        if self._closed:
+            self._write_batch([record])
+            return
+
+        queue = self._queue
+        if len(queue) >= self.max_queue_size:
+            self._dropped += 1
+            if self.overflow_policy == BackgroundWriter.DROP_NEW:
+                return
+            try:
+                queue.popleft()
+            except IndexError:
+                pass
+        queue.append(record)
+
+        # The writer has been woken and has not started draining yet
+        if not self._wakeup_pending:
+            self._wake()
+
+    def _wake(self) -> None:
+        """Wake the writer task, starting it on the running loop if there is none"""
+        task = self._task
+        writer_alive = task is not None and not task.done()
+        if writer_alive and self._loop_thread == threading.get_ident():
+            self._wakeup_pending = True
+            self._wakeup.set()
+            return
+
+        if writer_alive:
+            # Logged from another thread: the loop's thread does the wake-up
+            self._wakeup_pending = True
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+                return
+            except RuntimeError:
+                self._wakeup_pending = False  # The loop is closed
+
+        else:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                self._start_writer(loop)
+                self._wakeup_pending = True
+                self._wakeup.set()
+                return
+
+        # No event loop to write from
+        self._drain()
+
+    def _start_writer(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the writer task on an event loop (also after a previous loop has ended)"""
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._wakeup_pending = False
+        # Task names need Python 3.8; the writer thread is named instead
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Writer task: hand queued records to the writer thread in batches"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        wakeup = self._wakeup
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            # Log calls from now on wake the writer again
+            self._wakeup_pending = False
+
+            while queue:
+                batch = self._take_batch()
+                await loop.run_in_executor(self._executor, self._write_batch, batch)
+
+            waiters, self._flush_waiters = self._flush_waiters, []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def _take_batch(self) -> List[LogRecord]:
+        """Take up to batch_size records off the queue, after a summary of any records dropped"""
+        queue = self._queue
+        batch = []
+        summary = self._dropped_summary()
+        if summary is not None:
+            batch.append(summary)
+        append = batch.append
+        try:
+            for _ in range(min(len(queue), self.batch_size)):
+                append(queue.popleft())
+        except IndexError:
+            pass  # Another thread dropped the oldest record meanwhile
+        return batch
+
+    def _dropped_summary(self) -> Optional[LogRecord]:
+        """
+        Build a WARNING record counting the records dropped since the last summary
+
+        Returns:
+            Optional[LogRecord]: Summary record, or None if nothing was dropped
+        """
+        dropped = self._dropped - self._dropped_reported
+        if dropped <= 0:
+            return None
+        self._dropped_reported += dropped
+        record = LogRecord(time.time(), self.WARNING, self.LEVEL_NAMES[self.WARNING],
+                           f"{dropped} log records dropped: async queue full "
+                           f"(max_queue_size={self.max_queue_size}, overflow_policy={self.overflow_policy})",
+                           self.name)
+        self._store_record(record)
+        return record
+
+    def _drain(self) -> None:
+        """Write everything queued on the caller's thread"""
+        while self._queue:
+            self._write_batch(self._take_batch())
+
+    def _write_batch(self, records: List[LogRecord]) -> None:
+        """
+        Write a batch through the wrapped logger (runs on the writer thread)
+
+        The wrapped logger applies its own level, filters and coalescing,
+        as a logger inside a MultiLogger does.
+
+        Args:
+            records (List[LogRecord]): Log records, oldest first
+        """
+        target = self.logger
+        try:
+            level = target.level
+            if target._filters:
+                records = [r for r in records if r.level >= level and target._passes_filters(r.level, r.message)]
+            else:
+                records = [r for r in records if r.level >= level]
+            if target._coalescer is None:
+                target._emit_batch(records)
+            else:
+                for record in records:
+                    target._coalescer.submit(record)
+        except Exception:
+            print(f"Error in async logger: {traceback.format_exc()}", file=sys.stderr)
+
+    async def flush(self) -> None:
+        """Wait until every queued record is written, then flush the wrapped logger"""
+        if self._closed:
+            return
+        self.flush_coalesced()
+        loop = asyncio.get_running_loop()
+        task = self._task
+        if task is None or task.done():
+            self._start_writer(loop)
+        waiter = loop.create_future()
+        self._flush_waiters.append(waiter)
+        self._wakeup.set()
+        await waiter
+        await loop.run_in_executor(self._executor, self._flush_target)
+
+    def _flush_target(self) -> None:
+        """Flush the wrapped logger (runs on the writer thread)"""
+        if hasattr(self.logger, 'flush') and callable(self.logger.flush):
+            self.logger.flush()
+
+    async def aclose(self) -> None:
+        """Write every queued record, stop the writer task and close the wrapped logger"""
+        if self._closed:
+            return
+        await self.flush()
+        # Later log calls are written on the caller's thread
+        self._closed = True
+        task = self._task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._close_target)
+        self._executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """
+        Write every queued record on the caller's thread and close the wrapped logger
+
+        For use outside the event loop, e.g. after asyncio.run() returned;
+        coroutines should await aclose() instead.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.flush_coalesced()
+        self._drain()
+        self._executor.shutdown(wait=True)
+        self._close_target()
+
+    def _close_target(self) -> None:
+        """Close the wrapped logger"""
+        if hasattr(self.logger, 'close') and callable(self.logger.close):
+            self.logger.close()
+
+    async def __aenter__(self) -> "AsyncLogger":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback) -> None:
+        await self.aclose()
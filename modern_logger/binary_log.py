@@ -0,0 +1,571 @@
+"""
+Binary log format for Modern Logger.
+
+Text log lines have to be parsed again for every export or analysis. This
+module stores records in a compact append-only binary format instead:
+- BinaryRecordEncoder, which turns LogRecords into length-prefixed entries
+- BinaryFileLogger, a FileLogger (rotation, async mode and all) that
+  writes the binary format
+- BinaryLogReader, a memory-mapped reader that iterates, filters, counts
+  and exports records to the text formats of Logger.export_log()
+
+File layout: an 8-byte header (b"MLOG", version, 3 reserved bytes)
+followed by entries. Each entry is a varint body length and a body that
+starts with a tag byte:
+- SYNC (2): varint absolute time in microseconds since the epoch. Starts
+  every writing session; time deltas restart from it and name ids are
+  forgotten
+- NAME (1): varint id and the UTF-8 logger name it stands for
+- RECORD (0): zigzag varint time delta in microseconds from the previous
+  record (or SYNC), level byte, varint logger-name id, UTF-8 message
+- BLOCK (3): summary of the RECORD entries that follow it: varint byte
+  span, varint record count, min and max level bytes, zigzag varint
+  delta of the earliest record time from the previous record, varint
+  latest minus earliest time, varint last minus earliest time. Readers
+  skip or count whole blocks that a filter excludes or fully includes.
+  Each write of at least BLOCK_MIN_RECORDS records is one block; names
+  it introduces are defined just before it
+"""
+
+import gzip
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .logger import Logger, LogRecord, FileLogger
+from .writers import BackgroundWriter
+
+MAGIC = b"MLOG"
+VERSION = 1
+HEADER = MAGIC + bytes((VERSION, 0, 0, 0))
+
+# Entry tags
+RECORD = 0
+NAME = 1
+SYNC = 2
+BLOCK = 3
+
+# Writes with fewer records are not worth a block header
+BLOCK_MIN_RECORDS = 16
+
+# Single-byte varints, the common case for lengths, deltas under 64 us and name ids
+_SMALL_VARINTS = [bytes((i,)) for i in range(128)]
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Encode a non-negative integer as a little-endian base-128 varint
+
+    Args:
+        value (int): Value to encode
+
+    Returns:
+        bytes: Encoded value
+    """
+    if value < 128:
+        return _SMALL_VARINTS[value]
+    out = bytearray()
+    while value >= 128:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    """Map a signed integer to a non-negative one (0, -1, 1, -2 -> 0, 1, 2, 3)"""
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def decode_varint(data: Any, pos: int) -> tuple:
+    """
+    Decode a varint
+
+    Args:
+        data (Any): Buffer (bytes, mmap, ...)
+        pos (int): Offset of the varint
+
+    Returns:
+        tuple: (value, offset after the varint)
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _estimated_size(record: LogRecord) -> int:
+    """Estimate the bytes an encoded record takes; ASCII messages encode to their length"""
+    return len(record.message) + 8
+
+
+class BinaryRecordEncoder:
+    """Stateful encoder of LogRecords into binary log entries"""
+
+    def __init__(self):
+        self._names: Dict[str, int] = {}
+        self._last_us = 0
+
+    def sync(self, now: Optional[float] = None) -> bytes:
+        """
+        Start a new session: reset time deltas and name ids
+
+        Args:
+            now (Optional[float], optional): Session start in epoch seconds. Defaults to None (now).
+
+        Returns:
+            bytes: SYNC entry
+        """
+        self._names = {}
+        self._last_us = round((now if now is not None else time.time()) * 1e6)
+        body = bytes((SYNC,)) + encode_varint(self._last_us)
+        return encode_varint(len(body)) + body
+
+    def encode(self, records: Iterable[LogRecord]) -> bytes:
+        """
+        Encode records, defining logger names on first use
+
+        Args:
+            records (Iterable[LogRecord]): Records, in the order they are written
+
+        Returns:
+            bytes: Encoded entries
+        """
+        records = records if isinstance(records, list) else list(records)
+        if not records:
+            return b""
+        names = self._names
+        varint = encode_varint
+        parts: List[bytes] = []
+        append = parts.append
+
+        # Names go before the block so a reader that skips the block still learns them
+        for record in records:
+            name = record.logger_name
+            if name not in names:
+                name_id = names[name] = len(names)
+                body = bytes((NAME,)) + varint(name_id) + name.encode('utf-8', errors='replace')
+                append(varint(len(body)))
+                append(body)
+
+        previous = last = self._last_us
+        min_us = max_us = round(records[0].created * 1e6)
+        min_level = max_level = records[0].level & 0xFF
+        entries: List[bytes] = []
+        add = entries.append
+        for record in records:
+            us = round(record.created * 1e6)
+            delta = us - last
+            last = us
+            if us < min_us:
+                min_us = us
+            elif us > max_us:
+                max_us = us
+            level = record.level & 0xFF
+            if level < min_level:
+                min_level = level
+            elif level > max_level:
+                max_level = level
+            head = (b"\x00" + varint(delta << 1 if delta >= 0 else (-delta << 1) - 1)
+                    + bytes((level,)) + varint(names[record.logger_name]))
+            message = record.message.encode('utf-8', errors='replace')
+            add(varint(len(head) + len(message)))
+            add(head)
+            add(message)
+        self._last_us = last
+
+        if len(records) >= BLOCK_MIN_RECORDS:
+            span = sum(len(entry) for entry in entries)
+            body = (bytes((BLOCK,)) + varint(span) + varint(len(records)) + bytes((min_level, max_level))
+                    + varint(_zigzag(min_us - previous)) + varint(max_us - min_us) + varint(last - min_us))
+            append(varint(len(body)))
+            append(body)
+        parts.extend(entries)
+        return b"".join(parts)
+
+
+class BinaryFileLogger(FileLogger):
+    """File logger that appends records in the compact binary format"""
+
+    def __init__(self,
+                 name: str = "BinaryFileLogger",
+                 level: int = Logger.INFO,
+                 filename: str = "log.mlog",
+                 mode: str = "a",
+                 max_size: int = 0,
+                 backup_count: int = 0,
+                 async_mode: bool = False,
+                 queue_size: int = 10000,
+                 batch_size: int = 512,
+                 flush_interval: float = 0.5,
+                 overflow_policy: str = BackgroundWriter.BLOCK,
+                 when: Optional[str] = None,
+                 compress: bool = False):
+        """
+        Initialize a binary file logger
+
+        Args:
+            name (str, optional): Logger name. Defaults to "BinaryFileLogger".
+            level (int, optional): Minimum log level. Defaults to Logger.INFO.
+            filename (str, optional): Log file path. Defaults to "log.mlog".
+            mode (str, optional): File open mode, "a" (append) or "w". Defaults to "a".
+            max_size (int, optional): Maximum file size in bytes before rotation. Defaults to 0 (no rotation).
+            backup_count (int, optional): Number of backup files to keep. Defaults to 0.
+            async_mode (bool, optional): Write from a background thread. Defaults to False.
+            queue_size (int, optional): Maximum queued records in async mode. Defaults to 10000.
+            batch_size (int, optional): Queued records that trigger a write in async mode. Defaults to 512.
+            flush_interval (float, optional): Maximum seconds a record waits in async mode. Defaults to 0.5.
+            overflow_policy (str, optional): 'block', 'drop_oldest' or 'drop_new' when the async queue is full.
+                Defaults to 'block'.
+            when (Optional[str], optional): Time-based rotation, 'hourly' or 'daily'. Defaults to None.
+            compress (bool, optional): Gzip rotated backups. Defaults to False.
+        """
+        # The encoder must exist before FileLogger opens the file
+        self._encoder = BinaryRecordEncoder()
+        super().__init__(name, level, filename, mode, "utf-8", max_size, backup_count, async_mode,
+                         queue_size, batch_size, flush_interval, overflow_policy, when, compress)
+
+    def _open_stream(self) -> Any:
+        mode = self.mode if 'b' in self.mode else self.mode + 'b'
+        return open(self.filename, mode)
+
+    def _start_file(self) -> None:
+        """Write the header to a new file, then a SYNC entry that starts this session"""
+        data = b""
+        if not self._bytes_written:
+            data = HEADER
+        else:
+            with open(self.filename, 'rb') as f:
+                if f.read(len(HEADER))[:len(MAGIC)] != MAGIC:
+                    raise ValueError(f"{self.filename} is not a binary log file")
+        data += self._encoder.sync()
+        self._file.write(data)
+        self._bytes_written += len(data)
+
+    def _emit(self, record: LogRecord) -> None:
+        """
+        Store a record and write it; records are encoded in write order by the writer
+
+        Args:
+            record (LogRecord): Log record
+        """
+        self._store_record(record)
+        self._write(record)
+
+    def _emit_batch(self, records: List[LogRecord]) -> None:
+        """
+        Store a batch of records and write them with a single write call
+
+        Args:
+            records (List[LogRecord]): Log records that passed level filtering, oldest first
+        """
+        for record in records:
+            self._store_record(record)
+        if self._writer is not None and not self._writer.closed:
+            for record in records:
+                self._writer.put(record)
+        else:
+            self._write_lines(records)
+
+    def _write_lines(self, records: List[LogRecord]) -> None:
+        """
+        Encode and write a batch of records
+
+        With max_size, a batch that would fill the file is split and the
+        rest is encoded for the next file.
+
+        Args:
+            records (List[LogRecord]): Log records
+        """
+        with self._sink_lock:
+            if not self._file:
+                self._open_file()
+
+            if self._file:
+                try:
+                    # A new period starts a new file before anything is written to it
+                    if self._next_rollover is not None and time.time() >= self._next_rollover:
+                        self._rotate_if_needed()
+                        if not self._file:
+                            return
+
+                    start = 0
+                    while start < len(records):
+                        # Split where the file would reach max_size, estimating from message lengths
+                        end, _ = self._chunk_end(records, start, _estimated_size)
+                        # Encoded after any rotation, so deltas and names match the file they land in
+                        data = self._encoder.encode(records[start:end])
+                        self._file.write(data)
+                        self._file.flush()
+                        self._bytes_written += len(data)
+
+                        self._rotate_if_needed()
+                        if not self._file:
+                            return
+                        start = end
+                except Exception as e:
+                    print(f"Error writing to log file: {e}", file=sys.stderr)
+
+
+class BinaryLogReader:
+    """Memory-mapped reader of binary log files"""
+
+    def __init__(self, path: str):
+        """
+        Open a binary log file
+
+        Gzipped files (compressed rotation backups) are decompressed into memory.
+
+        Args:
+            path (str): Binary log file path
+
+        Raises:
+            ValueError: If the file is not a binary log file
+        """
+        self.path = path
+        self._file = None
+        self._mmap: Any = None
+        if path.endswith(".gz"):
+            with gzip.open(path, 'rb') as f:
+                self._data = f.read()
+        else:
+            self._file = open(path, 'rb')
+            if os.fstat(self._file.fileno()).st_size:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._data = self._mmap if self._mmap is not None else b""
+
+        if self._data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a binary log file")
+        if self._data[len(MAGIC)] > VERSION:
+            self.close()
+            raise ValueError(f"{path} uses binary log version {self._data[len(MAGIC)]}, "
+                             f"this reader supports up to {VERSION}")
+
+    @property
+    def size(self) -> int:
+        """Size of the mapped data in bytes"""
+        return len(self._data)
+
+    def close(self) -> None:
+        """Unmap and close the file"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._data = b""
+
+    def __enter__(self) -> "BinaryLogReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return self.records()
+
+    def records(self,
+                level_filter: Optional[int] = None,
+                start_time: Optional[Union[datetime, float]] = None,
+                end_time: Optional[Union[datetime, float]] = None,
+                logger_name: Optional[str] = None,
+                limit: Optional[int] = None) -> Iterator[LogRecord]:
+        """
+        Iterate over records in file order with optional filtering
+
+        Messages of records that do not match are never decoded. Like
+        Logger.export_log(), limit keeps the most recent matching records.
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+            limit (Optional[int]): Maximum number of records to return (most recent)
+
+        Returns:
+            Iterator[LogRecord]: Matching records
+        """
+        data = self._data
+        level_names = Logger.LEVEL_NAMES
+        matches: Iterable[tuple] = self._scan(level_filter, start_time, end_time, logger_name)
+        if limit is not None:
+            if limit <= 0:
+                return
+            # Only the positions of the last matches are kept; their messages are decoded below
+            matches = deque(matches, maxlen=limit)
+        for us, level, name, start, end in matches:
+            yield LogRecord(us / 1e6, level, level_names.get(level, "UNKNOWN"),
+                            str(data[start:end], 'utf-8', 'replace'), name)
+
+    def count(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[Union[datetime, float]] = None,
+              end_time: Optional[Union[datetime, float]] = None,
+              logger_name: Optional[str] = None) -> int:
+        """
+        Count matching records without decoding any message
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            int: Number of matching records
+        """
+        total = 0
+        for match in self._scan(level_filter, start_time, end_time, logger_name, count_blocks=True):
+            # Whole blocks inside the filter come back as (None, record count)
+            total += 1 if match[0] is not None else match[1]
+        return total
+
+    def _scan(self, level_filter, start_time, end_time, logger_name, count_blocks=False) -> Iterator[tuple]:
+        """
+        Walk the entries and yield (time in us, level, logger name, message start, message end) of matches
+
+        Blocks that the level or time filter excludes are skipped without
+        reading their records. With count_blocks, blocks the filters fully
+        include yield (None, record count) instead of one tuple per record.
+        A truncated final entry (a writer still appending, or a crash) ends
+        the scan.
+        """
+        if isinstance(start_time, datetime):
+            start_time = start_time.timestamp()
+        if isinstance(end_time, datetime):
+            end_time = end_time.timestamp()
+        min_level = level_filter if level_filter is not None else -1
+        start_us = round(start_time * 1e6) if start_time is not None else None
+        end_us = round(end_time * 1e6) if end_time is not None else None
+        check_time = start_us is not None or end_us is not None
+
+        data = self._data
+        size = len(data)
+        pos = len(HEADER)
+        names: Dict[int, str] = {}
+        wanted = None  # Name id matching logger_name in the current session; -1 when not defined yet
+        if logger_name is not None:
+            wanted = -1
+        last = 0
+        while pos < size:
+            # Entry length, inlined for the common single-byte case
+            byte = data[pos]
+            if byte < 0x80:
+                length = byte
+                pos += 1
+            else:
+                length, pos = decode_varint(data, pos)
+            end = pos + length
+            if end > size or not length:
+                break
+            tag = data[pos]
+
+            if tag == RECORD:
+                byte = data[pos + 1]
+                if byte < 0x80:
+                    zigzag = byte
+                    p = pos + 2
+                else:
+                    zigzag, p = decode_varint(data, pos + 1)
+                last += -((zigzag + 1) >> 1) if zigzag & 1 else zigzag >> 1
+                level = data[p]
+                if level >= min_level:
+                    byte = data[p + 1]
+                    if byte < 0x80:
+                        name_id = byte
+                        p += 2
+                    else:
+                        name_id, p = decode_varint(data, p + 1)
+                    if ((wanted is None or name_id == wanted)
+                            and (not check_time
+                                 or ((start_us is None or last >= start_us) and (end_us is None or last < end_us)))):
+                        yield last, level, names.get(name_id, ""), p, end
+            elif tag == BLOCK:
+                span, p = decode_varint(data, pos + 1)
+                block_count, p = decode_varint(data, p)
+                block_min_level = data[p]
+                block_max_level = data[p + 1]
+                zigzag, p = decode_varint(data, p + 2)
+                block_min = last + (-((zigzag + 1) >> 1) if zigzag & 1 else zigzag >> 1)
+                width, p = decode_varint(data, p)
+                tail, p = decode_varint(data, p)
+                block_max = block_min + width
+                if (block_max_level < min_level
+                        or (start_us is not None and block_max < start_us)
+                        or (end_us is not None and block_min >= end_us)):
+                    skip = True
+                elif (count_blocks and wanted is None and block_min_level >= min_level
+                        and (start_us is None or block_min >= start_us)
+                        and (end_us is None or block_max < end_us)):
+                    yield None, block_count, None, 0, 0
+                    skip = True
+                else:
+                    skip = False
+                if skip:
+                    last = block_min + tail
+                    end += span
+            elif tag == NAME:
+                name_id, p = decode_varint(data, pos + 1)
+                name = str(data[p:end], 'utf-8', 'replace')
+                names[name_id] = name
+                if logger_name is not None and name == logger_name:
+                    wanted = name_id
+            elif tag == SYNC:
+                last, _ = decode_varint(data, pos + 1)
+                names = {}
+                if logger_name is not None:
+                    wanted = -1
+            # Unknown tags are skipped, so later versions can add entry types
+            pos = end
+
+    def export(self,
+               filepath: str,
+               format_type: str = "log",
+               level_filter: Optional[int] = None,
+               limit: Optional[int] = None,
+               start_time: Optional[Union[datetime, float]] = None,
+               end_time: Optional[Union[datetime, float]] = None,
+               logger_name: Optional[str] = None) -> bool:
+        """
+        Convert records to one of the Logger.export_log() formats
+
+        Records are streamed from the mapped file, so memory does not grow
+        with the file size.
+
+        Args:
+            filepath (str): Output file path
+            format_type (str): Export format ('log', 'csv', 'xml', 'json', 'jsonl', 'binary')
+            level_filter (Optional[int]): Minimum level to include
+            limit (Optional[int]): Maximum number of records to export (most recent)
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            bool: True if export successful, False otherwise
+        """
+        format_type = format_type.lower()
+        if format_type not in Logger.EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format_type}. Supported formats: {', '.join(Logger.EXPORT_FORMATS)}")
+
+        total = self.count(level_filter, start_time, end_time, logger_name)
+        if limit is not None:
+            total = min(total, max(limit, 0))
+        if not total:
+            return False
+        records = self.records(level_filter, start_time, end_time, logger_name, limit)
+        # The exporters only need a logger for formatting settings and the JSON metadata name
+        exporter = Logger(name=os.path.basename(self.path))
+        return exporter._write_export(filepath, format_type, records, total)
@@ -0,0 +1,133 @@
+"""
+Duplicate-message coalescing for Modern Logger.
+
+Retry loops often log the same message thousands of times per second. This
+module collapses such runs before they reach any sink:
+- MessageCoalescer, which emits the first of a run of identical consecutive
+  (level, message) records and replaces the rest with one "repeated N times"
+  summary per time window
+"""
+
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import Any, Callable, Optional
+
+
+class MessageCoalescer:
+    """Collapses runs of identical consecutive records into summary records"""
+
+    # Message of the summary record that stands in for suppressed repeats
+    SUMMARY_FORMAT = "{message} (repeated {count} more times)"
+
+    def __init__(self, emit: Callable[[Any], None], window: float = 1.0):
+        """
+        Initialize a coalescer
+
+        Args:
+            emit (Callable[[Any], None]): Called with every LogRecord that is let through and every summary record
+            window (float, optional): Seconds of repeats covered by one summary record. Defaults to 1.0.
+        """
+        if window <= 0:
+            raise ValueError(f"Coalescing window must be positive, got {window}")
+        self.window = window
+        if hasattr(emit, '__self__') and hasattr(emit, '__func__'):
+            # A logger's own method is held weakly so the logger does not reference itself
+            # and is freed (and its __del__ run) as soon as it is dropped
+            emit_ref = weakref.WeakMethod(emit)
+
+            def emit(record: Any) -> None:
+                target = emit_ref()
+                if target is not None:
+                    target(record)
+        self._emit = emit
+        # Reentrant so a sink that logs through the same logger cannot deadlock
+        self._lock = threading.RLock()
+        self._last = None  # Last record let through
+        self._window_start = 0.0
+        self._repeats = 0
+        self._last_repeat = 0.0
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of repeats suppressed and not yet summarized"""
+        return self._repeats
+
+    def submit(self, record: Any) -> None:
+        """
+        Emit a record, or count it as a repeat of the previous one
+
+        The first record of a run is emitted at once. Repeats within the
+        window are counted and summarized when a different record arrives,
+        when the window ends, or on flush().
+
+        Args:
+            record (LogRecord): Log record that passed level filtering
+        """
+        with self._lock:
+            last = self._last
+            if last is not None and record.message == last.message and record.level == last.level:
+                if record.created - self._window_start < self.window:
+                    self._count_repeat(record)
+                    return
+                if self._repeats:
+                    # The window ended before its timer fired; this repeat opens the next one
+                    self._emit_summary()
+                    self._window_start = record.created
+                    self._count_repeat(record)
+                    return
+                # Repeated only after a quiet window, so it starts a new run
+
+            # A different record ends the run
+            self._emit_summary()
+            self._last = record
+            self._window_start = record.created
+            self._emit(record)
+
+    def flush(self) -> None:
+        """Emit the summary of any pending repeats now"""
+        with self._lock:
+            self._emit_summary()
+
+    def _count_repeat(self, record: Any) -> None:
+        """Count a suppressed repeat and make sure its window gets summarized (lock held)"""
+        self._repeats += 1
+        self._last_repeat = record.created
+        if self._timer is None:
+            self._start_timer(self._window_start + self.window - record.created)
+
+    def _emit_summary(self) -> None:
+        """Emit a summary of the pending repeats, if any (lock held)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._repeats:
+            return
+        last = self._last
+        count = self._repeats
+        self._repeats = 0
+        self._emit(type(last)(self._last_repeat, last.level, last.level_name,
+                              self.SUMMARY_FORMAT.format(message=last.message, count=count),
+                              last.logger_name))
+
+    def _start_timer(self, delay: float) -> None:
+        """Summarize the current window when it ends, even if nothing else is logged (lock held)"""
+        timer = threading.Timer(max(0.0, delay), self._on_window_end)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _on_window_end(self) -> None:
+        """Timer callback: summarize the window that just ended"""
+        try:
+            with self._lock:
+                if self._timer is not threading.current_thread():
+                    return  # Cancelled after it started waiting for the lock
+                self._emit_summary()
+                # Further repeats are counted in a new window starting now
+                self._window_start = time.time()
+        except Exception:
+            print(f"Error in message coalescer: {traceback.format_exc()}", file=sys.stderr)
@@ -0,0 +1,238 @@
+"""
+Multi-process log collection for Modern Logger.
+
+Several processes appending to and rotating the same file race with each
+other. This module routes every record through a single writer process
+instead:
+- LogCollector, which owns a FileLogger in a dedicated process and writes
+  records it receives over a bounded multiprocessing queue in batches
+- CollectorLogger, a lightweight logger used by worker processes that
+  pushes structured records onto that queue in batches
+"""
+
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import sys
+import traceback
+from typing import Any, Dict, List, Optional
+
+from .logger import Logger, LogRecord, FileLogger
+from .writers import BackgroundWriter
+
+
+def _collector_main(record_queue: Any, file_logger_kwargs: Dict[str, Any], batch_size: int) -> None:
+    """
+    Writer process main loop
+
+    Args:
+        record_queue (Any): Queue of lists of (created, level, level_name, message, logger_name) tuples, None to stop
+        file_logger_kwargs (Dict[str, Any]): Arguments for the FileLogger owned by this process
+        batch_size (int): Maximum queued batches formatted and written per write call
+    """
+    file_logger = FileLogger(**file_logger_kwargs)
+    running = True
+    try:
+        while running:
+            # Block for the first batch, then take whatever else is already queued
+            batch = [record_queue.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(record_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            for items in batch:
+                if items is None:
+                    running = False
+                    continue
+                for created, level, level_name, message, logger_name in items:
+                    if level >= file_logger.level:
+                        lines.append(file_logger._format_message(level, message, created))
+
+            if lines:
+                file_logger._write_lines(lines)
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        print(f"Error in log collector: {traceback.format_exc()}", file=sys.stderr)
+    finally:
+        file_logger.close()
+
+
+class CollectorLogger(Logger):
+    """Logger that sends records to a LogCollector's writer process"""
+
+    def __init__(self,
+                 name: str = "CollectorLogger",
+                 level: int = Logger.INFO,
+                 record_queue: Any = None,
+                 store_records: bool = False,
+                 batch_size: int = 256,
+                 flush_interval: float = 0.05):
+        """
+        Initialize a collector logger
+
+        Args:
+            name (str, optional): Logger name. Defaults to "CollectorLogger".
+            level (int, optional): Minimum log level. Defaults to Logger.INFO.
+            record_queue (Any, optional): Queue of the LogCollector to send records to. Defaults to None.
+            store_records (bool, optional): Also keep records in this process for export. Defaults to False.
+            batch_size (int, optional): Records sent to the collector per queue item. Defaults to 256.
+            flush_interval (float, optional): Maximum seconds a record waits before being sent. Defaults to 0.05.
+        """
+        super().__init__(name, level)
+        self.record_queue = record_queue
+        self.store_records = store_records
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._sender: Optional[BackgroundWriter] = None
+        self._sender_pid: Optional[int] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The sender thread belongs to the process that created it
+        state = super().__getstate__()
+        state['_sender'] = None
+        state['_sender_pid'] = None
+        return state
+
+    def _get_sender(self) -> BackgroundWriter:
+        """Get the batching sender of the current process, creating it on first use"""
+        pid = os.getpid()
+        if self._sender is None or self._sender_pid != pid:
+            self._sender = BackgroundWriter(
+                self._send_batch,
+                max_queue_size=self.batch_size * 64,
+                batch_size=self.batch_size,
+                flush_interval=self.flush_interval,
+                name=f"{self.name}-sender"
+            )
+            self._sender_pid = pid
+            # Worker processes exit without running atexit hooks, so drain on multiprocessing exit too.
+            # The priority must beat the queue's own close finalizer (10) or drained batches are lost.
+            multiprocessing.util.Finalize(self._sender, self._sender.close, exitpriority=20)
+        return self._sender
+
+    def _send_batch(self, items: List[tuple]) -> None:
+        """Put a batch of record tuples on the collector queue (runs on the sender thread)"""
+        try:
+            self.record_queue.put(items)
+        except Exception as e:
+            print(f"Error sending records to log collector: {e}", file=sys.stderr)
+
+    def _emit(self, record: LogRecord) -> None:
+        """
+        Queue a record for the writer process
+
+        Records are sent in batches from a background thread. Once the
+        collector queue is full, sending blocks and the local queue fills up,
+        which applies backpressure to producers that outpace the writer.
+
+        Args:
+            record (LogRecord): Log record
+        """
+        if self.store_records:
+            self._store_record(record)
+
+        if self.record_queue is not None:
+            self._get_sender().put((record.created, record.level, record.level_name,
+                                    record.message, record.logger_name))
+
+    def flush(self) -> None:
+        """Send all pending records to the collector"""
+        self.flush_coalesced()
+        if self._sender is not None and self._sender_pid == os.getpid():
+            self._sender.flush()
+
+    def close(self) -> None:
+        """Send all pending records and stop the sender thread"""
+        self.flush_coalesced()
+        if self._sender is not None and self._sender_pid == os.getpid():
+            self._sender.close()
+        self._sender = None
+
+    def __del__(self) -> None:
+        """Send pending records when the object is deleted"""
+        if getattr(self, '_sender', None) is not None:
+            self.close()
+
+
+class LogCollector:
+    """Single writer process that owns a FileLogger on behalf of many producer processes"""
+
+    def __init__(self,
+                 filename: str = "log.txt",
+                 queue_size: int = 1000,
+                 batch_size: int = 16,
+                 context: Optional[Any] = None,
+                 **file_logger_kwargs: Any):
+        """
+        Initialize a log collector
+
+        Args:
+            filename (str, optional): Log file path. Defaults to "log.txt".
+            queue_size (int, optional): Maximum queued record batches before producers block. Defaults to 1000.
+            batch_size (int, optional): Maximum record batches written per write call. Defaults to 16.
+            context (Optional[Any], optional): multiprocessing context to use. Defaults to None (default context).
+            **file_logger_kwargs: Further FileLogger arguments (level, max_size, backup_count, when, compress, ...)
+        """
+        self._context = context or multiprocessing.get_context()
+        self.queue = self._context.Queue(maxsize=queue_size)
+        self.batch_size = max(1, batch_size)
+        self._file_logger_kwargs = dict(file_logger_kwargs, filename=filename)
+        self._process = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer process is alive"""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Start the writer process"""
+        if self.running:
+            return
+        self._process = self._context.Process(
+            target=_collector_main,
+            args=(self.queue, self._file_logger_kwargs, self.batch_size),
+            name="ModernLoggerCollector",
+            daemon=True
+        )
+        self._process.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Write everything queued so far and stop the writer process
+
+        Args:
+            timeout (Optional[float], optional): Maximum seconds to wait for the process. Defaults to None.
+        """
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            self.queue.put(None)
+            self._process.join(timeout)
+        self._process = None
+
+    def get_logger(self, name: str = "CollectorLogger", level: int = Logger.INFO) -> CollectorLogger:
+        """
+        Create a logger that sends records to this collector
+
+        The logger can be passed to worker processes as a Process argument.
+
+        Args:
+            name (str, optional): Logger name. Defaults to "CollectorLogger".
+            level (int, optional): Minimum log level. Defaults to Logger.INFO.
+
+        Returns:
+            CollectorLogger: Logger bound to this collector's queue
+        """
+        return CollectorLogger(name=name, level=level, record_queue=self.queue)
+
+    def __enter__(self) -> "LogCollector":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.stop()
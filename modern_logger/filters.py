@@ -0,0 +1,206 @@
+"""
+Flood filters for Modern Logger.
+
+Filters are attached to a logger with Logger.add_filter() and run after the
+level check but before the message is formatted or a record is created, so
+a suppressed call costs well under a microsecond:
+- LogFilter, the base class that counts suppressed calls
+- RateLimitFilter, a token bucket per level
+- SamplingFilter, which keeps a random fraction of low-level messages
+- KeyRateLimitFilter, a token bucket per message template
+"""
+
+import random
+import time
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .logger import Logger
+
+# Marks a level whose bucket has not been looked up yet
+_UNSEEN = object()
+
+
+class LogFilter:
+    """Base class of filters evaluated before a record is created"""
+
+    def __init__(self):
+        self.suppressed_count = 0
+        self.suppressed_by_level: Dict[int, int] = {}
+
+    def allow(self, level: int, message: Any) -> bool:
+        """
+        Decide whether a call is logged
+
+        Args:
+            level (int): Log level, already above the logger's minimum level
+            message (Any): Message template as passed by the caller (format string or callable),
+                also for records received through MultiLogger fan-out; the formatted message
+                for records that arrive already formatted (coalescing summaries, AsyncLogger batches)
+
+        Returns:
+            bool: True to log the call, False to suppress it
+        """
+        return True
+
+    def reset_counters(self) -> None:
+        """Reset the suppressed-call counters"""
+        self.suppressed_count = 0
+        self.suppressed_by_level = {}
+
+    def _suppress(self, level: int) -> bool:
+        """Count a suppressed call and return False"""
+        self.suppressed_count += 1
+        self.suppressed_by_level[level] = self.suppressed_by_level.get(level, 0) + 1
+        return False
+
+
+def _per_level(value: Union[float, Dict[int, float]], levels: Optional[Iterable[int]]) -> Optional[Dict[int, float]]:
+    """Normalize a single value or a level -> value mapping to a mapping, None meaning every level"""
+    if isinstance(value, dict):
+        return dict(value)
+    if levels is None:
+        return None
+    return {level: value for level in levels}
+
+
+class RateLimitFilter(LogFilter):
+    """Token-bucket rate limit with a separate bucket per level"""
+
+    def __init__(self,
+                 rate: Union[float, Dict[int, float]],
+                 burst: Optional[float] = None,
+                 levels: Optional[Iterable[int]] = None):
+        """
+        Initialize a rate limit
+
+        Args:
+            rate (Union[float, Dict[int, float]]): Messages per second, or a level -> rate mapping
+                that limits only the listed levels
+            burst (Optional[float], optional): Messages allowed at once after a quiet period. Defaults to None
+                (one second's worth of the rate, at least 1).
+            levels (Optional[Iterable[int]], optional): Levels limited by a single rate. Defaults to None (all).
+        """
+        super().__init__()
+        rates = _per_level(rate, levels)
+        if any(r <= 0 for r in (rates.values() if rates is not None else (rate,))):
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self._rates = rates
+        self._rate = None if rates is not None else rate
+        self._burst = burst
+        # level -> [tokens, last refill, rate, burst], or None for levels that are not limited
+        self._buckets: Dict[int, Any] = {}
+
+    def _new_bucket(self, level: int) -> Optional[list]:
+        """Create the bucket of a level on first use"""
+        rate = self._rate if self._rates is None else self._rates.get(level)
+        if rate is None:
+            return None
+        burst = max(1.0, self._burst if self._burst is not None else rate)
+        return [burst, time.monotonic(), rate, burst]
+
+    def allow(self, level: int, message: Any) -> bool:
+        bucket = self._buckets.get(level, _UNSEEN)
+        if bucket is _UNSEEN:
+            bucket = self._buckets[level] = self._new_bucket(level)
+        if bucket is None:
+            return True
+
+        now = time.monotonic()
+        tokens = bucket[0] + (now - bucket[1]) * bucket[2]
+        if tokens > bucket[3]:
+            tokens = bucket[3]
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return True
+        bucket[0] = tokens
+        return self._suppress(level)
+
+
+class SamplingFilter(LogFilter):
+    """Keeps a random fraction of messages at the sampled levels"""
+
+    def __init__(self,
+                 rate: Union[float, Dict[int, float]] = 0.1,
+                 levels: Iterable[int] = (Logger.DEBUG, Logger.INFO)):
+        """
+        Initialize a sampling filter
+
+        Args:
+            rate (Union[float, Dict[int, float]], optional): Fraction of messages kept (0.0 - 1.0),
+                or a level -> fraction mapping. Defaults to 0.1.
+            levels (Iterable[int], optional): Levels sampled by a single rate. Defaults to (DEBUG, INFO).
+        """
+        super().__init__()
+        rates = _per_level(rate, levels)
+        if any(not 0.0 <= r <= 1.0 for r in rates.values()):
+            raise ValueError(f"Sampling rate must be between 0 and 1, got {rate}")
+        self._rates = rates
+        self._random = random.random
+
+    def allow(self, level: int, message: Any) -> bool:
+        rate = self._rates.get(level)
+        if rate is None or self._random() < rate:
+            return True
+        return self._suppress(level)
+
+
+class KeyRateLimitFilter(LogFilter):
+    """
+    Token-bucket rate limit with a separate bucket per message template
+
+    Calls are keyed by the unformatted template, before the arguments are
+    applied, so logger.error("timeout on %s", host) shares one budget
+    across hosts and a noisy template cannot crowd out the others. This
+    holds for children of a MultiLogger too, which are handed the
+    caller's template. Callables are keyed by their code, so the same
+    lambda at one call site shares a budget.
+    """
+
+    def __init__(self,
+                 rate: float,
+                 burst: Optional[float] = None,
+                 levels: Optional[Iterable[int]] = None,
+                 max_keys: int = 10000):
+        """
+        Initialize a per-template rate limit
+
+        Args:
+            rate (float): Messages per second allowed for each template
+            burst (Optional[float], optional): Messages of one template allowed at once. Defaults to None
+                (one second's worth of the rate, at least 1).
+            levels (Optional[Iterable[int]], optional): Levels limited. Defaults to None (all).
+            max_keys (int, optional): Templates tracked before the buckets are reset. Defaults to 10000.
+        """
+        super().__init__()
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.levels = frozenset(levels) if levels is not None else None
+        self.max_keys = max(1, max_keys)
+        self._buckets: Dict[Any, list] = {}  # key -> [tokens, last refill]
+
+    def allow(self, level: int, message: Any) -> bool:
+        if self.levels is not None and level not in self.levels:
+            return True
+        key = message if message.__class__ is str else getattr(message, '__code__', message)
+
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                # Bound memory when templates are unbounded (e.g. pre-formatted messages)
+                self._buckets.clear()
+            self._buckets[key] = [self.burst - 1.0, now]
+            return True
+
+        tokens = bucket[0] + (now - bucket[1]) * self.rate
+        if tokens > self.burst:
+            tokens = self.burst
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return True
+        bucket[0] = tokens
+        return self._suppress(level)
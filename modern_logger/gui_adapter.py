@@ -4,7 +4,7 @@ GUI Logger Adapter for Modern Logger.
 This module provides an adapter to connect the GUI logger with the base logger system.
 """
 
-from .logger import Logger
+from .logger import Logger, LogRecord
 from .gui_logger import ModernLogger
 from typing import Optional, Dict, Any
 import traceback
@@ -24,7 +24,7 @@ class GUILogger(Logger):
         Args:
             name (str, optional): Logger name. Defaults to "GUILogger".
             level (int, optional): Minimum log level. Defaults to Logger.INFO.
-            gui_logger (Optional[ModernLogger], optional): GUI logger widget. Defaults to None.
+            gui_logger (Optional[ModernLogger], optional): GUI logger widget (ModernLogger or ModernLogView). Defaults to None.
         """
         super().__init__(name, level)
         self.gui_logger = gui_logger
@@ -43,17 +43,20 @@ class GUILogger(Logger):
         Set the GUI logger widget
         
         Args:
-            gui_logger (ModernLogger): GUI logger widget
+            gui_logger (ModernLogger): GUI logger widget (ModernLogger or ModernLogView)
         """
         self.gui_logger = gui_logger
     
-    def _format_message(self, level: int, message: str) -> str:
+    def _format_message(self, level: int, message: str, created: Optional[float] = None) -> str:
         """
         Format a log message with level-specific prefix
         
+        The GUI widget adds its own timestamp, so created is not rendered here.
+        
         Args:
             level (int): Log level
             message (str): Log message
+            created (Optional[float]): Record time in epoch seconds. Defaults to None.
             
         Returns:
             str: Formatted log message
@@ -61,9 +64,30 @@ class GUILogger(Logger):
         prefix = self._level_prefixes.get(level, "")
         return f"{prefix}{message}"
     
+    def _emit(self, record: LogRecord) -> None:
+        """
+        Store a record and append it to the GUI widget
+        
+        The widget renders its timestamp from the record's own time, so the
+        stored record and the displayed line agree. Safe to call from any
+        thread: the widget hands messages from worker threads to the GUI
+        thread in batches.
+        
+        Args:
+            record (LogRecord): Log record
+        """
+        self._store_record(record)
+        
+        if self.gui_logger:
+            try:
+                message = self._format_message(record.level, record.message, record.created)
+                self.gui_logger.append_message(message, created=record.created)
+            except Exception as e:
+                print(f"Error writing to GUI logger: {e}", file=sys.stderr)
+    
     def _write(self, message: str) -> None:
         """
-        Write a message to the GUI logger
+        Write a message to the GUI logger (safe to call from any thread)
         
         Args:
             message (str): Formatted log message
@@ -96,7 +120,8 @@ class GUILogger(Logger):
             except Exception as e:
                 print(f"Error starting progress in GUI logger: {e}", file=sys.stderr)
     
-    def update_progress(self, current: int, total: int, message: Optional[str] = None) -> None:
+    def update_progress(self, current: int, total: int, message: Optional[str] = None,
+                        line_id: Optional[int] = None) -> None:
         """
         Update progress in the GUI logger
         
@@ -104,13 +129,49 @@ class GUILogger(Logger):
             current (int): Current progress value
             total (int): Total progress value
             message (Optional[str], optional): Progress message. Defaults to None.
+            line_id (Optional[int], optional): Line from add_progress_line. Defaults to None (the start_progress line).
         """
         if self.gui_logger:
             try:
-                self.gui_logger.update_progress(current, total, message)
+                if line_id is None:
+                    self.gui_logger.update_progress(current, total, message)
+                else:
+                    self.gui_logger.update_progress(current, total, message, line_id=line_id)
             except Exception as e:
                 print(f"Error updating progress in GUI logger: {e}", file=sys.stderr)
     
+    def add_progress_line(self, message: Optional[str] = None, total: int = 100) -> Optional[int]:
+        """
+        Add an independent progress line to the GUI logger
+        
+        Args:
+            message (Optional[str], optional): Progress message. Defaults to None.
+            total (int, optional): Total progress value. Defaults to 100.
+            
+        Returns:
+            Optional[int]: Line id for update_progress and end_progress_line, or None without a widget
+        """
+        if self.gui_logger:
+            try:
+                return self.gui_logger.add_progress_line(message, total)
+            except Exception as e:
+                print(f"Error adding progress line to GUI logger: {e}", file=sys.stderr)
+        return None
+    
+    def end_progress_line(self, line_id: int, message: Optional[str] = None) -> None:
+        """
+        End a progress line added with add_progress_line
+        
+        Args:
+            line_id (int): Line id returned by add_progress_line
+            message (Optional[str], optional): Text that replaces the progress line. Defaults to None.
+        """
+        if self.gui_logger:
+            try:
+                self.gui_logger.end_progress_line(line_id, message)
+            except Exception as e:
+                print(f"Error ending progress line in GUI logger: {e}", file=sys.stderr)
+    
     def end_progress(self, message: str = "Operation completed") -> None:
         """
         End a progress operation in the GUI logger
@@ -0,0 +1,708 @@
+"""
+Virtualized GUI log view for Modern Logger.
+
+The QTextEdit-based ModernLogger lays out rich text for every appended line
+and caps its document at a few thousand blocks. This module provides a
+model/view alternative for high-volume logging:
+- LogListModel, a QAbstractListModel over a RecordStore ring buffer
+- ModernLogView, a single-column view with fixed row heights and the same
+  public API as ModernLogger (append_message, set_loading_on,
+  set_loading_off, update_progress, clear)
+
+Only the rows currently on screen are laid out and rendered, so appends cost
+O(1) and scrolling stays smooth with a million lines of history.
+
+ModernLogView is built on QTableView rather than QListView: even with
+uniform item sizes QListView keeps a position per row and re-lays them all
+out on every insert, while a fixed-size vertical header does not.
+"""
+
+from PySide6.QtWidgets import QTableView, QAbstractItemView, QApplication, QHeaderView
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QKeySequence
+import itertools
+import time
+import traceback
+import sys
+
+from .gui_logger import ColorfulLineIndicator, ScrollToBottomButton, MessageInbox, FlushMetrics, ProgressLine, LoadingQueue
+from .record_store import RecordStore
+from .timestamps import get_timestamp_formatter
+
+
+class LogListModel(QAbstractListModel):
+    """List model of timestamped log lines kept in a fixed-capacity ring buffer"""
+
+    def __init__(self, capacity=1000000, timestamp_format="[%Y-%m-%d %H:%M:%S]", parent=None):
+        """
+        Initialize the model
+
+        Args:
+            capacity (int, optional): Maximum number of lines kept. Defaults to 1000000.
+            timestamp_format (str, optional): strftime format of the line prefix. Defaults to "[%Y-%m-%d %H:%M:%S]".
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        # Each line is a mutable [created, text] pair so a progress line can be rewritten in place
+        self._lines = RecordStore(max(1, capacity))
+        self._hidden = 0  # Oldest lines already announced as removed but not yet overwritten
+        self._appended = 0  # Total lines ever appended, used to locate a line by serial number
+        self._timestamp_formatter = get_timestamp_formatter(timestamp_format + " ")
+
+    @property
+    def capacity(self):
+        """Maximum number of lines kept"""
+        return self._lines.capacity
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._lines) - self._hidden
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if not 0 <= row < len(self._lines) - self._hidden:
+            return None
+        # Timestamps are rendered lazily, only for rows the view actually paints
+        created, text = self._lines[self._hidden + row]
+        return f"{self._timestamp_formatter.format(created)}{text}"
+
+    def line_text(self, row):
+        """
+        Get the full text of a row, including its timestamp
+
+        Args:
+            row (int): Row number
+
+        Returns:
+            str: Displayed text of the row
+        """
+        return self.data(self.index(row, 0))
+
+    def append_lines(self, lines):
+        """
+        Append lines, evicting the oldest ones once the model is full
+
+        Args:
+            lines (list): (created, text) pairs to append, oldest first
+
+        Returns:
+            int: Serial number of the first appended line
+        """
+        count = len(lines)
+        first_serial = self._appended
+        if not count:
+            return first_serial
+
+        capacity = self._lines.capacity
+        if count >= capacity:
+            # Everything currently shown is replaced
+            self.beginResetModel()
+            self._lines.clear()
+            for created, text in lines[count - capacity:]:
+                self._lines.append([created, text])
+            self._hidden = 0
+            self._appended += count
+            self.endResetModel()
+            return first_serial
+
+        # Announce the rows that the ring buffer is about to overwrite, then insert
+        overflow = len(self._lines) + count - capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self._hidden = overflow
+            self.endRemoveRows()
+
+        rows = len(self._lines) - self._hidden
+        self.beginInsertRows(QModelIndex(), rows, rows + count - 1)
+        append = self._lines.append
+        for created, text in lines:
+            append([created, text])
+        self._hidden = 0
+        self._appended += count
+        self.endInsertRows()
+        return first_serial
+
+    def row_for_serial(self, serial):
+        """
+        Get the current row of a line from its serial number
+
+        Args:
+            serial (int): Serial number returned by append_lines
+
+        Returns:
+            int: Row number, or -1 if the line has been evicted
+        """
+        row = serial - (self._appended - len(self._lines))
+        return row if 0 <= row < len(self._lines) else -1
+
+    def set_line(self, serial, text, created=None):
+        """
+        Replace the text of an existing line in O(1)
+
+        Args:
+            serial (int): Serial number returned by append_lines
+            text (str): New text
+            created (float, optional): New time in epoch seconds. Defaults to None (keep).
+
+        Returns:
+            bool: True if the line was updated, False if it has been evicted
+        """
+        row = self.row_for_serial(serial)
+        if row < 0:
+            return False
+        line = self._lines[row]
+        line[1] = text
+        if created is not None:
+            line[0] = created
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        return True
+
+    def set_capacity(self, capacity):
+        """
+        Change the maximum number of lines kept, dropping the oldest if needed
+
+        Args:
+            capacity (int): New capacity
+        """
+        self.beginResetModel()
+        self._lines.resize(max(1, capacity))
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all lines"""
+        self.beginResetModel()
+        self._lines.clear()
+        self._hidden = 0
+        self.endResetModel()
+
+
+class ModernLogView(QTableView):
+    """
+    A virtualized, model/view logger for high message volumes.
+
+    Drop-in alternative to ModernLogger: it keeps the same public API and
+    loading/progress behavior but renders only the visible rows. Like
+    ModernLogger, its public methods may be called from any thread.
+    """
+
+    scroll_state_changed = Signal(bool)  # True when at bottom, False when scrolled up
+
+    # Maximum lines inserted per flush; the rest follow on the next event loop pass
+    FLUSH_CHUNK_SIZE = 10000
+
+    def __init__(self, parent=None, queue_messages=True, max_lines=1000000,
+                 max_queued=10000, queue_policy=LoadingQueue.KEEP_FIRST_LAST):
+        """
+        Initialize the view
+
+        Args:
+            parent (QWidget, optional): Parent widget. Defaults to None.
+            queue_messages (bool, optional): Whether to queue messages while loading. Defaults to True.
+            max_lines (int, optional): Maximum number of lines kept. Defaults to 1000000.
+            max_queued (int, optional): Maximum messages queued while loading. Defaults to 10000.
+            queue_policy (str, optional): Which queued messages to keep once max_queued is reached:
+                'summarize', 'keep_first_last' or 'keep_last'. Defaults to 'keep_first_last'.
+        """
+        super().__init__(parent)
+
+        self._timestamp_format = "[%Y-%m-%d %H:%M:%S]"
+        self._model = LogListModel(max_lines, self._timestamp_format, self)
+        self.setModel(self._model)
+
+        # Every row has the same fixed height, so layout is O(1) regardless of row count
+        rows = self.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.fontMetrics().height() + 4)
+        rows.hide()
+
+        # One stretched column that looks and behaves like a list
+        columns = self.horizontalHeader()
+        columns.setStretchLastSection(True)
+        columns.hide()
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        # Message queue settings
+        self._queue_messages = queue_messages
+        self._passthrough_messages = False
+        self._message_queue = LoadingQueue(max_queued, queue_policy)
+
+        # Lines appended on the UI thread are coalesced into one model insert per event loop pass
+        self._pending_batch = []
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.timeout.connect(self._process_batch)
+
+        # Calls from other threads are handed to the GUI thread in batches
+        self._inbox = MessageInbox(self._drain_inbox, self)
+
+        # UI-thread cost of each flush; the view never pumps the event loop itself
+        self._flush_metrics = FlushMetrics()
+
+        # Scroll management
+        self._auto_scroll_enabled = True
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+        # Loading state
+        self._loading = False
+        self._line_indicator = ColorfulLineIndicator(self)
+        self._line_indicator.hide()
+
+        # Progress lines keyed by id, addressed by serial number so updates are O(1);
+        # line 0 is the inline loading progress line. Updates are coalesced to one render per frame.
+        self._inline_progress_update = False
+        self._progress_lines = {}
+        self._progress_ids = itertools.count(1)
+        self._last_progress_render = 0.0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._render_progress)
+
+        self._scroll_button = ScrollToBottomButton(self)
+        self._scroll_button.clicked.connect(self._on_scroll_button_clicked)
+        self._update_overlay_positions()
+
+    @property
+    def model_capacity(self):
+        """Maximum number of lines kept"""
+        return self._model.capacity
+
+    def set_max_lines(self, max_lines):
+        """
+        Set the maximum number of lines kept
+
+        Args:
+            max_lines (int): Maximum number of lines
+        """
+        self._flush_pending()
+        self._model.set_capacity(max_lines)
+
+    def line_count(self):
+        """
+        Get the number of lines currently shown
+
+        Returns:
+            int: Number of lines
+        """
+        return self._model.rowCount()
+
+    def line_text(self, row):
+        """
+        Get the text of a shown line, including its timestamp
+
+        Args:
+            row (int): Row number
+
+        Returns:
+            str: Line text
+        """
+        return self._model.line_text(row)
+
+    def set_queue_limit(self, max_queued, policy=None):
+        """
+        Set how many messages are queued while loading and which are kept beyond that
+
+        Messages already queued are kept, subject to the new limit.
+
+        Args:
+            max_queued (int): Maximum number of queued messages
+            policy (str, optional): 'summarize', 'keep_first_last' or 'keep_last'. Defaults to None (keep current).
+        """
+        old_queue = self._message_queue
+        new_queue = LoadingQueue(max_queued, policy or old_queue.policy)
+        for line in old_queue.drain(self._suppressed_summary):
+            new_queue.put(line)
+        self._message_queue = new_queue
+
+    def _suppressed_summary(self, count):
+        """
+        Create the line that stands in for messages suppressed while loading
+
+        Args:
+            count (int): Number of suppressed messages
+
+        Returns:
+            tuple: (created, text) line
+        """
+        return (time.time(), f"... {count:,} messages suppressed while loading ...")
+
+    def _drain_inbox(self, items):
+        """
+        Apply messages and calls received from other threads, in arrival order
+
+        Args:
+            items (list): (created, text) messages and (method, args) calls
+        """
+        for head, tail in items:
+            if head.__class__ is float:
+                self.append_message(tail, head)
+            else:
+                head(*tail)
+
+    def append_message(self, text, created=None):
+        """
+        Add a timestamped message (safe to call from any thread)
+
+        Args:
+            text (str): Message text
+            created (float, optional): Message time in epoch seconds. Defaults to None (now).
+        """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((time.time() if created is None else float(created), text))
+            return
+
+        try:
+            line = (time.time() if created is None else created, text)
+            if self._loading and self._queue_messages and not self._passthrough_messages:
+                self._message_queue.put(line)
+                return
+
+            self._pending_batch.append(line)
+            if len(self._pending_batch) == 1:
+                self._batch_timer.start(0)
+        except Exception:
+            print(f"Error in append_message: {traceback.format_exc()}", file=sys.stderr)
+
+    def _process_batch(self):
+        """Insert pending lines into the model with a single row insertion per chunk"""
+        try:
+            self._batch_timer.stop()
+            if not self._pending_batch:
+                return
+            started = time.perf_counter()
+            batch = self._pending_batch
+            if len(batch) > self.FLUSH_CHUNK_SIZE:
+                # Spread a large backlog over several event loop passes
+                self._pending_batch = batch[self.FLUSH_CHUNK_SIZE:]
+                batch = batch[:self.FLUSH_CHUNK_SIZE]
+                self._batch_timer.start(0)
+            else:
+                self._pending_batch = []
+            self._append_lines(batch)
+            self._flush_metrics.record(time.perf_counter() - started, len(batch))
+        except Exception:
+            print(f"Error in _process_batch: {traceback.format_exc()}", file=sys.stderr)
+
+    def _flush_pending(self):
+        """Apply every pending line now, including chunks scheduled for later passes"""
+        while self._pending_batch:
+            self._process_batch()
+
+    def flush_metrics(self):
+        """
+        Get UI-thread timing of line flushes since creation or the last reset
+
+        Returns:
+            dict: flushes, messages, last_flush_ms, max_flush_ms (worst stall), mean_flush_ms and max_batch
+        """
+        return self._flush_metrics.as_dict()
+
+    def reset_flush_metrics(self):
+        """Reset the flush timing metrics"""
+        self._flush_metrics.reset()
+
+    def _append_lines(self, lines):
+        """
+        Append lines to the model and keep the scroll position consistent
+
+        Args:
+            lines (list): (created, text) pairs
+
+        Returns:
+            int: Serial number of the first appended line
+        """
+        follow = self._auto_scroll_enabled and self._is_at_bottom()
+        serial = self._model.append_lines(lines)
+        if follow:
+            self.scrollToBottom()
+        elif not self._is_at_bottom():
+            self._scroll_button.show_animated()
+        return serial
+
+    def set_loading_on(self, queue_messages=None, passthrough_messages=False, inline_update=False):
+        """
+        Activate the loading indicator
+
+        Args:
+            queue_messages (bool, optional): Whether to queue messages while loading. Defaults to None (use current setting).
+            passthrough_messages (bool, optional): Whether to show messages immediately while loading. Defaults to False.
+            inline_update (bool, optional): Whether to enable inline progress updates. Defaults to False.
+        """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.set_loading_on, (queue_messages, passthrough_messages, inline_update)))
+            return
+
+        try:
+            if queue_messages is not None:
+                self._queue_messages = queue_messages
+            self._passthrough_messages = passthrough_messages
+
+            # Show everything sent before loading started
+            self._flush_pending()
+
+            self._inline_progress_update = inline_update
+            self._progress_lines.pop(0, None)
+            if inline_update:
+                line = ProgressLine()
+                line.dirty = False
+                self._write_progress_line(line, "Preparing progress tracking...")
+                self._progress_lines[0] = line
+
+            self._loading = True
+            self._line_indicator.start_animation()
+            self._update_overlay_positions()
+        except Exception:
+            print(f"Error in set_loading_on: {traceback.format_exc()}", file=sys.stderr)
+
+    def update_progress(self, current, total=None, message=None, line_id=None):
+        """
+        Update the progress line in inline progress mode, or a line from add_progress_line
+
+        Updates are coalesced: calling this in a tight loop re-renders the line
+        at most once per frame.
+
+        Args:
+            current (int): Current progress value
+            total (int, optional): Total progress value. If None, uses last set total.
+            message (str, optional): Optional message to display with the progress. If None, uses last message.
+            line_id (int, optional): Progress line returned by add_progress_line. Defaults to None (inline progress line).
+
+        Returns:
+            bool: True if progress was updated, False if inline progress mode is not active or the line has ended.
+                Calls from other threads are applied on the GUI thread and return True.
+        """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.update_progress, (current, total, message, line_id)))
+            return True
+
+        line = self._progress_lines.get(0 if line_id is None else line_id)
+        if line is None:
+            return False
+
+        try:
+            line.update(current, total, message)
+            self._schedule_progress_render()
+            return True
+        except Exception:
+            print(f"Error in update_progress: {traceback.format_exc()}", file=sys.stderr)
+            return False
+
+    def add_progress_line(self, message=None, total=100):
+        """
+        Add a progress line that is updated in place, independently of loading mode
+
+        Args:
+            message (str, optional): Label shown before the progress. Defaults to None.
+            total (int, optional): Total progress value. Defaults to 100.
+
+        Returns:
+            int: Line id for update_progress and end_progress_line
+        """
+        line_id = next(self._progress_ids)
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self._create_progress_line, (line_id, message, total)))
+        else:
+            self._create_progress_line(line_id, message, total)
+        return line_id
+
+    def _create_progress_line(self, line_id, message, total):
+        """Append a new progress line after everything logged so far"""
+        try:
+            self._flush_pending()
+            line = ProgressLine(total, message)
+            self._write_progress_line(line)
+            self._progress_lines[line_id] = line
+        except Exception:
+            print(f"Error in add_progress_line: {traceback.format_exc()}", file=sys.stderr)
+
+    def end_progress_line(self, line_id, completion_message=None):
+        """
+        Stop tracking a progress line, leaving its final state in the log
+
+        Args:
+            line_id (int): Line id returned by add_progress_line
+            completion_message (str, optional): Text that replaces the progress line. Defaults to None.
+
+        Returns:
+            bool: True if the line was ended, False if it is unknown.
+                Calls from other threads are applied on the GUI thread and return True.
+        """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.end_progress_line, (line_id, completion_message)))
+            return True
+
+        line = self._progress_lines.pop(line_id, None)
+        if line is None:
+            return False
+
+        try:
+            if completion_message is not None:
+                self._write_progress_line(line, completion_message)
+            elif line.dirty:
+                self._write_progress_line(line)
+            return True
+        except Exception:
+            print(f"Error in end_progress_line: {traceback.format_exc()}", file=sys.stderr)
+            return False
+
+    def _schedule_progress_render(self):
+        """Render dirty progress lines now if a frame has passed, otherwise once the frame is due"""
+        wait = self._last_progress_render + 1.0 / ProgressLine.DEFAULT_RENDER_RATE - time.monotonic()
+        if wait <= 0:
+            self._progress_timer.stop()
+            self._render_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start(int(wait * 1000) + 1)
+
+    def _render_progress(self):
+        """Rewrite every progress line updated since the last render"""
+        try:
+            for line in self._progress_lines.values():
+                if line.dirty:
+                    self._write_progress_line(line)
+            self._last_progress_render = time.monotonic()
+        except Exception:
+            print(f"Error in _render_progress: {traceback.format_exc()}", file=sys.stderr)
+
+    def _write_progress_line(self, line, text=None):
+        """
+        Write a progress line into its row, or append a new row if the old one was evicted or cleared
+
+        Args:
+            line (ProgressLine): Progress line to write
+            text (str, optional): Text to show instead of the progress. Defaults to None.
+        """
+        if text is None:
+            text = line.text()
+        line.dirty = False
+        now = time.time()
+        if line.handle is None or not self._model.set_line(line.handle, text, now):
+            line.handle = self._append_lines([(now, text)])
+
+    def set_loading_off(self, completion_message=None):
+        """
+        Deactivate the loading indicator and show queued messages
+
+        Args:
+            completion_message (str, optional): Message appended after the queued ones. Defaults to None.
+        """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.set_loading_off, (completion_message,)))
+            return
+
+        try:
+            if not self._loading:
+                return
+
+            self._loading = False
+            line = self._progress_lines.pop(0, None)
+            if line is not None and line.dirty:
+                self._write_progress_line(line)
+            self._inline_progress_update = False
+            self._line_indicator.stop_animation()
+
+            # Queued lines are inserted in chunks over the next event loop passes; later lines follow them
+            self._flush_pending()
+            lines = self._message_queue.drain(self._suppressed_summary)
+            if completion_message is not None:
+                lines.append((time.time(), completion_message))
+            if lines:
+                self._pending_batch = lines
+                self._batch_timer.start(0)
+
+            self._update_overlay_positions()
+        except Exception:
+            print(f"Error in set_loading_off: {traceback.format_exc()}", file=sys.stderr)
+
+    def clear(self):
+        """Clear the displayed lines (messages queued while loading are kept)"""
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.clear, ()))
+            return
+
+        try:
+            self._pending_batch = []
+            self._batch_timer.stop()
+            self._model.clear()
+            self._auto_scroll_enabled = True
+            self._scroll_button.hide()
+        except Exception:
+            print(f"Error in clear: {traceback.format_exc()}", file=sys.stderr)
+
+    def _is_at_bottom(self):
+        """Check if view is scrolled to bottom"""
+        scrollbar = self.verticalScrollBar()
+        return scrollbar.value() >= scrollbar.maximum() - 5
+
+    def _on_scroll(self, value):
+        """Follow new lines only while the view is at the bottom, however it got there"""
+        at_bottom = self._is_at_bottom()
+        if at_bottom:
+            self._scroll_button.hide()
+        else:
+            self._scroll_button.show_animated()
+        if at_bottom != self._auto_scroll_enabled:
+            self._auto_scroll_enabled = at_bottom
+            self.scroll_state_changed.emit(at_bottom)
+
+    def _on_scroll_button_clicked(self):
+        """Handle scroll button click - scroll to bottom"""
+        self._auto_scroll_enabled = True
+        self.scrollToBottom()
+        self._scroll_button.hide()
+        self.scroll_state_changed.emit(True)
+
+    def keyPressEvent(self, event):
+        """Copy the selected lines as plain text"""
+        if event.matches(QKeySequence.Copy):
+            rows = sorted(index.row() for index in self.selectedIndexes())
+            if rows:
+                QApplication.clipboard().setText("\n".join(self._model.line_text(row) for row in rows))
+            return
+        super().keyPressEvent(event)
+
+    def resizeEvent(self, event):
+        """Handle resize to keep the overlays in place"""
+        super().resizeEvent(event)
+        self._update_overlay_positions()
+
+    def _update_overlay_positions(self):
+        """Position the loading indicator and scroll button over the viewport"""
+        viewport = self.viewport().geometry()
+        self._line_indicator.setFixedWidth(viewport.width())
+        self._line_indicator.move(viewport.left(), viewport.bottom() + 1 - self._line_indicator.height())
+        self._line_indicator.raise_()
+
+        x = viewport.right() + 1 - self._scroll_button.width() - 10
+        y = viewport.bottom() + 1 - self._scroll_button.height() - 10
+        if self._line_indicator.isVisible():
+            y -= self._line_indicator.height()
+        self._scroll_button.move(x, y)
+        self._scroll_button.raise_()
+
+    def set_indicator_frame_rate(self, fps):
+        """
+        Set the frame rate of the loading indicator animation
+
+        Args:
+            fps (int): Frames per second
+        """
+        self._line_indicator.set_frame_rate(fps)
+
+    def customize_scroll_button(self, **kwargs):
+        """
+        Customize the appearance of the scroll-to-bottom button
+
+        Args:
+            **kwargs: Arguments for ScrollToBottomButton.customize_appearance
+        """
+        self._scroll_button.customize_appearance(**kwargs)
+        self._update_overlay_positions()
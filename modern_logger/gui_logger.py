@@ -5,30 +5,311 @@ This module provides a Qt-based graphical user interface for logging.
 """
 
 from PySide6.QtWidgets import QTextEdit, QLabel, QApplication, QWidget, QPushButton, QGraphicsDropShadowEffect
-from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSize, QPropertyAnimation, QPoint, QRectF, QEasingCurve, QEvent, QObject
-from PySide6.QtGui import QTextCursor, QColor, QPainter, QPen, QFont, QPainterPath, QBrush, QLinearGradient, QIcon
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSize, QPropertyAnimation, QPoint, QPointF, QRectF, QEasingCurve, QEvent, QObject
+from PySide6 import QtGui
+from PySide6.QtGui import QTextCursor, QColor, QPainter, QPen, QFont, QPainterPath, QBrush, QLinearGradient, QIcon, QPixmap
+import itertools
 import math
-from datetime import datetime
-import queue
 import re
+import threading
 import traceback
 import sys
 import time
+from collections import deque
+
+from .timestamps import get_timestamp_formatter
+
+
+class MessageInbox(QObject):
+    """
+    Hand-off of messages and widget calls from any thread to the GUI thread
+    
+    Producers append to a deque, which is atomic in CPython, and only the
+    producer that finds the inbox idle posts a single queued wake-up signal.
+    The GUI thread then drains everything that has arrived in one pass, so
+    a burst from many threads costs one signal rather than one per message.
+    """
+    
+    ready = Signal()
+    
+    def __init__(self, handler, parent=None):
+        """
+        Initialize the inbox on the thread that will drain it
+        
+        Args:
+            handler (callable): Called on the owner thread with each drained list of items
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._items = deque()
+        self._handler = handler
+        self._wakeup_pending = False
+        self._owner_thread = threading.get_ident()
+        self.ready.connect(self.drain, Qt.QueuedConnection)
+    
+    def on_owner_thread(self):
+        """
+        Check whether the caller runs on the thread that drains the inbox
+        
+        Returns:
+            bool: True on the owner (GUI) thread
+        """
+        return threading.get_ident() == self._owner_thread
+    
+    def push(self, item):
+        """
+        Queue an item from any thread
+        
+        Args:
+            item: Item passed to the handler on the owner thread
+        """
+        self._items.append(item)
+        # A stale True is harmless: the pending drain clears the flag before it pops
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            self.ready.emit()
+    
+    def drain(self):
+        """Hand everything queued so far to the handler (owner thread only)"""
+        self._wakeup_pending = False
+        items = self._items
+        batch = []
+        try:
+            while True:
+                batch.append(items.popleft())
+        except IndexError:
+            pass
+        if batch:
+            try:
+                self._handler(batch)
+            except Exception:
+                print(f"Error in MessageInbox: {traceback.format_exc()}", file=sys.stderr)
+
+
+class FlushMetrics:
+    """UI-thread time spent applying batches of messages to a log widget"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Reset all counters"""
+        self.flushes = 0
+        self.messages = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+        self.max_time = 0.0
+        self.max_batch = 0
+    
+    def record(self, duration, messages):
+        """
+        Record one flush
+        
+        Args:
+            duration (float): Seconds the UI thread spent in the flush
+            messages (int): Number of messages applied
+        """
+        self.flushes += 1
+        self.messages += messages
+        self.total_time += duration
+        self.last_time = duration
+        if duration > self.max_time:
+            self.max_time = duration
+        if messages > self.max_batch:
+            self.max_batch = messages
+    
+    def as_dict(self):
+        """
+        Get the metrics as a dictionary
+        
+        Returns:
+            dict: flushes, messages, last_flush_ms, max_flush_ms, mean_flush_ms and max_batch
+        """
+        return {
+            'flushes': self.flushes,
+            'messages': self.messages,
+            'last_flush_ms': self.last_time * 1000,
+            'max_flush_ms': self.max_time * 1000,
+            'mean_flush_ms': self.total_time * 1000 / self.flushes if self.flushes else 0.0,
+            'max_batch': self.max_batch,
+        }
+
+
+class ProgressLine:
+    """
+    State of one inline progress line
+
+    Widgets keep a handle to where the line is displayed (a text cursor
+    anchored to its block, or a model serial number) and only mark the line
+    dirty on update, so a tight loop of updates costs one re-render per frame.
+    """
+
+    # Default frame rate of progress re-renders when the widget has no flush rate
+    DEFAULT_RENDER_RATE = 60
+
+    def __init__(self, total=100, message=None):
+        """
+        Initialize a progress line
+
+        Args:
+            total (int, optional): Total progress value. Defaults to 100.
+            message (str, optional): Label shown before the progress. Defaults to None.
+        """
+        self.current = 0
+        self.total = max(1, total)
+        self.message = message
+        self.handle = None  # Widget-specific position of the displayed line
+        self.rendered = None  # Text last written for the line
+        self.dirty = True
+
+    def update(self, current, total=None, message=None):
+        """
+        Update the progress values and mark the line for re-rendering
+
+        Args:
+            current (int): Current progress value
+            total (int, optional): Total progress value. If None, keeps the last total.
+            message (str, optional): Label shown before the progress. If None, keeps the last label.
+        """
+        if total is not None:
+            self.total = max(1, total)  # Ensure total is at least 1
+        self.current = max(0, min(current, self.total))
+        if message is not None:
+            self.message = message
+        self.dirty = True
+
+    def text(self):
+        """
+        Format the progress line
+
+        Returns:
+            str: Single-line progress text without timestamp
+        """
+        percentage = int((self.current / self.total) * 100)
+        if self.message:
+            # Line breaks would split the line into several blocks or rows
+            label = self.message.replace("\n", " ")
+            return f"{label} - {self.current}/{self.total} ({percentage}%)"
+        return f"Progress: {self.current}/{self.total} ({percentage}%)"
+
+
+class LoadingQueue:
+    """
+    Bounded queue of messages held back while a widget is loading
+
+    Once the capacity is reached, messages are suppressed according to the
+    policy and a single summary item stands in for them when the queue is
+    drained, so a long operation neither grows memory without limit nor
+    floods the widget when loading ends.
+    """
+
+    # Policies applied once the queue is full
+    SUMMARIZE = "summarize"  # Keep the first messages, summarize everything after them
+    KEEP_FIRST_LAST = "keep_first_last"  # Keep the first and last half, summarize the middle
+    KEEP_LAST = "keep_last"  # Keep the latest messages, summarize the older ones
+
+    POLICIES = (SUMMARIZE, KEEP_FIRST_LAST, KEEP_LAST)
+
+    def __init__(self, capacity=10000, policy=KEEP_FIRST_LAST):
+        """
+        Initialize the queue
+
+        Args:
+            capacity (int, optional): Maximum number of messages kept. Defaults to 10000.
+            policy (str, optional): 'summarize', 'keep_first_last' or 'keep_last'. Defaults to 'keep_first_last'.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unsupported queue policy: {policy}. "
+                             f"Supported policies: {', '.join(self.POLICIES)}")
+        self.capacity = max(1, capacity)
+        self.policy = policy
+        if policy == self.SUMMARIZE:
+            self._head_size = self.capacity
+        elif policy == self.KEEP_LAST:
+            self._head_size = 0
+        else:
+            self._head_size = (self.capacity + 1) // 2
+        self._head = []
+        self._tail = deque(maxlen=self.capacity - self._head_size)
+        self._suppressed = 0
+
+    def __len__(self):
+        return len(self._head) + len(self._tail)
+
+    @property
+    def suppressed_count(self):
+        """Number of messages suppressed since the queue was last drained"""
+        return self._suppressed
+
+    def put(self, item):
+        """
+        Queue a message, suppressing one if the queue is full
+
+        Args:
+            item: Message in the widget's own representation
+        """
+        if len(self._head) < self._head_size:
+            self._head.append(item)
+            return
+        tail = self._tail
+        if len(tail) == tail.maxlen:
+            # A full deque drops its oldest item on append; with no tail at all the new item is dropped
+            self._suppressed += 1
+            if not tail.maxlen:
+                return
+        tail.append(item)
+
+    def drain(self, make_summary):
+        """
+        Take every queued message, oldest first
+
+        Args:
+            make_summary (callable): Called with the suppressed count to create the summary item
+
+        Returns:
+            list: Queued messages, with the summary item where messages were suppressed
+        """
+        items = self._head
+        if self._suppressed:
+            items.append(make_summary(self._suppressed))
+        items.extend(self._tail)
+        self._head = []
+        self._tail.clear()
+        self._suppressed = 0
+        return items
 
 
 class ColorfulLineIndicator(QWidget):
     """A colorful line loading indicator that appears at the bottom of the ModernLogger"""
     
-    def __init__(self, parent=None):
+    # Default repaint rate of the animation
+    DEFAULT_FPS = 60
+    
+    # Share of the width crossed per second by the moving segment
+    SEGMENT_SPEED = 46.7
+    
+    # How often an obscured indicator checks whether it is visible again
+    OBSCURED_POLL_INTERVAL = 250
+    
+    def __init__(self, parent=None, fps=DEFAULT_FPS):
+        """
+        Initialize the indicator
+        
+        Args:
+            parent (QWidget, optional): Parent widget. Defaults to None.
+            fps (int, optional): Animation frames per second. Defaults to 60.
+        """
         super().__init__(parent)
         self.setFixedHeight(5)  # 5px height as requested
         self.hide()
         
-        # Animation properties - increase speed
+        # Animation properties; position follows the clock so speed does not depend on frame rate
         self._segment_position = 0
+        self._animation_start = 0.0
+        self._frame_interval = 15
         self._animation_timer = QTimer(self)
-        self._animation_timer.setInterval(15)  # Faster updates (15ms instead of 30ms)
         self._animation_timer.timeout.connect(self._update_animation)
+        self.set_frame_rate(fps)
         
         # Enhanced color configuration - more vibrant and dominant pinks
         self._base_color = QColor(235, 100, 150)  # Saturated pink base color
@@ -37,6 +318,11 @@ class ColorfulLineIndicator(QWidget):
         self._ultra_soft_color = QColor(245, 235, 240, 0)  # Transparent color for edges
         self._mid_transition = QColor(230, 140, 165, 65)  # Stronger mid transition color with more opacity
         
+        # Pre-rendered background and segment strips, rebuilt when size or colors change
+        self._strip_key = None
+        self._background_strip = None
+        self._segment_strip = None
+        
         # Make widget fully transparent when not active
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_NoSystemBackground)
@@ -44,27 +330,81 @@ class ColorfulLineIndicator(QWidget):
         
         # Ensure widget has no focus effects and isn't part of tab order
         self.setFocusPolicy(Qt.NoFocus)
+    
+    @property
+    def frame_rate(self):
+        """Animation frames per second"""
+        return 1000.0 / self._frame_interval
+    
+    def set_frame_rate(self, fps):
+        """
+        Set the animation frame rate
+        
+        Args:
+            fps (int): Frames per second
+        """
+        if fps <= 0:
+            raise ValueError(f"Frame rate must be positive, got {fps}")
+        self._frame_interval = max(1, int(round(1000.0 / fps)))
+        # While obscured the timer keeps polling slowly and picks up the new rate once visible
+        if not self._animation_timer.isActive() or self._animation_timer.interval() != self.OBSCURED_POLL_INTERVAL:
+            self._animation_timer.setInterval(self._frame_interval)
+    
+    def _is_obscured(self):
+        """Check whether nothing of the indicator can currently be seen"""
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return True
+        window = self.window()
+        if window.isMinimized():
+            return True
+        handle = window.windowHandle()
+        return handle is not None and not handle.isExposed()
         
     def _update_animation(self):
-        """Update animation state and repaint with faster movement"""
-        # Faster movement for more dynamic animation
-        self._segment_position = (self._segment_position + 0.7) % 100  # Much faster (0.7 instead of 0.3)
+        """Advance the animation, or idle at a slow poll rate while obscured"""
+        if self._is_obscured():
+            if self._animation_timer.interval() != self.OBSCURED_POLL_INTERVAL:
+                self._animation_timer.setInterval(self.OBSCURED_POLL_INTERVAL)
+            return
+        if self._animation_timer.interval() != self._frame_interval:
+            self._animation_timer.setInterval(self._frame_interval)
+        
+        elapsed = time.monotonic() - self._animation_start
+        self._segment_position = (elapsed * self.SEGMENT_SPEED) % 100
         
         # Repaint the widget
         self.update()
+    
+    def _colors_key(self):
+        """Identify the current color configuration"""
+        return tuple(c.rgba() for c in (self._base_color, self._highlight_color, self._deep_color,
+                                        self._ultra_soft_color, self._mid_transition))
+    
+    def _new_strip(self, width, height, ratio):
+        """Create a transparent pixmap for the given logical size and device pixel ratio"""
+        pixmap = QPixmap(max(1, math.ceil(width * ratio)), max(1, math.ceil(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+    
+    def _build_strips(self, width, height, ratio):
+        """Render the background and segment gradients once for this size and color configuration"""
+        background = self._new_strip(width, height, ratio)
+        painter = QPainter(background)
+        painter.fillRect(QRectF(0, 0, width, height), self._background_gradient(width))
+        painter.end()
         
-    def paintEvent(self, event):
-        """Custom paint event to draw the animated line"""
-        # Skip painting when not visible
-        if not self.isVisible():
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        width = self.width()
-        height = self.height()
+        segment_width = width * 0.9  # Wider segment for more pink coverage
+        segment = self._new_strip(segment_width, height, ratio)
+        painter = QPainter(segment)
+        painter.fillRect(QRectF(0, 0, segment_width, height), self._segment_gradient(segment_width))
+        painter.end()
         
+        self._background_strip = background
+        self._segment_strip = segment
+    
+    def _background_gradient(self, width):
+        """Build the full-width background gradient"""
         # Create full-width background with more pink tint
         bg_gradient = QLinearGradient(0, 0, width, 0)
         
@@ -84,16 +424,12 @@ class ColorfulLineIndicator(QWidget):
             alpha = int(18 + 25 * weight)  # 18-43 alpha range for more visibility
             bg_gradient.setColorAt(pos, QColor(r, g, b, alpha))
             
-        painter.fillRect(0, 0, width, height, bg_gradient)
-        
-        # Draw a segment that moves across the width
-        segment_width = width * 0.9  # Wider segment for more pink coverage
-        
-        # Calculate segment's starting position
-        segment_start_x = width * (self._segment_position / 100.0) - segment_width * 0.45
-        
+        return bg_gradient
+    
+    def _segment_gradient(self, segment_width):
+        """Build the gradient of the moving segment, starting at x = 0"""
         # Use linear gradient for the animated segment
-        segment_gradient = QLinearGradient(segment_start_x, 0, segment_start_x + segment_width, 0)
+        segment_gradient = QLinearGradient(0, 0, segment_width, 0)
         
         # Modified color distribution - much more pink dominant portions
         for i in range(0, 101):  # Increased resolution for smoother gradient
@@ -180,14 +516,35 @@ class ColorfulLineIndicator(QWidget):
                                            self._ultra_soft_color.green(), 
                                            self._ultra_soft_color.blue(), 0))
         
-        # Draw the segment with the enhanced gradient
-        painter.fillRect(segment_start_x, 0, segment_width, height, segment_gradient)
+        return segment_gradient
+        
+    def paintEvent(self, event):
+        """Custom paint event to blit the cached strips at the current offset"""
+        # Skip painting when not visible
+        if not self.isVisible():
+            return
+        
+        width = self.width()
+        height = self.height()
+        ratio = self.devicePixelRatioF()
+        key = (width, height, ratio, self._colors_key())
+        if key != self._strip_key:
+            self._build_strips(width, height, ratio)
+            self._strip_key = key
+        
+        # Calculate segment's starting position
+        segment_start_x = width * (self._segment_position / 100.0) - width * 0.9 * 0.45
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background_strip)
+        painter.drawPixmap(QPointF(segment_start_x, 0), self._segment_strip)
     
     def start_animation(self):
         """Start the line animation"""
         self._segment_position = 0
+        self._animation_start = time.monotonic()
         self.show()
-        self._animation_timer.start()
+        self._animation_timer.start(self._frame_interval)
     
     def stop_animation(self):
         """Stop the line animation"""
@@ -398,12 +755,35 @@ class ModernLogger(QTextEdit):
     """
     A QTextEdit-based modern logger that displays timestamped messages
     and supports a non-blocking loading indicator.
+    
+    append_message, set_loading_on, set_loading_off, update_progress and
+    clear may be called from any thread; calls from other threads are
+    applied on the GUI thread in the order they were made.
     """
     
     # Keep the signal for internal use, but we won't show the label anymore
     scroll_state_changed = Signal(bool)  # True when at bottom, False when scrolled up
+    
+    # Maximum messages inserted per frame-paced flush; the rest follow on the next event loop pass
+    FLUSH_CHUNK_SIZE = 2000
 
-    def __init__(self, parent=None, queue_messages=True, auto_process_events=True):
+    def __init__(self, parent=None, queue_messages=True, auto_process_events=True, flush_rate=None,
+                 max_queued=10000, queue_policy=LoadingQueue.KEEP_FIRST_LAST):
+        """
+        Initialize the logger widget
+        
+        Args:
+            parent (QWidget, optional): Parent widget. Defaults to None.
+            queue_messages (bool, optional): Whether to queue messages while loading. Defaults to True.
+            auto_process_events (bool, optional): Whether to pump the event loop during updates. Set to False
+                for event-loop-friendly operation: the widget then never calls processEvents() or forces a
+                repaint, and leaves painting to the application's event loop. Defaults to True.
+            flush_rate (int, optional): Maximum batch flushes per second (e.g. 30 or 60). Each flush inserts the
+                whole pending batch in one edit block. Defaults to None (flush on the next event loop pass).
+            max_queued (int, optional): Maximum messages queued while loading. Defaults to 10000.
+            queue_policy (str, optional): Which queued messages to keep once max_queued is reached:
+                'summarize', 'keep_first_last' or 'keep_last'. Defaults to 'keep_first_last'.
+        """
         super().__init__(parent)
         self.setReadOnly(True)
         
@@ -416,16 +796,30 @@ class ModernLogger(QTextEdit):
         # Message queue settings
         self._queue_messages = queue_messages
         self._passthrough_messages = False
-        self._message_queue = queue.Queue()
+        self._message_queue = LoadingQueue(max_queued, queue_policy)
         
-        # Timestamp format
+        # Timestamp format, rendered through the shared per-second cache
         self._timestamp_format = "[%Y-%m-%d %H:%M:%S]"
+        self._timestamp_formatter = get_timestamp_formatter(self._timestamp_format + " ")
         
         # Batch processing
         self._batch_timer = QTimer(self)
         self._batch_timer.setSingleShot(True)
         self._batch_timer.timeout.connect(self._process_batch)
         self._pending_batch = []
+        self._loading_off_restore = None  # Scroll state restored once the post-loading backlog drains
+        
+        # Frame-paced flushing
+        self._flush_rate = None
+        self._frame_interval = 0.0
+        self._last_flush_time = 0.0
+        self.set_flush_rate(flush_rate)
+        
+        # Calls from other threads are handed to the GUI thread in batches
+        self._inbox = MessageInbox(self._drain_inbox, self)
+        
+        # UI-thread cost of each flush
+        self._flush_metrics = FlushMetrics()
         
         # Scroll management
         self._auto_scroll_enabled = True
@@ -441,6 +835,7 @@ class ModernLogger(QTextEdit):
         self._event_processing_count = 0
         self._event_processing_threshold = 5  # Process events after every 5 operations
         self._last_event_process_time = None
+        self._processing_events = False  # Guards against pumping the event loop re-entrantly
         
         # Connect scroll signals
         scrollbar = self.verticalScrollBar()
@@ -464,11 +859,15 @@ class ModernLogger(QTextEdit):
         # First-run flag
         self._first_content = True
         
-        # Inline progress update settings
+        # Inline progress lines keyed by id; line 0 is the loading progress line.
+        # Each keeps a cursor anchored to its block, and updates are coalesced to one render per frame.
         self._inline_progress_update = False
-        self._progress_current = 0
-        self._progress_total = 100
-        self._progress_message_id = None
+        self._progress_lines = {}
+        self._progress_ids = itertools.count(1)
+        self._last_progress_render = 0.0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._render_progress)
         
         # Install event filter to handle resize events
         self.installEventFilter(self)
@@ -483,6 +882,8 @@ class ModernLogger(QTextEdit):
 
     def _process_batch(self):
         """Process pending message batch"""
+        started = time.perf_counter()
+        count = 0
         try:
             if not self._pending_batch:
                 return
@@ -499,11 +900,24 @@ class ModernLogger(QTextEdit):
                 self._preserve_scroll_state = False
             
             # Append all messages
-            for message in self._pending_batch:
-                super().append(message)
-            
-            # Clear batch
-            self._pending_batch.clear()
+            # Unpaced batches are flushed at 10 messages, so anything longer is a backlog (e.g. queued while loading)
+            chunked = bool(self._flush_rate) or len(self._pending_batch) > 10
+            if chunked:
+                # Insert a bounded chunk so a large backlog is spread over several event loop passes
+                chunk = self._pending_batch[:self.FLUSH_CHUNK_SIZE]
+                del self._pending_batch[:self.FLUSH_CHUNK_SIZE]
+                self._insert_batch(chunk)
+                self._last_flush_time = time.monotonic()
+                count = len(chunk)
+                if self._pending_batch:
+                    self._batch_timer.start(0)
+            else:
+                for message in self._pending_batch:
+                    super().append(message)
+                count = len(self._pending_batch)
+                
+                # Clear batch
+                self._pending_batch.clear()
             
             # Handle scrolling - respect the auto_scroll_enabled flag
             if not self._auto_scroll_enabled and self._preserve_scroll_state:
@@ -515,7 +929,12 @@ class ModernLogger(QTextEdit):
                     self._scroll_button.show_animated()
             elif self._auto_scroll_enabled and (was_at_bottom or self._first_content):
                 # We were at the bottom and auto-scroll is enabled
-                self._do_auto_scroll()
+                if chunked:
+                    # One scroll update; the event loop paints the frame
+                    scrollbar = self.verticalScrollBar()
+                    scrollbar.setValue(scrollbar.maximum())
+                else:
+                    self._do_auto_scroll()
                 self._first_content = False
                 
                 # Hide scroll button since we're at bottom - use immediate hide
@@ -523,7 +942,8 @@ class ModernLogger(QTextEdit):
                     self._scroll_button.hide()
             
             # Process events after batch processing
-            self._process_events_if_needed()
+            if not chunked:
+                self._process_events_if_needed()
             
             # Ensure loading indicator remains visible if we're in loading state
             if self._loading and hasattr(self, '_line_indicator'):
@@ -536,12 +956,142 @@ class ModernLogger(QTextEdit):
         except Exception as e:
             print(f"Error in _process_batch: {traceback.format_exc()}", file=sys.stderr)
             self._pending_batch.clear()
+        finally:
+            if count:
+                self._flush_metrics.record(time.perf_counter() - started, count)
+            if not self._pending_batch and self._loading_off_restore is not None:
+                # The backlog queued while loading has been drained
+                restore = self._loading_off_restore
+                self._loading_off_restore = None
+                self._finish_loading_off(*restore)
+    
+    def _flush_pending(self):
+        """Apply every pending message now, including chunks scheduled for later passes"""
+        while self._pending_batch:
+            self._process_batch()
     
-    def append_message(self, text):
-        """Add a timestamped message"""
+    def flush_metrics(self):
+        """
+        Get UI-thread timing of message flushes since creation or the last reset
+        
+        Includes the time spent pumping the event loop when auto_process_events is enabled.
+        
+        Returns:
+            dict: flushes, messages, last_flush_ms, max_flush_ms (worst stall), mean_flush_ms and max_batch
+        """
+        return self._flush_metrics.as_dict()
+    
+    def reset_flush_metrics(self):
+        """Reset the flush timing metrics"""
+        self._flush_metrics.reset()
+    
+    def _insert_batch(self, messages):
+        """
+        Insert messages as new paragraphs at the end of the document in a single edit block
+        
+        Like QTextEdit.append(), messages that look like rich text are inserted
+        as HTML, so a message renders the same however many arrive together.
+        
+        Args:
+            messages (list): Formatted messages to insert
+        """
+        doc = self.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        needs_block = not doc.isEmpty()
+        plain = []
+        for message in messages + [None]:
+            if message is not None and not QtGui.Qt.mightBeRichText(message):
+                plain.append(message)
+                continue
+            if plain:
+                if needs_block:
+                    cursor.insertBlock()
+                # Line feeds become paragraph separators, so a run of plain lines is laid out once
+                cursor.insertText("\n".join(plain))
+                plain = []
+                needs_block = True
+            if message is not None:
+                if needs_block:
+                    cursor.insertBlock()
+                cursor.insertHtml(message)
+                needs_block = True
+        cursor.endEditBlock()
+    
+    @property
+    def flush_rate(self):
+        """Maximum batch flushes per second, or None when flushing on the next event loop pass"""
+        return self._flush_rate
+    
+    def set_flush_rate(self, rate):
+        """
+        Set frame-paced batch flushing
+        
+        Args:
+            rate (int): Maximum flushes per second (e.g. 30 or 60), or None to flush on the next event loop pass
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Flush rate must be positive, got {rate}")
+        self._flush_rate = rate
+        self._frame_interval = 1.0 / rate if rate else 0.0
+    
+    def set_queue_limit(self, max_queued, policy=None):
+        """
+        Set how many messages are queued while loading and which are kept beyond that
+        
+        Messages already queued are kept, subject to the new limit.
+        
+        Args:
+            max_queued (int): Maximum number of queued messages
+            policy (str, optional): 'summarize', 'keep_first_last' or 'keep_last'. Defaults to None (keep current).
+        """
+        old_queue = self._message_queue
+        new_queue = LoadingQueue(max_queued, policy or old_queue.policy)
+        for message in old_queue.drain(self._suppressed_summary):
+            new_queue.put(message)
+        self._message_queue = new_queue
+    
+    def _suppressed_summary(self, count):
+        """
+        Create the line that stands in for messages suppressed while loading
+        
+        Args:
+            count (int): Number of suppressed messages
+        
+        Returns:
+            str: Formatted message
+        """
+        return f"{self._timestamp_formatter.format()}... {count:,} messages suppressed while loading ..."
+    
+    def _drain_inbox(self, items):
+        """
+        Apply messages and calls received from other threads, in arrival order
+        
+        Args:
+            items (list): (created, text) messages and (method, args) calls
+        """
+        for head, tail in items:
+            if head.__class__ is float:
+                self.append_message(tail, head)
+            else:
+                head(*tail)
+    
+    def append_message(self, text, created=None):
+        """
+        Add a timestamped message (safe to call from any thread)
+        
+        Args:
+            text (str): Message text
+            created (float, optional): Message time in epoch seconds. Defaults to None (now).
+        """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((time.time() if created is None else float(created), text))
+            return
+        
         try:
             # Create timestamp
-            timestamp = datetime.now().strftime(self._timestamp_format + " ")
+            timestamp = self._timestamp_formatter.format(created)
             full_message = f"{timestamp}{text}"
             
             # Queue or batch based on mode
@@ -551,9 +1101,15 @@ class ModernLogger(QTextEdit):
                 self._pending_batch.append(full_message)
                 
                 # Process immediately or schedule
-                if len(self._pending_batch) == 1:
+                if self._flush_rate:
+                    # Flush at most once per frame, whatever arrives in between joins the batch
+                    if not self._batch_timer.isActive():
+                        wait = self._last_flush_time + self._frame_interval - time.monotonic()
+                        self._batch_timer.start(max(0, int(wait * 1000)))
+                elif len(self._pending_batch) == 1:
                     self._batch_timer.start(0)
-                elif len(self._pending_batch) >= 10:
+                elif 10 <= len(self._pending_batch) <= self.FLUSH_CHUNK_SIZE:
+                    # A longer batch is a backlog already being inserted chunk by chunk
                     self._batch_timer.stop()
                     self._process_batch()
                     
@@ -587,7 +1143,15 @@ class ModernLogger(QTextEdit):
             passthrough_messages (bool, optional): Whether to show messages immediately while loading. Defaults to False.
             inline_update (bool, optional): Whether to enable inline progress updates. Defaults to False.
         """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.set_loading_on, (queue_messages, passthrough_messages, inline_update)))
+            return
+        
         try:
+            # Finish showing the backlog of the previous loading phase, restoring its scroll state
+            if self._loading_off_restore is not None:
+                self._flush_pending()
+            
             # Determine if currently at the bottom before any changes
             was_at_bottom = self._is_at_bottom()
             
@@ -604,12 +1168,10 @@ class ModernLogger(QTextEdit):
             
             # Set inline progress update mode and reset progress
             self._inline_progress_update = inline_update
-            self._progress_current = 0
-            self._progress_total = 100
-            self._progress_message_id = None
+            self._progress_lines.pop(0, None)
             
             # Process any pending batch messages
-            self._process_batch()
+            self._flush_pending()
             
             # Set loading state
             self._loading = True
@@ -632,9 +1194,11 @@ class ModernLogger(QTextEdit):
                 scrollbar = self.verticalScrollBar()
                 old_value = scrollbar.value()
                 
-                # Add placeholder message
-                timestamp = datetime.now().strftime(self._timestamp_format + " ")
-                super().append(f"{timestamp}Preparing progress tracking...")
+                # Add placeholder message, tracked by a cursor anchored to its block
+                line = ProgressLine()
+                line.dirty = False
+                self._write_progress_line(line, "Preparing progress tracking...")
+                self._progress_lines[0] = line
                 
                 if was_at_bottom:
                     # If we were at bottom, do one final scroll to make progress visible
@@ -650,9 +1214,6 @@ class ModernLogger(QTextEdit):
                     if hasattr(self, '_scroll_button'):
                         self._scroll_button.show_animated()
                 
-                # Store the progress message ID for later updates
-                self._progress_message_id = self.document().blockCount() - 1
-                
                 # We're explicitly managing scroll state
                 self._preserve_scroll_state = True
             else:
@@ -684,80 +1245,132 @@ class ModernLogger(QTextEdit):
         except Exception as e:
             print(f"Error in set_loading_on: {traceback.format_exc()}", file=sys.stderr)
     
-    def update_progress(self, current, total=None, message=None):
+    def update_progress(self, current, total=None, message=None, line_id=None):
         """
-        Update the progress indicator in inline progress mode
+        Update the progress indicator in inline progress mode, or a line from add_progress_line
+        
+        The line is rewritten in place through a cursor anchored to its block, so
+        the cost does not depend on the document size. Updates are coalesced:
+        calling this in a tight loop re-renders the line at most once per frame.
         
         Args:
             current (int): Current progress value
             total (int, optional): Total progress value. If None, uses last set total.
-            message (str, optional): Optional message to display with the progress.
+            message (str, optional): Optional message to display with the progress. If None, uses last message.
+            line_id (int, optional): Progress line returned by add_progress_line. Defaults to None (inline progress line).
         
         Returns:
-            bool: True if progress was updated, False if inline progress mode is not active
+            bool: True if progress was updated, False if inline progress mode is not active or the line has ended.
+                Calls from other threads are applied on the GUI thread and return True.
         """
-        if not self._inline_progress_update or not self._loading:
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.update_progress, (current, total, message, line_id)))
+            return True
+        
+        line = self._progress_lines.get(0 if line_id is None else line_id)
+        if line is None:
             return False
             
+        try:
+            line.update(current, total, message)
+            self._schedule_progress_render()
+            return True
+            
+        except Exception as e:
+            print(f"Error in update_progress: {traceback.format_exc()}", file=sys.stderr)
+            return False
+    
+    def add_progress_line(self, message=None, total=100):
+        """
+        Add a progress line that is updated in place, independently of loading mode
+        
+        Several progress lines can be active at once. Each is appended after the
+        messages logged so far and updated with update_progress(..., line_id=...).
+        
+        Args:
+            message (str, optional): Label shown before the progress. Defaults to None.
+            total (int, optional): Total progress value. Defaults to 100.
+        
+        Returns:
+            int: Line id for update_progress and end_progress_line
+        """
+        line_id = next(self._progress_ids)
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self._create_progress_line, (line_id, message, total)))
+        else:
+            self._create_progress_line(line_id, message, total)
+        return line_id
+    
+    def _create_progress_line(self, line_id, message, total):
+        """Append a new progress line after everything logged so far"""
+        try:
+            self._flush_pending()
+            was_at_bottom = self._is_at_bottom()
+            line = ProgressLine(total, message)
+            self._write_progress_line(line)
+            self._progress_lines[line_id] = line
+            if was_at_bottom and self._auto_scroll_enabled:
+                scrollbar = self.verticalScrollBar()
+                scrollbar.setValue(scrollbar.maximum())
+        except Exception as e:
+            print(f"Error in add_progress_line: {traceback.format_exc()}", file=sys.stderr)
+    
+    def end_progress_line(self, line_id, completion_message=None):
+        """
+        Stop tracking a progress line, leaving its final state in the log
+        
+        Args:
+            line_id (int): Line id returned by add_progress_line
+            completion_message (str, optional): Text that replaces the progress line. Defaults to None.
+        
+        Returns:
+            bool: True if the line was ended, False if it is unknown.
+                Calls from other threads are applied on the GUI thread and return True.
+        """
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.end_progress_line, (line_id, completion_message)))
+            return True
+        
+        line = self._progress_lines.pop(line_id, None)
+        if line is None:
+            return False
+        
+        try:
+            scrollbar = self.verticalScrollBar()
+            old_value = scrollbar.value()
+            if completion_message is not None:
+                self._write_progress_line(line, completion_message)
+            elif line.dirty:
+                self._write_progress_line(line)
+            scrollbar.setValue(old_value)
+            return True
+        except Exception as e:
+            print(f"Error in end_progress_line: {traceback.format_exc()}", file=sys.stderr)
+            return False
+    
+    def _schedule_progress_render(self):
+        """Render dirty progress lines now if a frame has passed, otherwise once the frame is due"""
+        interval = self._frame_interval or 1.0 / ProgressLine.DEFAULT_RENDER_RATE
+        wait = self._last_progress_render + interval - time.monotonic()
+        if wait <= 0:
+            # Rendering synchronously keeps progress visible in loops that run on the GUI thread
+            self._progress_timer.stop()
+            self._render_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start(int(wait * 1000) + 1)
+    
+    def _render_progress(self):
+        """Rewrite every progress line updated since the last render"""
         try:
             # Save current scroll position before doing anything
             scrollbar = self.verticalScrollBar()
             old_value = scrollbar.value()
             was_at_bottom = self._is_at_bottom()
             
-            # Update progress values
-            self._progress_current = max(0, min(current, self._progress_total))
-            if total is not None:
-                self._progress_total = max(1, total)  # Ensure total is at least 1
-                
-            # Calculate percentage
-            percentage = int((self._progress_current / self._progress_total) * 100)
-            
-            # Format progress message
-            if message:
-                progress_text = f"{message} - {self._progress_current}/{self._progress_total} ({percentage}%)"
-            else:
-                progress_text = f"Progress: {self._progress_current}/{self._progress_total} ({percentage}%)"
-            
-            # Create timestamp
-            timestamp = datetime.now().strftime(self._timestamp_format + " ")
-            full_message = f"{timestamp}{progress_text}"
-            
-            # Find the block with our progress message
-            doc = self.document()
-            block = doc.findBlockByNumber(self._progress_message_id) if self._progress_message_id is not None else None
-            
-            if block is not None and block.isValid():
-                # Create a cursor positioned at the START of the block
-                cursor = QTextCursor(block)
-                
-                # Move cursor to start position and select the ENTIRE block
-                cursor.movePosition(QTextCursor.StartOfBlock)
-                cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
-                
-                # Replace the entire text with our new message
-                cursor.removeSelectedText()
-                cursor.insertText(full_message)
-            else:
-                # If block not found, try to find the last block and update it
-                last_block_id = doc.blockCount() - 1
-                if last_block_id >= 0:
-                    block = doc.findBlockByNumber(last_block_id)
-                    if block.isValid():
-                        cursor = QTextCursor(block)
-                        cursor.movePosition(QTextCursor.StartOfBlock)
-                        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
-                        cursor.removeSelectedText()
-                        cursor.insertText(full_message)
-                        self._progress_message_id = last_block_id
-                    else:
-                        # Fallback: append new message
-                        super().append(full_message)
-                        self._progress_message_id = doc.blockCount() - 1
-                else:
-                    # Fallback: append new message
-                    super().append(full_message)
-                    self._progress_message_id = doc.blockCount() - 1
+            for line in self._progress_lines.values():
+                if line.dirty:
+                    self._write_progress_line(line)
+            self._last_progress_render = time.monotonic()
             
             # Immediately restore scroll position to prevent jumping
             scrollbar.setValue(old_value)
@@ -775,11 +1388,49 @@ class ModernLogger(QTextEdit):
             # Process events to update the text display but maintain scroll
             self._process_events_if_needed()
             
-            return True
-            
         except Exception as e:
-            print(f"Error in update_progress: {traceback.format_exc()}", file=sys.stderr)
-            return False
+            print(f"Error in _render_progress: {traceback.format_exc()}", file=sys.stderr)
+    
+    def _write_progress_line(self, line, text=None):
+        """
+        Write a progress line into its block, or append a new block if the old one is gone
+        
+        The block is found through a cursor anchored at its start, which Qt keeps
+        in place as text is inserted or older blocks are evicted by the maximum
+        block count. If the block was evicted or cleared, the line starts over at
+        the end of the document.
+        
+        Args:
+            line (ProgressLine): Progress line to write
+            text (str, optional): Text to show instead of the progress. Defaults to None.
+        """
+        full_message = f"{self._timestamp_formatter.format()}{line.text() if text is None else text}"
+        line.dirty = False
+        
+        handle = line.handle
+        if handle is not None:
+            block = handle.block()
+            if block.isValid() and handle.positionInBlock() == 0 and block.text() == line.rendered:
+                cursor = QTextCursor(block)
+                cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+                cursor.insertText(full_message)
+                line.rendered = full_message
+                return
+        
+        doc = self.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not doc.isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(full_message)
+        cursor.endEditBlock()
+        
+        # Anchor at the block start; text written at the anchor must not push it to the end of the line
+        handle = QTextCursor(doc.lastBlock())
+        handle.setKeepPositionOnInsert(True)
+        line.handle = handle
+        line.rendered = full_message
 
     def _update_line_indicator_position(self):
         # Implementation of _update_line_indicator_position method
@@ -831,6 +1482,10 @@ class ModernLogger(QTextEdit):
 
     def set_loading_off(self, completion_message=None):
         """Deactivate the loading indicator"""
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.set_loading_off, (completion_message,)))
+            return
+        
         try:
             if not self._loading:
                 return
@@ -849,9 +1504,12 @@ class ModernLogger(QTextEdit):
             # Temporarily disable auto-scrolling for message additions
             self._auto_scroll_enabled = False
             
-            # Reset inline progress tracking
+            # Show the final progress state, then stop tracking the inline progress line
+            line = self._progress_lines.pop(0, None)
+            if line is not None and line.dirty:
+                self._write_progress_line(line)
+                scrollbar.setValue(old_value)
             self._inline_progress_update = False
-            self._progress_message_id = None
             
             # Update loading state
             self._loading = False
@@ -864,52 +1522,28 @@ class ModernLogger(QTextEdit):
             # Update scroll button position since line indicator is now hidden
             self._update_scroll_button_position()
             
-            # Process any queued messages while maintaining scroll position
-            if not self._message_queue.empty():
-                messages = []
-                while not self._message_queue.empty():
-                    try:
-                        messages.append(self._message_queue.get(block=False))
-                    except queue.Empty:
-                        break
-                
-                # Add all messages
-                for message in messages:
-                    super().append(message)
-                    # Reset scroll position after each message
-                    scrollbar.setValue(old_value)
-                
-                QApplication.processEvents()
+            # Messages sent before loading started go first
+            self._flush_pending()
             
-            # Add completion message if provided
+            # Queued messages, then the completion message, are inserted in chunks over the next
+            # event loop passes so a long backlog does not freeze the UI; later messages follow them
+            messages = self._message_queue.drain(self._suppressed_summary)
             if completion_message is not None:
-                timestamp = datetime.now().strftime(self._timestamp_format + " ")
-                super().append(f"{timestamp}{completion_message}")
-                # Maintain scroll position
-                scrollbar.setValue(old_value)
-                QApplication.processEvents()
+                messages.append(f"{self._timestamp_formatter.format()}{completion_message}")
+            if messages:
+                self._pending_batch = messages
+                self._batch_timer.start(0)
             
-            # Restore the auto-scroll state AFTER all messages are added
+            # Restore the auto-scroll state AFTER all messages are added; while a backlog
+            # is being drained, auto-scroll stays off until its last chunk is inserted
             if was_inline_mode and hasattr(self, '_pre_inline_auto_scroll_state'):
-                self._auto_scroll_enabled = self._pre_inline_auto_scroll_state
+                restore_auto_scroll = self._pre_inline_auto_scroll_state
             else:
-                self._auto_scroll_enabled = saved_auto_scroll
-            
-            # Handle final scrolling decision
-            if self._auto_scroll_enabled and was_at_bottom:
-                # Only auto-scroll if we were at bottom and auto-scroll is now enabled
-                QTimer.singleShot(10, self._do_auto_scroll)
-                
-                # Hide scroll button since we'll be at bottom - use immediate hide
-                if hasattr(self, '_scroll_button'):
-                    self._scroll_button.hide()
+                restore_auto_scroll = saved_auto_scroll
+            if self._pending_batch:
+                self._loading_off_restore = (restore_auto_scroll, was_at_bottom, old_value)
             else:
-                # Otherwise keep current position
-                scrollbar.setValue(old_value)
-                
-                # Show scroll button if not at bottom
-                if not self._is_at_bottom() and hasattr(self, '_scroll_button'):
-                    self._scroll_button.show_animated()
+                self._finish_loading_off(restore_auto_scroll, was_at_bottom, old_value)
             
             # Reset scroll preservation flag
             self._preserve_scroll_state = False
@@ -926,6 +1560,33 @@ class ModernLogger(QTextEdit):
             if hasattr(self, '_pre_inline_auto_scroll_state'):
                 self._auto_scroll_enabled = self._pre_inline_auto_scroll_state
     
+    def _finish_loading_off(self, auto_scroll, was_at_bottom, old_value):
+        """
+        Restore auto-scroll and the scroll position once the messages queued while loading are shown
+        
+        Args:
+            auto_scroll (bool): Auto-scroll state to restore
+            was_at_bottom (bool): Whether the view was at the bottom when loading ended
+            old_value (int): Scroll position when loading ended
+        """
+        self._auto_scroll_enabled = auto_scroll
+        
+        # Handle final scrolling decision
+        if self._auto_scroll_enabled and was_at_bottom:
+            # Only auto-scroll if we were at bottom and auto-scroll is now enabled
+            QTimer.singleShot(10, self._do_auto_scroll)
+            
+            # Hide scroll button since we'll be at bottom - use immediate hide
+            if hasattr(self, '_scroll_button'):
+                self._scroll_button.hide()
+        else:
+            # Otherwise keep current position
+            self.verticalScrollBar().setValue(old_value)
+            
+            # Show scroll button if not at bottom
+            if not self._is_at_bottom() and hasattr(self, '_scroll_button'):
+                self._scroll_button.show_animated()
+    
     def _ensure_loading_indicator_hidden(self):
         """Make sure all loading indicators are hidden"""
         if hasattr(self, '_line_indicator'):
@@ -933,13 +1594,18 @@ class ModernLogger(QTextEdit):
     
     def clear(self):
         """Clear the console content"""
+        if not self._inbox.on_owner_thread():
+            self._inbox.push((self.clear, ()))
+            return
+        
         try:
             # Call the parent class's clear method
             super().clear()
             
             # Reset any internal state that might be affected by clearing
             self._first_content = True
-            self._progress_message_id = None
+            
+            # Progress lines stay active and start over at the end on their next update
             
             # Clear only the pending batch, not the queued messages
             self._pending_batch.clear()
@@ -1036,8 +1702,9 @@ class ModernLogger(QTextEdit):
         scrollbar = self.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
         
-        # Force immediate update
-        self.repaint()
+        # Force immediate update, unless painting is left to the event loop
+        if self._auto_process_events:
+            self.repaint()
         
         # Hide the scroll button since we're at bottom
         if hasattr(self, '_scroll_button'):
@@ -1178,7 +1845,8 @@ class ModernLogger(QTextEdit):
     
     def _process_events_if_needed(self):
         """Process events if auto_process_events is enabled and enough time has passed"""
-        if not self._auto_process_events:
+        if not self._auto_process_events or self._processing_events:
+            # Never pump the loop from inside an event that the pump itself dispatched
             return False
         
         current_time = time.time()
@@ -1199,7 +1867,11 @@ class ModernLogger(QTextEdit):
             
         # Process events if needed
         if should_process:
-            QApplication.processEvents()
+            self._processing_events = True
+            try:
+                QApplication.processEvents()
+            finally:
+                self._processing_events = False
             self._event_processing_count = 0
             self._last_event_process_time = current_time
             return True
@@ -1232,10 +1904,24 @@ class ModernLogger(QTextEdit):
         """
         return self._auto_process_events
     
+    def set_indicator_frame_rate(self, fps):
+        """
+        Set the frame rate of the loading indicator animation
+        
+        Args:
+            fps (int): Frames per second
+        """
+        self._line_indicator.set_frame_rate(fps)
+    
     def set_event_processing(self, enabled, threshold=5):
         """
         Configure automatic event processing.
         
+        Disabling it gives event-loop-friendly operation: logging never pumps
+        the event loop or forces a repaint. Combine with set_flush_rate() so
+        bursts are applied once per frame, and watch flush_metrics() for the
+        worst UI-thread stall per flush.
+        
         Args:
             enabled (bool): Whether to automatically process events
             threshold (int): Number of operations before processing events
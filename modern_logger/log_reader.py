@@ -0,0 +1,437 @@
+"""
+Text log file reader for Modern Logger.
+
+FileLogger output can grow to several gigabytes, far beyond the records
+kept in memory. This module loads it back without reading it all:
+- LogFileReader, which memory-maps a file written in the FileLogger line
+  format, keeps a sparse index of byte offsets with the time and level
+  range of each block, and answers time-range and level queries by
+  scanning only the blocks that can match. The index is saved next to
+  the log file (filename.idx) and extended, not rebuilt, when the file
+  has grown since
+"""
+
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .logger import Logger, LogRecord
+
+# Start of a record line: "[timestamp] [LEVEL]", then padding to 8 characters and one space
+_RECORD_START = re.compile(rb"^\[([^\]\n]+)\] \[([A-Z]+)\]", re.MULTILINE)
+
+_INDEX_MAGIC = b"MLIX"
+_INDEX_VERSION = 1
+# magic, version, block size, indexed bytes, CRC of the file's first bytes, timestamp format length
+_INDEX_HEADER = struct.Struct("<4sBIQIH")
+# offset, record count, earliest time, latest time, lowest level, highest level
+_INDEX_ENTRY = struct.Struct("<QIddHH")
+# Bytes at the start of the log file whose checksum identifies it (a rotated file starts over)
+_PREFIX_BYTES = 4096
+
+
+class LogFileReader:
+    """Memory-mapped, indexed reader of FileLogger text logs"""
+
+    def __init__(self,
+                 path: str,
+                 timestamp_format: str = "%Y-%m-%d %H:%M:%S",
+                 block_size: int = 256 * 1024,
+                 persist_index: bool = True,
+                 logger_name: Optional[str] = None):
+        """
+        Open a log file, loading or building its index
+
+        Args:
+            path (str): Log file written by FileLogger
+            timestamp_format (str, optional): Timestamp format the file was written with.
+                Defaults to "%Y-%m-%d %H:%M:%S" (the FileLogger default).
+            block_size (int, optional): Bytes covered by one index entry. Defaults to 256 KB.
+            persist_index (bool, optional): Save the index to path + ".idx". Defaults to True.
+            logger_name (Optional[str], optional): logger_name of the records returned.
+                Defaults to None (the file name).
+        """
+        self.path = path
+        self.timestamp_format = timestamp_format
+        self.block_size = max(4096, block_size)
+        self.persist_index = persist_index
+        self.logger_name = logger_name if logger_name is not None else os.path.basename(path)
+        self.index_path = path + ".idx"
+
+        self._file = None
+        self._mmap: Any = None
+        self._data: Any = b""
+        self._indexed = 0  # Bytes covered by the index (complete lines only)
+        self._indexed_crc = 0  # Checksum of the file's first bytes when they were indexed
+        self._entries: List[Tuple[int, int, float, float, int, int]] = []
+        self._times: Dict[bytes, float] = {}
+        self._level_numbers = {name.encode(): level for level, name in Logger.LEVEL_NAMES.items()}
+        self._levels: Dict[bytes, Tuple[int, str, int]] = {}
+
+        self._map()
+        if not self._load_index():
+            self._entries = []
+            self._indexed = 0
+        self.refresh()
+
+    @property
+    def block_count(self) -> int:
+        """Number of index entries"""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Bytes of the file covered by the index"""
+        return self._indexed
+
+    def close(self) -> None:
+        """Unmap and close the file"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._data = b""
+
+    def __enter__(self) -> "LogFileReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return self.records()
+
+    def _map(self, reopen: bool = False) -> None:
+        """Map the current contents of the file, opening the file now at path if reopen is set"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if reopen and self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._file is None:
+            self._file = open(self.path, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = self._mmap if self._mmap is not None else b""
+
+    def refresh(self) -> int:
+        """
+        Index lines appended to the file since it was opened or last refreshed
+
+        If the file was replaced (e.g. by rotation), the file now at path is
+        opened. If it was truncated or rewritten, the index is rebuilt.
+
+        Returns:
+            int: Number of bytes newly indexed
+        """
+        replaced = self._replaced()
+        if replaced or os.fstat(self._file.fileno()).st_size != len(self._data):
+            self._map(reopen=replaced)
+        data = self._data
+        if self._indexed and (self._indexed > len(data) or self._prefix_crc(self._indexed) != self._indexed_crc):
+            # The indexed lines are gone; offsets and time ranges no longer match the file
+            self._entries = []
+            self._indexed = 0
+        # Only complete lines are indexed; a line being written is picked up next time
+        end = data.rfind(b"\n") + 1
+        if end <= self._indexed:
+            return 0
+
+        # The last block may have been cut short by the end of the file; index it again
+        start = self._indexed
+        if self._entries and start - self._entries[-1][0] < self.block_size:
+            start = self._entries.pop()[0]
+        indexed_before = self._indexed
+        self._index_range(start, end)
+        self._indexed = end
+        self._indexed_crc = self._prefix_crc(end)
+        if self.persist_index:
+            self._save_index()
+        return end - indexed_before
+
+    def _index_range(self, start: int, end: int) -> None:
+        """Append index entries for the records in data[start:end]"""
+        data = self._data
+        find_all = _RECORD_START.findall
+        pos = start
+        while pos < end:
+            block_end = end
+            if pos + self.block_size < end:
+                # Blocks end where a record starts, so multi-line messages stay in one block
+                match = _RECORD_START.search(data, pos + self.block_size, end)
+                if match:
+                    block_end = match.start()
+            found = find_all(data, pos, block_end)
+            if found:
+                times = [self._parse_time(ts) for ts in set(ts for ts, _ in found)]
+                levels = [self._level_number(name) for name in set(name for _, name in found)]
+                self._entries.append((pos, len(found), min(times), max(times), min(levels), max(levels)))
+            pos = block_end
+
+    def _parse_time(self, timestamp: bytes) -> float:
+        """Convert a timestamp to epoch seconds, caching repeated timestamps"""
+        times = self._times
+        created = times.get(timestamp)
+        if created is None:
+            if len(times) >= 100000:
+                times.clear()
+            try:
+                created = datetime.strptime(timestamp.decode(), self.timestamp_format).timestamp()
+            except ValueError:
+                created = 0.0
+            times[timestamp] = created
+        return created
+
+    def _level_number(self, name: bytes) -> int:
+        """Convert a level name to its number (0 for unknown names)"""
+        return self._level_numbers.get(name, 0)
+
+    def _level_info(self, name: bytes) -> Tuple[int, str, int]:
+        """
+        Get the number, name and message offset of a level
+
+        Returns:
+            Tuple[int, str, int]: Level number, level name, and the characters between the
+                level's closing bracket and the message (see FileLogger._format_message)
+        """
+        info = self._levels.get(name)
+        if info is None:
+            text = name.decode()
+            level = self._level_numbers.get(name, 0)
+            info = self._levels[name] = (level, Logger.LEVEL_NAMES.get(level, text), max(0, 8 - len(text)) + 1)
+        return info
+
+    def _prefix_crc(self, indexed: int) -> int:
+        """Checksum of the start of the file, up to the indexed bytes"""
+        return zlib.crc32(self._data[:min(_PREFIX_BYTES, indexed)])
+
+    def _replaced(self) -> bool:
+        """Whether path now names another file than the one open (e.g. after rotation)"""
+        try:
+            current = os.stat(self.path)
+        except OSError:
+            # Between the rotation's rename and the new file's creation; keep reading the old one
+            return False
+        opened = os.fstat(self._file.fileno())
+        return (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev)
+
+    def _load_index(self) -> bool:
+        """
+        Load the saved index if it belongs to this file
+
+        Returns:
+            bool: True if a valid index was loaded
+        """
+        if not self.persist_index or not os.path.exists(self.index_path):
+            return False
+        try:
+            with open(self.index_path, 'rb') as f:
+                raw = f.read()
+            magic, version, block_size, indexed, crc, format_length = _INDEX_HEADER.unpack_from(raw, 0)
+            offset = _INDEX_HEADER.size
+            timestamp_format = raw[offset:offset + format_length].decode()
+            offset += format_length
+            if (magic != _INDEX_MAGIC or version != _INDEX_VERSION or block_size != self.block_size
+                    or timestamp_format != self.timestamp_format
+                    or indexed > len(self._data) or crc != self._prefix_crc(indexed)):
+                # Another file (e.g. rotated and recreated), or written with other settings
+                return False
+            self._entries = list(_INDEX_ENTRY.iter_unpack(raw[offset:]))
+            self._indexed = indexed
+            self._indexed_crc = crc
+            return True
+        except Exception as e:
+            print(f"Error loading log index, rebuilding it: {e}", file=sys.stderr)
+            return False
+
+    def _save_index(self) -> None:
+        """Write the index next to the log file, replacing the old one atomically"""
+        try:
+            timestamp_format = self.timestamp_format.encode()
+            parts = [_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, self.block_size, self._indexed,
+                                        self._indexed_crc, len(timestamp_format)), timestamp_format]
+            pack = _INDEX_ENTRY.pack
+            parts.extend(pack(*entry) for entry in self._entries)
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(b"".join(parts))
+            os.replace(temp_path, self.index_path)
+        except Exception as e:
+            print(f"Error saving log index: {e}", file=sys.stderr)
+
+    def _blocks(self, level_filter, start_time, end_time) -> Iterator[Tuple[int, int, int, bool]]:
+        """
+        Yield (start, end, record count, fully matches) for blocks that can hold matching records
+
+        A block fully matches when every record in it passes the filters.
+        """
+        min_level = level_filter if level_filter is not None else -1
+        entries = self._entries
+        for i, (offset, count, earliest, latest, lowest, highest) in enumerate(entries):
+            if highest < min_level:
+                continue
+            if (start_time is not None and latest < start_time) or (end_time is not None and earliest >= end_time):
+                continue
+            end = entries[i + 1][0] if i + 1 < len(entries) else self._indexed
+            full = (lowest >= min_level and (start_time is None or earliest >= start_time)
+                    and (end_time is None or latest < end_time))
+            yield offset, end, count, full
+
+    @staticmethod
+    def _time_range(start_time, end_time) -> Tuple[Optional[float], Optional[float]]:
+        """Convert datetime bounds to epoch seconds"""
+        if isinstance(start_time, datetime):
+            start_time = start_time.timestamp()
+        if isinstance(end_time, datetime):
+            end_time = end_time.timestamp()
+        return start_time, end_time
+
+    def records(self,
+                level_filter: Optional[int] = None,
+                start_time: Optional[Union[datetime, float]] = None,
+                end_time: Optional[Union[datetime, float]] = None,
+                limit: Optional[int] = None) -> Iterator[LogRecord]:
+        """
+        Iterate over records in file order with optional filtering
+
+        Only index blocks whose time and level range overlap the filters are read.
+        Like Logger.export_log(), limit keeps the most recent matching records.
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            limit (Optional[int]): Maximum number of records to return (most recent)
+
+        Returns:
+            Iterator[LogRecord]: Matching records; multi-line messages are returned whole
+        """
+        start_time, end_time = self._time_range(start_time, end_time)
+        min_level = level_filter if level_filter is not None else -1
+        blocks = self._blocks(level_filter, start_time, end_time)
+        if limit is None:
+            for block_start, block_end, _, full in blocks:
+                yield from self._block_records(block_start, block_end, full, min_level, start_time, end_time)
+            return
+        if limit <= 0:
+            return
+
+        # Walk the index from the end so only the blocks holding the last matches are read
+        tail: List[List[LogRecord]] = []
+        found = 0
+        for block_start, block_end, _, full in reversed(list(blocks)):
+            tail.append(list(self._block_records(block_start, block_end, full, min_level, start_time, end_time)))
+            found += len(tail[-1])
+            if found >= limit:
+                break
+        skip = max(found - limit, 0)
+        for matches in reversed(tail):
+            yield from matches[skip:]
+            skip = 0
+
+    def _block_records(self, block_start, block_end, full, min_level, start_time, end_time) -> Iterator[LogRecord]:
+        """Yield the matching records of one index block; full blocks skip the filter checks"""
+        data = self._data
+        name = self.logger_name
+        parse_time = self._parse_time
+        level_info = self._level_info
+        matches = list(_RECORD_START.finditer(data, block_start, block_end))
+        ends = [match.start() - 1 for match in matches[1:]]
+        ends.append(block_end - 1)
+        for match, message_end in zip(matches, ends):
+            timestamp, level_name = match.group(1, 2)
+            level, level_text, padding = level_info(level_name)
+            if not full:
+                if level < min_level:
+                    continue
+                created = parse_time(timestamp)
+                if (start_time is not None and created < start_time) or (end_time is not None and created >= end_time):
+                    continue
+            else:
+                created = parse_time(timestamp)
+
+            message_start = match.end() + padding
+            message = str(data[message_start:max(message_start, message_end)], 'utf-8', 'replace')
+            if "\r" in message:
+                # CRLF line endings read as plain newlines, as in a file opened in text mode
+                message = message.replace("\r\n", "\n")
+                if message.endswith("\r"):
+                    message = message[:-1]
+            yield LogRecord(created, level, level_text, message, name)
+
+    def count(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[Union[datetime, float]] = None,
+              end_time: Optional[Union[datetime, float]] = None) -> int:
+        """
+        Count matching records; blocks that fully match are counted from the index alone
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+
+        Returns:
+            int: Number of matching records
+        """
+        start_time, end_time = self._time_range(start_time, end_time)
+        min_level = level_filter if level_filter is not None else -1
+        data = self._data
+        parse_time = self._parse_time
+        level_number = self._level_number
+        total = 0
+        for block_start, block_end, count, full in self._blocks(level_filter, start_time, end_time):
+            if full:
+                total += count
+                continue
+            # Records sharing a timestamp and level are checked once
+            for (timestamp, level_name), matches in Counter(_RECORD_START.findall(data, block_start, block_end)).items():
+                if level_number(level_name) < min_level:
+                    continue
+                created = parse_time(timestamp)
+                if (start_time is None or created >= start_time) and (end_time is None or created < end_time):
+                    total += matches
+        return total
+
+    def export(self,
+               filepath: str,
+               format_type: str = "log",
+               level_filter: Optional[int] = None,
+               limit: Optional[int] = None,
+               start_time: Optional[Union[datetime, float]] = None,
+               end_time: Optional[Union[datetime, float]] = None) -> bool:
+        """
+        Export matching records to one of the Logger.export_log() formats
+
+        Args:
+            filepath (str): Output file path
+            format_type (str): Export format ('log', 'csv', 'xml', 'json', 'jsonl', 'binary')
+            level_filter (Optional[int]): Minimum level to include
+            limit (Optional[int]): Maximum number of records to export (most recent)
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+
+        Returns:
+            bool: True if export successful, False otherwise
+        """
+        format_type = format_type.lower()
+        if format_type not in Logger.EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format_type}. Supported formats: {', '.join(Logger.EXPORT_FORMATS)}")
+
+        total = self.count(level_filter, start_time, end_time)
+        if limit is not None:
+            total = min(total, max(limit, 0))
+        if not total:
+            return False
+        exporter = Logger(name=self.logger_name)
+        exporter.set_timestamp_format(self.timestamp_format)
+        return exporter._write_export(filepath, format_type, self.records(level_filter, start_time, end_time, limit), total)
@@ -14,28 +14,56 @@ import time
 import logging
 import json
 import csv
-import xml.etree.ElementTree as ET
+import gzip
+import shutil
+import threading
+from operator import attrgetter
+from xml.sax.saxutils import escape, quoteattr
 from datetime import datetime
-from typing import List, Optional, Union, TextIO, Dict, Any
+from typing import Callable, List, Optional, Union, TextIO, Dict, Any, Tuple, Iterable
 import traceback
 import inspect
 import colorama
 from colorama import Fore, Back, Style
 
+from .record_store import RecordStore, ColumnarRecordStore
+from .writers import BackgroundWriter
+from .coalescing import MessageCoalescer
+from .concurrency import TimedLock
+from .timestamps import get_timestamp_formatter
+
 # Initialize colorama for cross-platform colored terminal output
 colorama.init()
 
 
 class LogRecord:
-    """Class to store individual log records for export functionality"""
+    """
+    Class to store individual log records for export functionality
+    
+    Records are kept compact because a logger retains up to _max_records of
+    them: attributes live in __slots__, the time is stored as an epoch float
+    in `created` and level names are interned. The `timestamp` datetime is
+    only built when an exporter or to_dict() asks for it.
+    """
+    
+    __slots__ = ('created', 'level', 'level_name', 'message', 'logger_name')
     
-    def __init__(self, timestamp: datetime, level: int, level_name: str, message: str, logger_name: str = ""):
-        self.timestamp = timestamp
+    def __init__(self, timestamp: Union[datetime, float], level: int, level_name: str, message: str, logger_name: str = ""):
+        self.created = timestamp.timestamp() if isinstance(timestamp, datetime) else timestamp
         self.level = level
-        self.level_name = level_name
+        self.level_name = sys.intern(level_name)
         self.message = message
         self.logger_name = logger_name
     
+    @property
+    def timestamp(self) -> datetime:
+        """Record time as a local datetime"""
+        return datetime.fromtimestamp(self.created)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.created = value.timestamp()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert log record to dictionary"""
         return {
@@ -66,6 +94,20 @@ class Logger:
         CRITICAL: "CRITICAL"
     }
     
+    # Supported export formats
+    EXPORT_FORMATS = ('log', 'csv', 'xml', 'json', 'jsonl', 'binary')
+    
+    # Write buffer used by exporters
+    EXPORT_BUFFER_SIZE = 1024 * 1024
+    
+    # Placeholder styles for positional message arguments
+    FORMAT_STYLES = ('%', '{')
+    
+    # Records a thread buffers before merging them into the shared record store
+    THREAD_BUFFER_SIZE = 64
+    # Buffered records at which a thread waits for a busy store instead of buffering more
+    THREAD_BUFFER_LIMIT = 16384
+    
     def __init__(self, name: str = "ModernLogger", level: int = INFO):
         """
         Initialize the logger
@@ -76,9 +118,44 @@ class Logger:
         """
         self.name = name
         self.level = level
+        self.format_style = '%'  # Placeholder style for positional message arguments
         self._timestamp_format = "%Y-%m-%d %H:%M:%S"
-        self._records: List[LogRecord] = []  # Store log records for export
+        self._timestamp_formatter = get_timestamp_formatter(self._timestamp_format)
         self._max_records = 10000  # Maximum records to keep in memory
+        self._records = RecordStore(self._max_records)  # Store log records for export
+        self._newest_created = float('-inf')  # Newest created time merged into the store
+        self._coalescer: Optional[MessageCoalescer] = None  # Duplicate-message coalescing, off by default
+        self._filters: Tuple[Any, ...] = ()  # Flood filters run before a record is created
+        self._init_concurrency()
+    
+    def _init_concurrency(self) -> None:
+        """Create the locks and per-thread record buffers (also after unpickling)"""
+        # Guards the record store; threads append to their own buffer and merge in batches
+        self._records_lock = TimedLock("records")
+        # Serializes writes to the destination so lines and rotations never interleave
+        self._sink_lock = TimedLock("sink")
+        self._local = threading.local()
+        self._thread_buffers: List[Tuple[threading.Thread, list]] = []
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        with self._records_lock:
+            self._sync_records()
+        state = self.__dict__.copy()
+        # Thread-local buffers belong to the threads of this process
+        del state['_local'], state['_thread_buffers']
+        # Coalescing state holds a lock and timer; only its window is carried over
+        coalescer = state.pop('_coalescer', None)
+        state['_coalesce_window'] = coalescer.window if coalescer is not None else None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        window = state.pop('_coalesce_window', None)
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._thread_buffers = []
+        self._coalescer = None
+        if window is not None:
+            self.set_coalescing(window)
     
     def set_level(self, level: int) -> None:
         """
@@ -89,6 +166,18 @@ class Logger:
         """
         self.level = level
     
+    def set_format_style(self, style: str) -> None:
+        """
+        Set how positional arguments are merged into messages
+        
+        Args:
+            style (str): '%' for %-style placeholders like the logging module (the default),
+                or '{' for str.format() placeholders
+        """
+        if style not in self.FORMAT_STYLES:
+            raise ValueError(f"Unsupported format style: {style}. Supported styles: {', '.join(self.FORMAT_STYLES)}")
+        self.format_style = style
+    
     def set_timestamp_format(self, format_str: str) -> None:
         """
         Set the timestamp format string
@@ -97,6 +186,7 @@ class Logger:
             format_str (str): Format string for datetime.strftime()
         """
         self._timestamp_format = format_str
+        self._timestamp_formatter = get_timestamp_formatter(format_str)
     
     def set_max_records(self, max_records: int) -> None:
         """
@@ -105,53 +195,301 @@ class Logger:
         Args:
             max_records (int): Maximum number of records to keep
         """
-        self._max_records = max_records
-        # Trim records if current count exceeds new limit
-        if len(self._records) > max_records:
-            self._records = self._records[-max_records:]
+        with self._records_lock:
+            self._max_records = max_records
+            self._sync_records()
+            # Resizing drops the oldest records if current count exceeds new limit
+            self._records.resize(max_records)
+    
+    def set_coalescing(self, window: Optional[float] = 1.0) -> None:
+        """
+        Collapse runs of identical consecutive messages
+        
+        The first of a run of identical (level, message) records is logged
+        as usual. Repeats are counted instead of stored and written, and one
+        "(repeated N more times)" record is logged when a different message
+        arrives, when the window ends, or on flush()/close(). Records this
+        logger passes on to other loggers (e.g. MultiLogger fan-out) are
+        summaries, so every sink sees the same collapsed stream.
+        
+        Args:
+            window (Optional[float], optional): Seconds of repeats covered by one summary,
+                or None to disable coalescing. Defaults to 1.0.
+        """
+        if self._coalescer is not None:
+            self._coalescer.flush()
+        self._coalescer = MessageCoalescer(self._emit, window) if window is not None else None
+    
+    def add_filter(self, log_filter: Any) -> None:
+        """
+        Add a filter that can suppress calls before a record is created
+        
+        Filters run in the order they were added, after the level check and
+        before the message is formatted. Filters on a logger inside a
+        MultiLogger apply to the records it receives, so each destination
+        can have its own limits.
+        
+        Args:
+            log_filter (LogFilter): Filter from modern_logger.filters (or any object with allow(level, message))
+        """
+        if log_filter not in self._filters:
+            self._filters = self._filters + (log_filter,)
+    
+    def remove_filter(self, log_filter: Any) -> None:
+        """
+        Remove a filter
+        
+        Args:
+            log_filter (LogFilter): Filter to remove
+        """
+        self._filters = tuple(f for f in self._filters if f is not log_filter)
+    
+    @property
+    def filters(self) -> Tuple[Any, ...]:
+        """Filters attached to this logger"""
+        return self._filters
+    
+    @property
+    def suppressed_count(self) -> int:
+        """Number of calls suppressed by this logger's filters"""
+        return sum(getattr(f, 'suppressed_count', 0) for f in self._filters)
+    
+    def _passes_filters(self, level: int, message: Any) -> bool:
+        """
+        Run the filters on a call
+        
+        Args:
+            level (int): Log level
+            message (Any): Message template as passed by the caller, or the formatted message
+                of a record that arrives already formatted
+            
+        Returns:
+            bool: True if no filter suppressed the call
+        """
+        for log_filter in self._filters:
+            if not log_filter.allow(level, message):
+                return False
+        return True
     
-    def _format_message(self, level: int, message: str) -> str:
+    def flush_coalesced(self) -> None:
+        """Log the summary of repeats suppressed by coalescing so far"""
+        if self._coalescer is not None:
+            self._coalescer.flush()
+    
+    def _format_message(self, level: int, message: str, created: Optional[float] = None) -> str:
         """
         Format a log message with timestamp and level
         
         Args:
             level (int): Log level
             message (str): Log message
+            created (Optional[float]): Record time in epoch seconds. Defaults to None (now).
             
         Returns:
             str: Formatted log message
         """
-        timestamp = datetime.now().strftime(self._timestamp_format)
+        timestamp = self._timestamp_formatter.format(created)
         level_name = self.LEVEL_NAMES.get(level, "UNKNOWN")
         return f"[{timestamp}] [{level_name}] {message}"
     
-    def _log(self, level: int, message: str) -> None:
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message of a level would be logged
+        
+        Use it to skip expensive work that only feeds a log message.
+        
+        Args:
+            level (int): Log level
+            
+        Returns:
+            bool: True if messages of this level are logged
+        """
+        return level >= self.level
+    
+    def _render_message(self, message: Any, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """
+        Build the final message text from a deferred message
+        
+        A callable message is called first. Positional arguments use %-style
+        formatting like the standard logging module, or str.format() if the
+        format style is '{' (see set_format_style()). Keyword arguments always
+        use str.format(). A message whose %-formatting fails, e.g. because it
+        has '{}' placeholders and no '%' ones, is formatted with str.format().
+        
+        Args:
+            message (Any): Message, format string or zero-argument callable
+            args (tuple): Positional format arguments
+            kwargs (Dict[str, Any]): Keyword format arguments
+            
+        Returns:
+            str: Message text
+        """
+        try:
+            if callable(message):
+                message = message()
+            if not isinstance(message, str):
+                message = str(message)
+            if kwargs or (args and self.format_style == '{'):
+                return message.format(*args, **kwargs)
+            if args:
+                try:
+                    # A single mapping argument enables %(name)s placeholders, as in the logging module
+                    if len(args) == 1 and isinstance(args[0], dict):
+                        return message % args[0]
+                    return message % args
+                except (TypeError, ValueError):
+                    if '{' not in message:
+                        raise
+                    return message.format(*args)
+            return message
+        except Exception:
+            print(f"Error formatting log message: {traceback.format_exc()}", file=sys.stderr)
+            # Keep whatever was logged rather than dropping the record
+            return f"{message} {args} {kwargs}" if kwargs else f"{message} {args}"
+    
+    def _log(self, level: int, message: Any, *args: Any, **kwargs: Any) -> None:
         """
         Log a message if level is sufficient
         
+        The message is only formatted after the level check and the filters pass.
+        
         Args:
             level (int): Log level
-            message (str): Log message
+            message (Any): Log message, format string or zero-argument callable
+            *args: Positional format arguments
+            **kwargs: Keyword format arguments
         """
         if level >= self.level:
-            timestamp = datetime.now()
+            if self._filters and not self._passes_filters(level, message):
+                return
+            if args or kwargs or message.__class__ is not str:
+                message = self._render_message(message, args, kwargs)
             level_name = self.LEVEL_NAMES.get(level, "UNKNOWN")
-            
-            # Store record for export functionality
-            record = LogRecord(timestamp, level, level_name, message, self.name)
-            self._records.append(record)
-            
-            # Limit memory usage by keeping only recent records
-            if len(self._records) > self._max_records:
-                self._records.pop(0)
-            
-            formatted = self._format_message(level, message)
-            self._write(formatted)
+            record = LogRecord(time.time(), level, level_name, message, self.name)
+            if self._coalescer is None:
+                self._emit(record)
+            else:
+                self._coalescer.submit(record)
+    
+    def _emit(self, record: LogRecord) -> None:
+        """
+        Store a record and write it to the log destination
+        
+        The record has already passed level filtering.
+        
+        Args:
+            record (LogRecord): Log record
+        """
+        # Store record for export functionality; the ring buffer evicts
+        # the oldest record once _max_records is reached
+        self._store_record(record)
+        
+        formatted = self._format_message(record.level, record.message, record.created)
+        self._write(formatted)
+    
+    def _emit_batch(self, records: List[LogRecord]) -> None:
+        """
+        Store and write a batch of records
+        
+        Used by front ends that hand records over in batches, such as
+        AsyncLogger. Sinks that can write several lines at once override it.
+        
+        Args:
+            records (List[LogRecord]): Log records that passed level filtering, oldest first
+        """
+        for record in records:
+            self._emit(record)
+    
+    def _store_record(self, record: LogRecord) -> None:
+        """
+        Append a record to the calling thread's buffer, merging all buffers into the store when full
+        
+        Appending to a thread's own buffer takes no lock. When a buffer is
+        full, every thread's buffer is merged in time order, without waiting if another thread holds the store (e.g. during
+        an export) and keeps growing until THREAD_BUFFER_LIMIT.
+        
+        Args:
+            record (LogRecord): Log record
+        """
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._new_thread_buffer()
+        buffer.append(record)
+        if len(buffer) >= self.THREAD_BUFFER_SIZE:
+            lock = self._records_lock
+            if lock.acquire(len(buffer) >= self.THREAD_BUFFER_LIMIT):
+                try:
+                    # Merge every thread's buffer, not just this one, so the store stays in time order
+                    self._sync_records()
+                finally:
+                    lock.release()
+    
+    def _new_thread_buffer(self) -> list:
+        """Create and register the calling thread's record buffer"""
+        buffer: list = []
+        with self._records_lock:
+            # Merge what finished threads left behind before forgetting their buffers
+            self._sync_records()
+            self._thread_buffers = [entry for entry in self._thread_buffers if entry[0].is_alive()]
+            self._thread_buffers.append((threading.current_thread(), buffer))
+        self._local.buffer = buffer
+        return buffer
+    
+    def _sync_records(self) -> None:
+        """Merge every thread buffer into the store in time order (records lock held)"""
+        pending = []
+        for _, buffer in self._thread_buffers:
+            count = len(buffer)
+            if count:
+                pending.append(buffer[:count])
+                del buffer[:count]
+        
+        if not pending:
+            return
+        store = self._records
+        append = store.append
+        newest = self._newest_created
+        records = pending[0]
+        if len(pending) > 1:
+            # Each buffer is already in time order; the sort merges these runs
+            records = [record for buffer in pending for record in buffer]
+            records.sort(key=attrgetter('created'))
+        for record in records:
+            if record.created >= newest:
+                append(record)
+                newest = record.created
+            else:
+                # Created before a stored record, e.g. by a thread preempted before it buffered the record
+                store.insert(record)
+        self._newest_created = newest
+    
+    def lock_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get contention and hold-time statistics of this logger's locks
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: 'records' (record store) and 'sink' (destination writes) lock statistics,
+                see TimedLock.stats()
+        """
+        return {
+            'records': self._records_lock.stats(),
+            'sink': self._sink_lock.stats(),
+        }
+    
+    def reset_lock_stats(self) -> None:
+        """Reset the lock statistics"""
+        self._records_lock.reset_stats()
+        self._sink_lock.reset_stats()
     
     def _write(self, message: str) -> None:
         """
         Write a message to the log destination
         
+        Called from any thread. Subclasses that write to a shared destination
+        hold self._sink_lock around the write, or hand the message to a
+        single writer thread that does.
+        
         Args:
             message (str): Formatted log message
         """
@@ -159,53 +497,134 @@ class Logger:
         # Subclasses should override this
         pass
     
-    def get_records(self, level_filter: Optional[int] = None, limit: Optional[int] = None) -> List[LogRecord]:
+    def get_records(self,
+                    level_filter: Optional[int] = None,
+                    limit: Optional[int] = None,
+                    start_time: Optional[Union[datetime, float]] = None,
+                    end_time: Optional[Union[datetime, float]] = None,
+                    logger_name: Optional[str] = None) -> List[LogRecord]:
         """
         Get stored log records with optional filtering
         
         Args:
             level_filter (Optional[int]): Minimum level to include
             limit (Optional[int]): Maximum number of records to return
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
             
         Returns:
             List[LogRecord]: Filtered log records
         """
-        records = self._records
+        if isinstance(start_time, datetime):
+            start_time = start_time.timestamp()
+        if isinstance(end_time, datetime):
+            end_time = end_time.timestamp()
         
-        if level_filter is not None:
-            records = [r for r in records if r.level >= level_filter]
+        with self._records_lock:
+            self._sync_records()
+            return self._records.query(level_filter, start_time, end_time, logger_name, limit)
+    
+    def set_record_store(self, store: Union[RecordStore, ColumnarRecordStore]) -> None:
+        """
+        Replace the in-memory record store, keeping the records already stored
         
-        if limit is not None:
-            records = records[-limit:]
+        Use a ColumnarRecordStore for large retention limits where level,
+        time-range and logger-name queries should run as vectorized masks,
+        or a TieredRecordStore to spill older records to disk. The store
+        keeps the capacity it was created with, which becomes this logger's
+        max_records; records beyond it are evicted (or spilled) oldest first.
         
-        return records
+        Args:
+            store (Union[RecordStore, ColumnarRecordStore]): New record store
+        """
+        with self._records_lock:
+            self._sync_records()
+            self._max_records = store.capacity
+            for record in self._records:
+                store.append(record)
+            self._records = store
     
     def clear_records(self) -> None:
         """Clear all stored log records"""
-        self._records.clear()
+        with self._records_lock:
+            self._sync_records()
+            self._records.clear()
+            self._newest_created = float('-inf')
     
-    def export_log(self, filepath: str, format_type: str = "log", level_filter: Optional[int] = None, limit: Optional[int] = None) -> bool:
+    def export_log(self,
+                   filepath: str,
+                   format_type: str = "log",
+                   level_filter: Optional[int] = None,
+                   limit: Optional[int] = None,
+                   start_time: Optional[Union[datetime, float]] = None,
+                   end_time: Optional[Union[datetime, float]] = None,
+                   logger_name: Optional[str] = None) -> bool:
         """
         Export log records to file in specified format
         
         Args:
             filepath (str): Output file path
-            format_type (str): Export format ('log', 'csv', 'xml', 'json')
+            format_type (str): Export format ('log', 'csv', 'xml', 'json', 'jsonl', 'binary')
             level_filter (Optional[int]): Minimum level to include
             limit (Optional[int]): Maximum number of records to export
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
             
         Returns:
             bool: True if export successful, False otherwise
         """
         format_type = format_type.lower()
         
-        if format_type not in ['log', 'csv', 'xml', 'json']:
-            raise ValueError(f"Unsupported format: {format_type}. Supported formats: log, csv, xml, json")
+        if format_type not in self.EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format_type}. Supported formats: {', '.join(self.EXPORT_FORMATS)}")
+        
+        if isinstance(start_time, datetime):
+            start_time = start_time.timestamp()
+        if isinstance(end_time, datetime):
+            end_time = end_time.timestamp()
         
-        records = self.get_records(level_filter, limit)
-        if not records:
+        # Logging threads keep appending to their own buffers while the store is held
+        with self._records_lock:
+            self._sync_records()
+            return self._export_records(filepath, format_type, level_filter, limit, start_time, end_time, logger_name)
+    
+    def _export_records(self,
+                        filepath: str,
+                        format_type: str,
+                        level_filter: Optional[int],
+                        limit: Optional[int],
+                        start_time: Optional[float],
+                        end_time: Optional[float],
+                        logger_name: Optional[str]) -> bool:
+        """Export the stored records matching the filters (records lock held)"""
+        if limit is not None:
+            # A limited export is bounded by limit, so the records can be collected up front
+            records = self._records.query(level_filter, start_time, end_time, logger_name, limit)
+            total = len(records)
+        else:
+            # Stream straight from the store so memory does not grow with the record count
+            total = self._records.count(level_filter, start_time, end_time, logger_name)
+            records = self._records.iter_query(level_filter, start_time, end_time, logger_name)
+        
+        if not total:
             return False
+        return self._write_export(filepath, format_type, records, total)
+    
+    def _write_export(self, filepath: str, format_type: str, records: Iterable[LogRecord], total: int) -> bool:
+        """
+        Write records to a file in an export format
         
+        Args:
+            filepath (str): Output file path
+            format_type (str): Export format, one of EXPORT_FORMATS
+            records (Iterable[LogRecord]): Records to export, oldest first
+            total (int): Number of records
+            
+        Returns:
+            bool: True if export successful, False otherwise
+        """
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else '.', exist_ok=True)
@@ -215,21 +634,25 @@ class Logger:
             elif format_type == 'csv':
                 return self._export_csv_format(filepath, records)
             elif format_type == 'xml':
-                return self._export_xml_format(filepath, records)
+                return self._export_xml_format(filepath, records, total)
             elif format_type == 'json':
-                return self._export_json_format(filepath, records)
+                return self._export_json_format(filepath, records, total)
+            elif format_type == 'jsonl':
+                return self._export_jsonl_format(filepath, records)
+            elif format_type == 'binary':
+                return self._export_binary_format(filepath, records)
         except Exception as e:
             print(f"Error exporting logs: {e}", file=sys.stderr)
             return False
         
         return False
     
-    def _export_log_format(self, filepath: str, records: List[LogRecord]) -> bool:
+    def _export_log_format(self, filepath: str, records: Iterable[LogRecord]) -> bool:
         """Export records in standard log format"""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
                 for record in records:
-                    timestamp_str = record.timestamp.strftime(self._timestamp_format)
+                    timestamp_str = self._timestamp_formatter.format(record.created)
                     # Calculate padding for alignment
                     padding = " " * (8 - len(record.level_name))
                     f.write(f"[{timestamp_str}] [{record.level_name}]{padding} {record.message}\n")
@@ -237,10 +660,10 @@ class Logger:
         except Exception:
             return False
     
-    def _export_csv_format(self, filepath: str, records: List[LogRecord]) -> bool:
+    def _export_csv_format(self, filepath: str, records: Iterable[LogRecord]) -> bool:
         """Export records in CSV format"""
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 # Write header
                 writer.writerow(['Timestamp', 'Level', 'Level_Name', 'Logger_Name', 'Message'])
@@ -257,114 +680,168 @@ class Logger:
         except Exception:
             return False
     
-    def _export_xml_format(self, filepath: str, records: List[LogRecord]) -> bool:
-        """Export records in XML format"""
+    def _export_xml_format(self, filepath: str, records: Iterable[LogRecord], total: int) -> bool:
+        """Export records in XML format, writing one <log> element at a time"""
         try:
-            root = ET.Element("logs")
-            root.set("exported_at", datetime.now().isoformat())
-            root.set("total_records", str(len(records)))
-            
-            for record in records:
-                log_elem = ET.SubElement(root, "log")
-                
-                timestamp_elem = ET.SubElement(log_elem, "timestamp")
-                timestamp_elem.text = record.timestamp.isoformat()
+            with open(filepath, 'w', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+                f.write(f"<logs exported_at={quoteattr(datetime.now().isoformat())} total_records=\"{total}\">\n")
                 
-                level_elem = ET.SubElement(log_elem, "level")
-                level_elem.text = str(record.level)
-                
-                level_name_elem = ET.SubElement(log_elem, "level_name")
-                level_name_elem.text = record.level_name
-                
-                logger_elem = ET.SubElement(log_elem, "logger_name")
-                logger_elem.text = record.logger_name
+                for record in records:
+                    f.write(
+                        f"<log>"
+                        f"<timestamp>{record.timestamp.isoformat()}</timestamp>"
+                        f"<level>{record.level}</level>"
+                        f"<level_name>{escape(record.level_name)}</level_name>"
+                        f"<logger_name>{escape(record.logger_name)}</logger_name>"
+                        f"<message>{escape(record.message)}</message>"
+                        f"</log>\n"
+                    )
                 
-                message_elem = ET.SubElement(log_elem, "message")
-                message_elem.text = record.message
-            
-            tree = ET.ElementTree(root)
-            tree.write(filepath, encoding='utf-8', xml_declaration=True)
+                f.write("</logs>\n")
             return True
         except Exception:
             return False
     
-    def _export_json_format(self, filepath: str, records: List[LogRecord]) -> bool:
-        """Export records in JSON format"""
+    def _export_json_format(self, filepath: str, records: Iterable[LogRecord], total: int) -> bool:
+        """Export records in JSON format, writing one log object at a time"""
         try:
-            export_data = {
-                "metadata": {
-                    "exported_at": datetime.now().isoformat(),
-                    "total_records": len(records),
-                    "logger_name": self.name
-                },
-                "logs": [record.to_dict() for record in records]
+            metadata = {
+                "exported_at": datetime.now().isoformat(),
+                "total_records": total,
+                "logger_name": self.name
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'w', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                f.write('{\n  "metadata": ')
+                f.write(json.dumps(metadata, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+                f.write(',\n  "logs": [')
+                
+                # Reuse one encoder; json.dumps with options builds a new one per call
+                encode = json.JSONEncoder(ensure_ascii=False).encode
+                separator = "\n    "
+                for record in records:
+                    f.write(separator)
+                    f.write(encode(record.to_dict()))
+                    separator = ",\n    "
+                
+                f.write("\n  ]\n}\n")
+            return True
+        except Exception:
+            return False
+    
+    def _export_jsonl_format(self, filepath: str, records: Iterable[LogRecord]) -> bool:
+        """Export records in JSON Lines format, one JSON object per line"""
+        try:
+            encode = json.JSONEncoder(ensure_ascii=False).encode
+            with open(filepath, 'w', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                for record in records:
+                    f.write(encode(record.to_dict()))
+                    f.write("\n")
+            return True
+        except Exception:
+            return False
+    
+    def _export_binary_format(self, filepath: str, records: Iterable[LogRecord]) -> bool:
+        """Export records in the compact binary format read by BinaryLogReader"""
+        # Imported here because binary_log builds on this module
+        from .binary_log import BinaryRecordEncoder, HEADER
+        try:
+            encoder = BinaryRecordEncoder()
+            with open(filepath, 'wb', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                f.write(HEADER)
+                f.write(encoder.sync())
+                chunk: List[LogRecord] = []
+                for record in records:
+                    chunk.append(record)
+                    if len(chunk) >= 4096:
+                        f.write(encoder.encode(chunk))
+                        chunk.clear()
+                f.write(encoder.encode(chunk))
             return True
         except Exception:
             return False
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: Union[str, Callable[[], str]], *args: Any, **kwargs: Any) -> None:
         """
         Log a debug message
         
         Args:
-            message (str): Debug message
+            message (Union[str, Callable[[], str]]): Debug message, format string or zero-argument callable
+            *args: %-style (or {}-style) arguments, formatted only if the message is logged
+            **kwargs: {}-style keyword arguments, formatted only if the message is logged
         """
-        self._log(self.DEBUG, message)
+        if self.DEBUG >= self.level:
+            self._log(self.DEBUG, message, *args, **kwargs)
     
-    def info(self, message: str) -> None:
+    def info(self, message: Union[str, Callable[[], str]], *args: Any, **kwargs: Any) -> None:
         """
         Log an info message
         
         Args:
-            message (str): Info message
+            message (Union[str, Callable[[], str]]): Info message, format string or zero-argument callable
+            *args: %-style (or {}-style) arguments, formatted only if the message is logged
+            **kwargs: {}-style keyword arguments, formatted only if the message is logged
         """
-        self._log(self.INFO, message)
+        if self.INFO >= self.level:
+            self._log(self.INFO, message, *args, **kwargs)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: Union[str, Callable[[], str]], *args: Any, **kwargs: Any) -> None:
         """
         Log a warning message
         
         Args:
-            message (str): Warning message
+            message (Union[str, Callable[[], str]]): Warning message, format string or zero-argument callable
+            *args: %-style (or {}-style) arguments, formatted only if the message is logged
+            **kwargs: {}-style keyword arguments, formatted only if the message is logged
         """
-        self._log(self.WARNING, message)
+        if self.WARNING >= self.level:
+            self._log(self.WARNING, message, *args, **kwargs)
     
-    def error(self, message: str) -> None:
+    def error(self, message: Union[str, Callable[[], str]], *args: Any, **kwargs: Any) -> None:
         """
         Log an error message
         
         Args:
-            message (str): Error message
+            message (Union[str, Callable[[], str]]): Error message, format string or zero-argument callable
+            *args: %-style (or {}-style) arguments, formatted only if the message is logged
+            **kwargs: {}-style keyword arguments, formatted only if the message is logged
         """
-        self._log(self.ERROR, message)
+        if self.ERROR >= self.level:
+            self._log(self.ERROR, message, *args, **kwargs)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: Union[str, Callable[[], str]], *args: Any, **kwargs: Any) -> None:
         """
         Log a critical message
         
         Args:
-            message (str): Critical message
+            message (Union[str, Callable[[], str]]): Critical message, format string or zero-argument callable
+            *args: %-style (or {}-style) arguments, formatted only if the message is logged
+            **kwargs: {}-style keyword arguments, formatted only if the message is logged
         """
-        self._log(self.CRITICAL, message)
+        if self.CRITICAL >= self.level:
+            self._log(self.CRITICAL, message, *args, **kwargs)
     
-    def exception(self, message: str = "Exception occurred") -> None:
+    def exception(self, message: Union[str, Callable[[], str]] = "Exception occurred", *args: Any, **kwargs: Any) -> None:
         """
         Log an exception with traceback
         
         Args:
-            message (str, optional): Message to log with the exception. Defaults to "Exception occurred".
+            message (Union[str, Callable[[], str]], optional): Message to log with the exception. Defaults to "Exception occurred".
+            *args: %-style (or {}-style) arguments, formatted only if the message is logged
+            **kwargs: {}-style keyword arguments, formatted only if the message is logged
         """
-        exc_info = traceback.format_exc()
-        self._log(self.ERROR, f"{message}\n{exc_info}")
+        if self.ERROR >= self.level:
+            exc_info = traceback.format_exc()
+            self._log(self.ERROR, f"{self._render_message(message, args, kwargs)}\n{exc_info}")
 
 
 class FileLogger(Logger):
     """Logger that writes to a file with optional rotation"""
     
+    # Supported time-based rotation intervals
+    ROTATE_WHEN = ('hourly', 'daily')
+    
     def __init__(self, 
                  name: str = "FileLogger", 
                  level: int = Logger.INFO,
@@ -372,7 +849,14 @@ class FileLogger(Logger):
                  mode: str = "a",
                  encoding: str = "utf-8",
                  max_size: int = 0,
-                 backup_count: int = 0):
+                 backup_count: int = 0,
+                 async_mode: bool = False,
+                 queue_size: int = 10000,
+                 batch_size: int = 512,
+                 flush_interval: float = 0.5,
+                 overflow_policy: str = BackgroundWriter.BLOCK,
+                 when: Optional[str] = None,
+                 compress: bool = False):
         """
         Initialize a file logger
         
@@ -383,16 +867,55 @@ class FileLogger(Logger):
             mode (str, optional): File open mode. Defaults to "a" (append).
             encoding (str, optional): File encoding. Defaults to "utf-8".
             max_size (int, optional): Maximum file size in bytes before rotation. Defaults to 0 (no rotation).
-            backup_count (int, optional): Number of backup files to keep. Defaults to 0.
+            backup_count (int, optional): Number of backup files to keep. With 0, a rotated file is discarded.
+                Defaults to 0.
+            async_mode (bool, optional): Write from a background thread instead of the caller's thread. Defaults to False.
+            queue_size (int, optional): Maximum queued messages in async mode. Defaults to 10000.
+            batch_size (int, optional): Queued messages that trigger a write in async mode. Defaults to 512.
+            flush_interval (float, optional): Maximum seconds a message waits in async mode. Defaults to 0.5.
+            overflow_policy (str, optional): 'block', 'drop_oldest' or 'drop_new' when the async queue is full.
+                Defaults to 'block'.
+            when (Optional[str], optional): Time-based rotation, 'hourly' or 'daily'. Defaults to None.
+            compress (bool, optional): Gzip rotated backups (filename.N.gz). Defaults to False.
         """
+        if when is not None and when not in self.ROTATE_WHEN:
+            raise ValueError(f"Unsupported rotation interval: {when}. Supported intervals: {', '.join(self.ROTATE_WHEN)}")
+        
         super().__init__(name, level)
         self.filename = filename
         self.mode = mode
         self.encoding = encoding
         self.max_size = max_size
         self.backup_count = backup_count
+        self.when = when
+        self.compress = compress
         self._file = None
+        self._bytes_written = 0  # Size of the current file, tracked in memory instead of stat-ing per write
+        self._next_rollover: Optional[float] = None
+        self._rotation_seq = 0
+        
+        # Backup shifting and compression run on a background thread, off the write path;
+        # it is started by the first rotation
+        self._rotator: Optional[BackgroundWriter] = None
+        
         self._open_file()
+        
+        # Background writer used in async mode
+        self._writer: Optional[BackgroundWriter] = None
+        if async_mode:
+            self._writer = BackgroundWriter(
+                self._write_lines,
+                max_queue_size=queue_size,
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+                overflow_policy=overflow_policy,
+                name=f"{name}-writer"
+            )
+    
+    @property
+    def async_mode(self) -> bool:
+        """Whether messages are written by a background thread"""
+        return self._writer is not None
     
     def _open_file(self) -> None:
         """Open the log file"""
@@ -403,23 +926,59 @@ class FileLogger(Logger):
                 os.makedirs(directory)
                 
             # Open the file
-            self._file = open(self.filename, self.mode, encoding=self.encoding)
+            existed = os.path.exists(self.filename)
+            self._file = self._open_stream()
+            
+            # Initialize rotation state once per open
+            self._bytes_written = os.path.getsize(self.filename)
+            if self.when:
+                # An appended file rolls over at the end of the period it was last written in
+                start = os.path.getmtime(self.filename) if existed and self._bytes_written else time.time()
+                self._next_rollover = self._compute_next_rollover(start)
+            self._start_file()
         except Exception as e:
             print(f"Error opening log file: {e}", file=sys.stderr)
+            if self._file:
+                self._file.close()
             self._file = None
     
-    def _format_message(self, level: int, message: str) -> str:
+    def _open_stream(self) -> Any:
+        """Open self.filename for writing and return the file object"""
+        return open(self.filename, self.mode, encoding=self.encoding)
+    
+    def _start_file(self) -> None:
+        """Called after the log file is opened, before anything is written to it"""
+        pass
+    
+    def _compute_next_rollover(self, now: float) -> float:
+        """
+        Get the start of the period after the one containing now
+        
+        Args:
+            now (float): Time in epoch seconds
+            
+        Returns:
+            float: Next rollover time in epoch seconds
+        """
+        t = time.localtime(now)
+        if self.when == 'hourly':
+            return time.mktime((t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour + 1, 0, 0, 0, 0, -1))
+        # mktime normalizes the day overflow and handles DST changes
+        return time.mktime((t.tm_year, t.tm_mon, t.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    
+    def _format_message(self, level: int, message: str, created: Optional[float] = None) -> str:
         """
         Format a log message with timestamp, level, and padding for alignment
         
         Args:
             level (int): Log level
             message (str): Log message
+            created (Optional[float]): Record time in epoch seconds. Defaults to None (now).
             
         Returns:
             str: Formatted log message
         """
-        timestamp = datetime.now().strftime(self._timestamp_format)
+        timestamp = self._timestamp_formatter.format(created)
         level_name = self.LEVEL_NAMES.get(level, "UNKNOWN")
         
         # Calculate padding needed after the bracket (CRITICAL is 8 chars)
@@ -428,43 +987,76 @@ class FileLogger(Logger):
         return f"[{timestamp}] [{level_name}]{padding} {message}"
     
     def _rotate_if_needed(self) -> None:
-        """Rotate the log file if it exceeds max_size"""
-        if not self.max_size or not self._file:
+        """Rotate the log file if it exceeds max_size or the rotation period has ended"""
+        if not self._file:
+            return
+        
+        size_exceeded = self.max_size and self._bytes_written >= self.max_size
+        period_ended = self._next_rollover is not None and time.time() >= self._next_rollover
+        if not (size_exceeded or period_ended):
             return
             
         try:
-            # Check current file size
-            self._file.flush()
-            size = os.path.getsize(self.filename)
+            # Close current file
+            self._file.close()
+            self._file = None
             
-            if size >= self.max_size:
-                # Close current file
-                self._file.close()
-                self._file = None
-                
-                # Rotate backup files
-                for i in range(self.backup_count - 1, 0, -1):
-                    src = f"{self.filename}.{i}"
-                    dst = f"{self.filename}.{i+1}"
-                    if os.path.exists(src):
-                        if os.path.exists(dst):
-                            os.remove(dst)
-                        os.rename(src, dst)
-                
-                # Rename current file
-                if self.backup_count > 0:
-                    if os.path.exists(f"{self.filename}.1"):
-                        os.remove(f"{self.filename}.1")
-                    os.rename(self.filename, f"{self.filename}.1")
-                
-                # Open new file
-                self._open_file()
+            # Move the file aside with a single rename; shifting the numbered
+            # backups and compressing happen on the rotator thread
+            if self.backup_count > 0:
+                if self._rotator is None:
+                    self._rotator = BackgroundWriter(
+                        self._finish_rotations,
+                        batch_size=1,
+                        flush_interval=0,
+                        name=f"{self.name}-rotator"
+                    )
+                self._rotation_seq += 1
+                pending = f"{self.filename}.{os.getpid()}-{self._rotation_seq}.rotating"
+                os.replace(self.filename, pending)
+                if not self._rotator.put(pending):
+                    # The rotator has been closed; finish the rotation here
+                    self._finish_rotations([pending])
+            else:
+                os.remove(self.filename)
+            
+            # Open new file
+            self._open_file()
         except Exception as e:
             print(f"Error rotating log file: {e}", file=sys.stderr)
             # Try to reopen the file
             if not self._file:
                 self._open_file()
     
+    def _finish_rotations(self, pending_files: List[str]) -> None:
+        """
+        Turn rotated files into numbered backups, compressing them if enabled
+        
+        Runs on the rotator thread.
+        
+        Args:
+            pending_files (List[str]): Rotated files, oldest first
+        """
+        suffix = ".gz" if self.compress else ""
+        for pending in pending_files:
+            try:
+                if self.compress:
+                    compressed = pending + ".gz"
+                    with open(pending, 'rb') as src, gzip.open(compressed, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    os.remove(pending)
+                    pending = compressed
+                
+                # Shift existing backups up by one, dropping the oldest
+                for i in range(self.backup_count - 1, 0, -1):
+                    src = f"{self.filename}.{i}{suffix}"
+                    if os.path.exists(src):
+                        os.replace(src, f"{self.filename}.{i + 1}{suffix}")
+                
+                os.replace(pending, f"{self.filename}.1{suffix}")
+            except Exception as e:
+                print(f"Error rotating log file: {e}", file=sys.stderr)
+    
     def _write(self, message: str) -> None:
         """
         Write a message to the log file
@@ -472,25 +1064,149 @@ class FileLogger(Logger):
         Args:
             message (str): Formatted log message
         """
-        if not self._file:
-            self._open_file()
+        # A closed writer falls back to synchronous writes, which reopen the file
+        if self._writer is not None and not self._writer.closed:
+            self._writer.put(message)
+        else:
+            self._write_lines([message])
+    
+    def _emit_batch(self, records: List[LogRecord]) -> None:
+        """
+        Store a batch of records and write their lines with a single write call
+        
+        Args:
+            records (List[LogRecord]): Log records that passed level filtering, oldest first
+        """
+        if self._writer is not None and not self._writer.closed:
+            super()._emit_batch(records)
+            return
+        lines = []
+        for record in records:
+            self._store_record(record)
+            lines.append(self._format_message(record.level, record.message, record.created))
+        self._write_lines(lines)
+    
+    def _write_lines(self, messages: List[str]) -> None:
+        """
+        Write a batch of messages to the log file with a single write call
+        
+        Writes and rotations from any thread (callers in sync mode, the
+        writer thread in async mode) are serialized by the sink lock. With
+        max_size, a batch that would fill the file is split at the line that
+        reaches max_size and the rest goes to the next file.
+        
+        Args:
+            messages (List[str]): Formatted log messages
+        """
+        with self._sink_lock:
+            if not self._file:
+                self._open_file()
+                
+            if self._file:
+                try:
+                    # A new period starts a new file before anything is written to it
+                    if self._next_rollover is not None and time.time() >= self._next_rollover:
+                        self._rotate_if_needed()
+                        if not self._file:
+                            return
+                    
+                    start = 0
+                    while start < len(messages):
+                        end, size = self._chunk_end(messages, start, self._line_size)
+                        data = "\n".join(messages[start:end]) + "\n"
+                        self._file.write(data)
+                        self._file.flush()
+                        
+                        # Track the file size from the encoded length of what was written
+                        if size is None:
+                            size = self._encoded_size(data)
+                        self._bytes_written += size
+                        
+                        self._rotate_if_needed()
+                        if not self._file:
+                            return
+                        start = end
+                except Exception as e:
+                    print(f"Error writing to log file: {e}", file=sys.stderr)
+    
+    def _encoded_size(self, text: str) -> int:
+        """Get the bytes text takes in the file, including newline translation"""
+        size = len(text) if text.isascii() else len(text.encode(self.encoding, errors='replace'))
+        if os.linesep != "\n":
+            size += (len(os.linesep) - 1) * text.count("\n")
+        return size
+    
+    def _line_size(self, message: str) -> int:
+        """Get the bytes a message and its line ending take in the file"""
+        return self._encoded_size(message) + len(os.linesep)
+    
+    def _chunk_end(self, items: List[Any], start: int, item_size: Callable[[Any], int]) -> Tuple[int, Optional[int]]:
+        """
+        Find how many items of a batch fit in the current file before it reaches max_size
+        
+        Args:
+            items (List[Any]): Batch of lines or records
+            start (int): Index of the first item not written yet
+            item_size (Callable[[Any], int]): Bytes an item takes in the file
             
-        if self._file:
-            try:
-                self._file.write(message + "\n")
-                self._file.flush()
-                self._rotate_if_needed()
-            except Exception as e:
-                print(f"Error writing to log file: {e}", file=sys.stderr)
+        Returns:
+            Tuple[int, Optional[int]]: Index after the last item to write now (at least one item),
+                and the bytes of those items, or None without max_size
+        """
+        if not self.max_size:
+            return len(items), None
+        room = self.max_size - self._bytes_written
+        end = start
+        size = 0
+        while end < len(items):
+            size += item_size(items[end])
+            end += 1
+            if size >= room:
+                break
+        return end, size
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush pending messages to disk
+        
+        In async mode this waits until the background queue is drained.
+        
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait in async mode. Defaults to None (wait indefinitely).
+            
+        Returns:
+            bool: True if all pending messages were written, False on timeout
+        """
+        self.flush_coalesced()
+        if self._writer is not None and not self._writer.flush(timeout):
+            return False
+        with self._sink_lock:
+            if self._file:
+                try:
+                    self._file.flush()
+                except Exception as e:
+                    print(f"Error flushing log file: {e}", file=sys.stderr)
+                    return False
+        return True
     
     def close(self) -> None:
-        """Close the log file"""
-        if self._file:
-            try:
-                self._file.close()
-            except Exception:
-                pass
-            self._file = None
+        """Drain any queued messages, close the log file and finish pending rotations"""
+        coalescer = getattr(self, '_coalescer', None)
+        if coalescer is not None:
+            coalescer.flush()
+        writer = getattr(self, '_writer', None)
+        if writer is not None:
+            writer.close()
+        rotator = getattr(self, '_rotator', None)
+        if rotator is not None:
+            rotator.close()
+        if getattr(self, '_file', None):
+            with self._sink_lock:
+                try:
+                    self._file.close()
+                except Exception:
+                    pass
+                self._file = None
     
     def __del__(self) -> None:
         """Ensure file is closed when object is deleted"""
@@ -514,7 +1230,11 @@ class ConsoleLogger(Logger):
                  level: int = Logger.INFO,
                  use_colors: bool = True,
                  stream: TextIO = sys.stdout,
-                 colors: Optional[Dict[int, str]] = None):
+                 colors: Optional[Dict[int, str]] = None,
+                 buffered: Optional[bool] = False,
+                 buffer_size: int = 256,
+                 flush_interval: float = 0.1,
+                 flush_level: int = Logger.ERROR):
         """
         Initialize a console logger
         
@@ -524,24 +1244,58 @@ class ConsoleLogger(Logger):
             use_colors (bool, optional): Whether to use colors. Defaults to True.
             stream (TextIO, optional): Output stream. Defaults to sys.stdout.
             colors (Optional[Dict[int, str]], optional): Custom colors for log levels. Defaults to None.
+            buffered (Optional[bool], optional): Batch lines into a single write per flush. None buffers only
+                when the stream is not a TTY (pipes and files). Defaults to False.
+            buffer_size (int, optional): Buffered lines that trigger a write. Defaults to 256.
+            flush_interval (float, optional): Maximum seconds a buffered line waits. Defaults to 0.1.
+            flush_level (int, optional): Records at or above this level are written immediately. Defaults to Logger.ERROR.
         """
         super().__init__(name, level)
         self.use_colors = use_colors
         self.stream = stream
         self.colors = colors or self.DEFAULT_COLORS.copy()
+        self.flush_level = flush_level
+        
+        if buffered is None:
+            buffered = not self._is_tty(stream)
+        
+        # Background writer used in buffered mode
+        self._writer: Optional[BackgroundWriter] = None
+        if buffered:
+            self._writer = BackgroundWriter(
+                self._write_lines,
+                max_queue_size=max(buffer_size * 16, 1024),
+                batch_size=buffer_size,
+                flush_interval=flush_interval,
+                name=f"{name}-writer"
+            )
+    
+    @staticmethod
+    def _is_tty(stream: TextIO) -> bool:
+        """Check whether a stream is an interactive terminal"""
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+    
+    @property
+    def buffered(self) -> bool:
+        """Whether lines are batched before being written"""
+        return self._writer is not None
     
-    def _format_message(self, level: int, message: str) -> str:
+    def _format_message(self, level: int, message: str, created: Optional[float] = None) -> str:
         """
         Format a log message with timestamp, level, and optional color
         
         Args:
             level (int): Log level
             message (str): Log message
+            created (Optional[float]): Record time in epoch seconds. Defaults to None (now).
             
         Returns:
             str: Formatted log message
         """
-        timestamp = datetime.now().strftime(self._timestamp_format)
+        timestamp = self._timestamp_formatter.format(created)
         level_name = self.LEVEL_NAMES.get(level, "UNKNOWN")
         
         # Calculate padding needed after the bracket (CRITICAL is 8 chars)
@@ -554,6 +1308,33 @@ class ConsoleLogger(Logger):
         else:
             return f"[{timestamp}] [{level_name}]{padding} {message}"
     
+    def _emit(self, record: LogRecord) -> None:
+        """
+        Store and write a record, flushing the buffer for urgent levels
+        
+        Args:
+            record (LogRecord): Log record
+        """
+        super()._emit(record)
+        if self._writer is not None and record.level >= self.flush_level:
+            self._writer.flush()
+    
+    def _emit_batch(self, records: List[LogRecord]) -> None:
+        """
+        Store a batch of records and write their lines with a single write call
+        
+        Args:
+            records (List[LogRecord]): Log records that passed level filtering, oldest first
+        """
+        if self._writer is not None and not self._writer.closed:
+            super()._emit_batch(records)
+            return
+        lines = []
+        for record in records:
+            self._store_record(record)
+            lines.append(self._format_message(record.level, record.message, record.created))
+        self._write_lines(lines)
+    
     def _write(self, message: str) -> None:
         """
         Write a message to the console
@@ -561,7 +1342,48 @@ class ConsoleLogger(Logger):
         Args:
             message (str): Formatted log message
         """
-        print(message, file=self.stream)
+        if self._writer is not None and not self._writer.closed:
+            self._writer.put(message)
+        else:
+            # One write call, so concurrent lines cannot interleave with each other's newlines
+            with self._sink_lock:
+                self.stream.write(message + "\n")
+    
+    def _write_lines(self, messages: List[str]) -> None:
+        """
+        Write a batch of messages to the console with a single write call
+        
+        Args:
+            messages (List[str]): Formatted log messages
+        """
+        data = "\n".join(messages) + "\n"
+        with self._sink_lock:
+            try:
+                self.stream.write(data)
+                self.stream.flush()
+            except Exception as e:
+                print(f"Error writing to console: {e}", file=sys.stderr)
+    
+    def flush(self) -> None:
+        """Write any buffered lines and flush the stream"""
+        self.flush_coalesced()
+        if self._writer is not None:
+            self._writer.flush()
+        try:
+            self.stream.flush()
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Write any buffered lines and stop buffering"""
+        self.flush_coalesced()
+        if self._writer is not None:
+            self._writer.close()
+    
+    def __del__(self) -> None:
+        """Write any buffered lines when the object is deleted"""
+        if getattr(self, '_writer', None) is not None:
+            self.close()
     
     def set_color(self, level: int, color: str) -> None:
         """
@@ -612,29 +1434,79 @@ class MultiLogger(Logger):
         if logger in self.loggers:
             self.loggers.remove(logger)
     
-    def _write(self, message: str) -> None:
+    def _log(self, level: int, message: Any, *args: Any, **kwargs: Any) -> None:
         """
-        Write a message to all loggers
+        Log a message if level is sufficient, passing the caller's template on to the children
         
         Args:
-            message (str): Formatted log message
+            level (int): Log level
+            message (Any): Log message, format string or zero-argument callable
+            *args: Positional format arguments
+            **kwargs: Keyword format arguments
         """
+        if level >= self.level:
+            if self._filters and not self._passes_filters(level, message):
+                return
+            template = message
+            if args or kwargs or message.__class__ is not str:
+                message = self._render_message(message, args, kwargs)
+            level_name = self.LEVEL_NAMES.get(level, "UNKNOWN")
+            record = LogRecord(time.time(), level, level_name, message, self.name)
+            if self._coalescer is None:
+                self._store_record(record)
+                self._dispatch(record, template)
+            else:
+                self._coalescer.submit(record)
+    
+    def _emit(self, record: LogRecord) -> None:
+        """
+        Store a record and dispatch it to every logger that accepts its level
+        
+        Args:
+            record (LogRecord): Log record
+        """
+        self._store_record(record)
+        self._dispatch(record, record.message)
+    
+    def _dispatch(self, record: LogRecord, template: Any) -> None:
+        """
+        Hand a stored record to every logger that accepts its level
+        
+        Child loggers receive the same structured record, so each formats it
+        once for its own destination and all outputs share one timestamp.
+        Children apply their own filters and coalescing to what they receive.
+        Their filters see the template the caller passed, as they would if
+        called directly, so per-template rate limits hold across arguments.
+        
+        Args:
+            record (LogRecord): Log record
+            template (Any): Message as passed by the caller, before formatting
+        """
+        level = record.level
+        # Levels are read live, so assigning a child's level or editing self.loggers takes effect at once
         for logger in self.loggers:
-            # Use the original message format for each logger
-            level_start = message.find("[", message.find("]") + 1) + 1
-            level_end = message.find("]", level_start)
-            level_name = message[level_start:level_end]
-            level = next((k for k, v in self.LEVEL_NAMES.items() if v == level_name), self.INFO)
-            
-            # Extract the raw message without timestamp and level
-            raw_message = message[level_end + 2:]
-            
-            # Log with the appropriate level
-            if level >= logger.level:
-                logger._log(level, raw_message)
+            if level < logger.level:
+                continue
+            if logger._filters and not logger._passes_filters(level, template):
+                continue
+            if logger._coalescer is not None:
+                logger._coalescer.submit(record)
+            elif isinstance(logger, MultiLogger):
+                logger._store_record(record)
+                logger._dispatch(record, template)
+            else:
+                logger._emit(record)
+    
+    def flush(self) -> None:
+        """Flush all loggers that support flushing"""
+        self.flush_coalesced()
+        for logger in self.loggers:
+            if hasattr(logger, 'flush') and callable(logger.flush):
+                logger.flush()
     
     def close(self) -> None:
         """Close all loggers that support closing"""
+        self.flush_coalesced()
         for logger in self.loggers:
             if hasattr(logger, 'close') and callable(logger.close):
                 logger.close() 
\ No newline at end of file
@@ -0,0 +1,641 @@
+"""
+Record storage for Modern Logger.
+
+This module provides the in-memory containers used by loggers to keep
+recent log records for export:
+- RecordStore, a fixed-capacity ring buffer with O(1) append and eviction
+- ColumnarRecordStore, a ring buffer of parallel arrays with vectorized queries
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; columnar queries fall back to pure Python
+    np = None
+
+
+def _move_newest(column: Any, start: int, newest: int) -> None:
+    """
+    Move the newest entry of a ring buffer column back to physical index start
+
+    The entries from start up to the newest one, wrapping around the end of
+    the column if needed, shift one place towards the end.
+    """
+    if start == newest:
+        return
+    if start < newest:
+        column[start:newest + 1] = column[newest:newest + 1] + column[start:newest]
+        return
+    moved = column[newest:newest + 1] + column[start:] + column[:newest]
+    split = len(column) - start
+    column[start:] = moved[:split]
+    column[:newest + 1] = moved[split:]
+
+
+class RecordStore:
+    """Fixed-capacity ring buffer that keeps the most recent log records"""
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Initialize the record store
+
+        Args:
+            capacity (int, optional): Maximum number of records to keep. Defaults to 10000.
+        """
+        self._capacity = max(0, capacity)
+        self._buffer: List[Any] = []  # Grows up to capacity, then is overwritten in place
+        self._head = 0  # Index of the oldest record once the buffer is full
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records kept"""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __bool__(self) -> bool:
+        return bool(self._buffer)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over records from oldest to newest"""
+        buffer = self._buffer
+        head = self._head
+        for i in range(head, len(buffer)):
+            yield buffer[i]
+        for i in range(head):
+            yield buffer[i]
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Get a record by position in O(1)
+
+        Args:
+            index (int): Position from oldest (0) to newest; negative values count from the newest
+
+        Returns:
+            Any: Record at that position
+        """
+        size = len(self._buffer)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("record index out of range")
+        index += self._head
+        return self._buffer[index - size if index >= size else index]
+
+    def append(self, record: Any) -> Optional[Any]:
+        """
+        Add a record, evicting the oldest one if the store is full
+
+        Args:
+            record (Any): Record to store
+
+        Returns:
+            Optional[Any]: The evicted record, or None if nothing was evicted
+        """
+        buffer = self._buffer
+        if len(buffer) < self._capacity:
+            buffer.append(record)
+            return None
+        if not self._capacity:
+            return record
+
+        head = self._head
+        evicted = buffer[head]
+        buffer[head] = record
+        head += 1
+        self._head = 0 if head == self._capacity else head
+        return evicted
+
+    def insert(self, record: Any) -> Optional[Any]:
+        """
+        Add a record that may be older than the newest ones, keeping time order
+
+        The place is found by binary search on created times, and the newer
+        records are shifted one place towards the end.
+
+        Args:
+            record (Any): Record with a created attribute
+
+        Returns:
+            Optional[Any]: The evicted record, or None if nothing was evicted
+        """
+        evicted = self.append(record)
+        buffer = self._buffer
+        size = len(buffer)
+        if evicted is record or size < 2:
+            return evicted
+        head = self._head
+        created = record.created
+        low, high = 0, size - 1
+        while low < high:
+            middle = (low + high) // 2
+            if buffer[(head + middle) % size].created > created:
+                high = middle
+            else:
+                low = middle + 1
+        _move_newest(buffer, (head + low) % size, (head - 1) % size)
+        return evicted
+
+    def last(self, count: int) -> List[Any]:
+        """
+        Get the most recent records
+
+        Args:
+            count (int): Number of records to return
+
+        Returns:
+            List[Any]: Up to count records, oldest first
+        """
+        buffer = self._buffer
+        size = len(buffer)
+        if count <= 0 or not size:
+            return []
+        if count >= size:
+            return self.to_list()
+
+        # Newest record sits just before head; slice backwards without copying the rest
+        end = self._head or size
+        start = end - count
+        if start >= 0:
+            return buffer[start:end]
+        return buffer[start:] + buffer[:end]
+
+    def to_list(self) -> List[Any]:
+        """
+        Get all records as a list
+
+        Returns:
+            List[Any]: All records, oldest first
+        """
+        head = self._head
+        if not head:
+            return self._buffer[:]
+        return self._buffer[head:] + self._buffer[:head]
+
+    def query(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None,
+              logger_name: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Any]:
+        """
+        Get records matching all of the given filters
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[float]): Earliest record time in epoch seconds (inclusive)
+            end_time (Optional[float]): Latest record time in epoch seconds (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+            limit (Optional[int]): Maximum number of records to return (most recent)
+
+        Returns:
+            List[Any]: Matching records, oldest first
+        """
+        if level_filter is None and start_time is None and end_time is None and logger_name is None:
+            return self.to_list() if limit is None else self.last(limit)
+
+        records = [
+            r for r in self
+            if (level_filter is None or r.level >= level_filter)
+            and (start_time is None or r.created >= start_time)
+            and (end_time is None or r.created < end_time)
+            and (logger_name is None or r.logger_name == logger_name)
+        ]
+
+        if limit is not None:
+            records = records[-limit:] if limit > 0 else []
+        return records
+
+    def iter_query(self,
+                   level_filter: Optional[int] = None,
+                   start_time: Optional[float] = None,
+                   end_time: Optional[float] = None,
+                   logger_name: Optional[str] = None) -> Iterator[Any]:
+        """
+        Iterate over records matching all of the given filters without building a list
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[float]): Earliest record time in epoch seconds (inclusive)
+            end_time (Optional[float]): Latest record time in epoch seconds (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            Iterator[Any]: Matching records, oldest first
+        """
+        for r in self:
+            if ((level_filter is None or r.level >= level_filter)
+                    and (start_time is None or r.created >= start_time)
+                    and (end_time is None or r.created < end_time)
+                    and (logger_name is None or r.logger_name == logger_name)):
+                yield r
+
+    def count(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None,
+              logger_name: Optional[str] = None) -> int:
+        """
+        Count records matching all of the given filters
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[float]): Earliest record time in epoch seconds (inclusive)
+            end_time (Optional[float]): Latest record time in epoch seconds (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            int: Number of matching records
+        """
+        if level_filter is None and start_time is None and end_time is None and logger_name is None:
+            return len(self._buffer)
+        return sum(1 for _ in self.iter_query(level_filter, start_time, end_time, logger_name))
+
+    def resize(self, capacity: int) -> None:
+        """
+        Change the capacity, dropping the oldest records if it shrinks
+
+        Args:
+            capacity (int): New maximum number of records
+        """
+        capacity = max(0, capacity)
+        if self._head:
+            # Linearize so that the buffer can grow again by plain appends
+            self._buffer[:] = self.to_list()
+            self._head = 0
+        if len(self._buffer) > capacity:
+            del self._buffer[:len(self._buffer) - capacity]
+        self._capacity = capacity
+
+    def clear(self) -> None:
+        """Remove all records"""
+        self._buffer.clear()
+        self._head = 0
+
+
+class ColumnarRecordStore:
+    """
+    Fixed-capacity ring buffer that keeps records as parallel columns
+
+    Times, levels and logger-name ids are held in typed arrays and messages
+    in a string table, so a store of a million records costs a few dozen
+    bytes per entry instead of one object each. Queries build boolean masks
+    over the columns with numpy when it is installed and only materialize
+    the matching records.
+    """
+
+    # Rows evaluated per mask when streaming query results
+    QUERY_CHUNK_SIZE = 65536
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Initialize the columnar record store
+
+        Args:
+            capacity (int, optional): Maximum number of records to keep. Defaults to 10000.
+        """
+        self._capacity = max(0, capacity)
+        self._head = 0  # Physical index of the oldest record once the columns are full
+
+        # Parallel columns, grown up to capacity and then overwritten in place
+        self._created = array('d')
+        self._levels = array('i')
+        self._name_ids = array('I')
+        self._messages: List[str] = []
+
+        # Lookup tables shared by all rows
+        self._names: List[str] = []
+        self._name_index: Dict[str, int] = {}
+        self._level_names: Dict[int, str] = {}
+        self._record_type = None  # Class used to materialize records, taken from the first append
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records kept"""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __bool__(self) -> bool:
+        return bool(self._messages)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over records from oldest to newest"""
+        size = len(self._messages)
+        head = self._head
+        for i in range(head, size):
+            yield self._materialize(i)
+        for i in range(head):
+            yield self._materialize(i)
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Get a record by position in O(1)
+
+        Args:
+            index (int): Position from oldest (0) to newest; negative values count from the newest
+
+        Returns:
+            Any: Record at that position
+        """
+        size = len(self._messages)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("record index out of range")
+        index += self._head
+        return self._materialize(index - size if index >= size else index)
+
+    def _materialize(self, index: int) -> Any:
+        """Build a record object from the row at a physical index"""
+        level = self._levels[index]
+        return self._record_type(self._created[index], level, self._level_names[level],
+                                 self._messages[index], self._names[self._name_ids[index]])
+
+    def _name_id(self, name: str) -> int:
+        """Get the id of a logger name, adding it to the table if needed"""
+        name_id = self._name_index.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._name_index[name] = name_id
+        return name_id
+
+    def append(self, record: Any) -> None:
+        """
+        Add a record, evicting the oldest one if the store is full
+
+        Evicted rows are overwritten in place and not returned.
+
+        Args:
+            record (Any): Record with created, level, level_name, message and logger_name attributes
+        """
+        if not self._capacity:
+            return
+        if self._record_type is None:
+            self._record_type = type(record)
+
+        level = record.level
+        if level not in self._level_names:
+            self._level_names[level] = record.level_name
+        name_id = self._name_id(record.logger_name)
+
+        if len(self._messages) < self._capacity:
+            self._created.append(record.created)
+            self._levels.append(level)
+            self._name_ids.append(name_id)
+            self._messages.append(record.message)
+            return
+
+        head = self._head
+        self._created[head] = record.created
+        self._levels[head] = level
+        self._name_ids[head] = name_id
+        self._messages[head] = record.message
+        head += 1
+        self._head = 0 if head == self._capacity else head
+
+    def insert(self, record: Any) -> None:
+        """
+        Add a record that may be older than the newest ones, keeping time order
+
+        The place is found by binary search on the time column, and the
+        newer rows are shifted one place towards the end.
+
+        Args:
+            record (Any): Record with created, level, level_name, message and logger_name attributes
+        """
+        self.append(record)
+        times = self._created
+        size = len(times)
+        if size < 2:
+            return
+        head = self._head
+        created = record.created
+        low, high = 0, size - 1
+        while low < high:
+            middle = (low + high) // 2
+            if times[(head + middle) % size] > created:
+                high = middle
+            else:
+                low = middle + 1
+        start, newest = (head + low) % size, (head - 1) % size
+        for column in (self._created, self._levels, self._name_ids, self._messages):
+            _move_newest(column, start, newest)
+
+    def _logical_indices(self) -> List[int]:
+        """Physical row indices from oldest to newest"""
+        size = len(self._messages)
+        return list(range(self._head, size)) + list(range(self._head))
+
+    def last(self, count: int) -> List[Any]:
+        """
+        Get the most recent records
+
+        Args:
+            count (int): Number of records to return
+
+        Returns:
+            List[Any]: Up to count records, oldest first
+        """
+        size = len(self._messages)
+        count = min(count, size)
+        if count <= 0:
+            return []
+        head = self._head
+        return [self._materialize((head + j) % size) for j in range(size - count, size)]
+
+    def to_list(self) -> List[Any]:
+        """
+        Get all records as a list
+
+        Returns:
+            List[Any]: All records, oldest first
+        """
+        return list(self)
+
+    def query(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None,
+              logger_name: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Any]:
+        """
+        Get records matching all of the given filters
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[float]): Earliest record time in epoch seconds (inclusive)
+            end_time (Optional[float]): Latest record time in epoch seconds (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+            limit (Optional[int]): Maximum number of records to return (most recent)
+
+        Returns:
+            List[Any]: Matching records, oldest first
+        """
+        if limit is not None and limit <= 0:
+            return []
+
+        name_id = None
+        if logger_name is not None:
+            name_id = self._name_index.get(logger_name)
+            if name_id is None:
+                return []
+
+        if np is not None:
+            indices = self._query_numpy(level_filter, start_time, end_time, name_id)
+        else:
+            indices = self._query_python(level_filter, start_time, end_time, name_id)
+
+        if limit is not None:
+            indices = indices[-limit:]
+        if np is not None:
+            indices = indices.tolist()
+        return [self._materialize(i) for i in indices]
+
+    def iter_query(self,
+                   level_filter: Optional[int] = None,
+                   start_time: Optional[float] = None,
+                   end_time: Optional[float] = None,
+                   logger_name: Optional[str] = None) -> Iterator[Any]:
+        """
+        Iterate over records matching all of the given filters without building a list
+
+        With numpy, masks are evaluated over chunks of QUERY_CHUNK_SIZE rows so
+        memory use does not grow with the number of matches.
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[float]): Earliest record time in epoch seconds (inclusive)
+            end_time (Optional[float]): Latest record time in epoch seconds (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            Iterator[Any]: Matching records, oldest first
+        """
+        name_id = None
+        if logger_name is not None:
+            name_id = self._name_index.get(logger_name)
+            if name_id is None:
+                return
+
+        if np is None:
+            for i in self._query_python(level_filter, start_time, end_time, name_id):
+                yield self._materialize(i)
+            return
+
+        # Walk the physical ranges in logical order: [head, size) then [0, head)
+        size = len(self._messages)
+        for range_start, range_end in ((self._head, size), (0, self._head)):
+            for chunk_start in range(range_start, range_end, self.QUERY_CHUNK_SIZE):
+                chunk_end = min(chunk_start + self.QUERY_CHUNK_SIZE, range_end)
+                mask = self._mask(level_filter, start_time, end_time, name_id, chunk_start, chunk_end)
+                for i in np.flatnonzero(mask).tolist():
+                    yield self._materialize(chunk_start + i)
+
+    def count(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None,
+              logger_name: Optional[str] = None) -> int:
+        """
+        Count records matching all of the given filters
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[float]): Earliest record time in epoch seconds (inclusive)
+            end_time (Optional[float]): Latest record time in epoch seconds (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            int: Number of matching records
+        """
+        if level_filter is None and start_time is None and end_time is None and logger_name is None:
+            return len(self._messages)
+
+        name_id = None
+        if logger_name is not None:
+            name_id = self._name_index.get(logger_name)
+            if name_id is None:
+                return 0
+
+        if np is None:
+            return len(self._query_python(level_filter, start_time, end_time, name_id))
+        return int(np.count_nonzero(self._mask(level_filter, start_time, end_time, name_id, 0, len(self._messages))))
+
+    def _mask(self, level_filter, start_time, end_time, name_id, start: int, end: int) -> Any:
+        """Build a numpy boolean mask of matching rows over physical indices [start, end)"""
+        mask = np.ones(end - start, dtype=bool)
+        if level_filter is not None:
+            mask &= np.frombuffer(self._levels, dtype=np.intc)[start:end] >= level_filter
+        if start_time is not None or end_time is not None:
+            created = np.frombuffer(self._created, dtype=np.float64)[start:end]
+            if start_time is not None:
+                mask &= created >= start_time
+            if end_time is not None:
+                mask &= created < end_time
+            del created  # Release the buffer so the column can grow again
+        if name_id is not None:
+            mask &= np.frombuffer(self._name_ids, dtype=np.uintc)[start:end] == name_id
+        return mask
+
+    def _query_numpy(self, level_filter, start_time, end_time, name_id) -> Any:
+        """Select matching physical indices, oldest first, as a numpy array"""
+        size = len(self._messages)
+        if not size:
+            return np.empty(0, dtype=np.intp)
+
+        indices = np.flatnonzero(self._mask(level_filter, start_time, end_time, name_id, 0, size))
+        # Rotate so the rows after head (the oldest) come first
+        split = np.searchsorted(indices, self._head)
+        return np.concatenate((indices[split:], indices[:split]))
+
+    def _query_python(self, level_filter, start_time, end_time, name_id) -> List[int]:
+        """Select matching physical indices, oldest first, without numpy"""
+        levels = self._levels
+        created = self._created
+        name_ids = self._name_ids
+        return [
+            i for i in self._logical_indices()
+            if (level_filter is None or levels[i] >= level_filter)
+            and (start_time is None or created[i] >= start_time)
+            and (end_time is None or created[i] < end_time)
+            and (name_id is None or name_ids[i] == name_id)
+        ]
+
+    def resize(self, capacity: int) -> None:
+        """
+        Change the capacity, dropping the oldest records if it shrinks
+
+        Args:
+            capacity (int): New maximum number of records
+        """
+        capacity = max(0, capacity)
+        if self._head:
+            # Linearize so that the columns can grow again by plain appends
+            order = self._logical_indices()
+            self._created = array('d', (self._created[i] for i in order))
+            self._levels = array('i', (self._levels[i] for i in order))
+            self._name_ids = array('I', (self._name_ids[i] for i in order))
+            self._messages = [self._messages[i] for i in order]
+            self._head = 0
+        excess = len(self._messages) - capacity
+        if excess > 0:
+            del self._created[:excess]
+            del self._levels[:excess]
+            del self._name_ids[:excess]
+            del self._messages[:excess]
+        self._capacity = capacity
+
+    def clear(self) -> None:
+        """Remove all records"""
+        self._created = array('d')
+        self._levels = array('i')
+        self._name_ids = array('I')
+        self._messages = []
+        self._head = 0
@@ -0,0 +1,433 @@
+"""
+Tiered record storage for Modern Logger.
+
+A RecordStore keeps the last max_records records and discards older
+ones, so export_log() can never cover a whole long session. This module
+provides:
+- TieredRecordStore, a record store with a hot in-memory tier (a
+  RecordStore of max_records records) and a cold tier of segment files
+  that evicted records spill into. Segments use the binary log format
+  and are written sequentially in batches. Queries, counts and exports
+  span both tiers and stream from disk
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import weakref
+from collections import deque
+from datetime import datetime
+from itertools import chain, islice
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .binary_log import BinaryLogReader, BinaryRecordEncoder, HEADER
+from .record_store import RecordStore
+
+
+class TieredRecordStore:
+    """
+    Record store that spills evicted records to segment files on disk
+
+    The newest capacity records stay in memory. Older ones are buffered
+    and written SPILL_BATCH_SIZE at a time to binary log segments in a
+    private directory, which is removed when the store is closed or
+    garbage collected. Each segment's record count, time range and level
+    range are kept in memory, so queries skip (or count) whole segments
+    that a filter excludes (or fully includes), and the binary log blocks
+    inside a segment are skipped the same way.
+    """
+
+    # Evicted records written to a segment at once (one binary log block)
+    SPILL_BATCH_SIZE = 1024
+
+    def __init__(self,
+                 capacity: int = 10000,
+                 directory: Optional[str] = None,
+                 segment_size: int = 64 * 1024 * 1024,
+                 max_disk_bytes: Optional[int] = None):
+        """
+        Initialize the tiered record store
+
+        Args:
+            capacity (int, optional): Records kept in memory. Defaults to 10000.
+            directory (Optional[str], optional): Directory to create the segment directory in.
+                Defaults to None (the system temporary directory).
+            segment_size (int, optional): Bytes per segment file before a new one is started.
+                Defaults to 64 MB.
+            max_disk_bytes (Optional[int], optional): Delete the oldest segments beyond this many bytes.
+                Defaults to None (keep every record).
+        """
+        self._hot = RecordStore(capacity)
+        self._parent_directory = directory
+        self.segment_size = max(1, segment_size)
+        self.max_disk_bytes = max_disk_bytes
+
+        self._pending: List[Any] = []  # Evicted records not yet written to a segment
+        # One dict per segment: path, size, count, first/last time, min/max level
+        self._segments: List[Dict[str, Any]] = []
+        self._cold_count = 0
+        self._file = None
+        self._encoder = BinaryRecordEncoder()
+        self._segment_number = 0
+        self._directory: Optional[str] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records kept in memory"""
+        return self._hot.capacity
+
+    @property
+    def directory(self) -> Optional[str]:
+        """Directory holding the segment files (None until the first spill)"""
+        return self._directory
+
+    @property
+    def disk_bytes(self) -> int:
+        """Bytes used by the segment files"""
+        return sum(segment['size'] for segment in self._segments)
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of records in the cold tier (on disk or waiting to be written)"""
+        return self._cold_count + len(self._pending)
+
+    def __len__(self) -> int:
+        return self._cold_count + len(self._pending) + len(self._hot)
+
+    def __bool__(self) -> bool:
+        return bool(self._hot) or bool(self._pending) or bool(self._cold_count)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over records from oldest to newest"""
+        return self.iter_query()
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Get a record by position (O(1) in the hot tier, a scan in the cold tier)
+
+        Args:
+            index (int): Position from oldest (0) to newest; negative values count from the newest
+
+        Returns:
+            Any: Record at that position
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("record index out of range")
+        cold = self.spilled_count
+        if index >= cold:
+            return self._hot[index - cold]
+        return next(islice(self._iter_cold(None, None, None, None), index, None))
+
+    def append(self, record: Any) -> None:
+        """
+        Add a record, spilling the oldest in-memory record to disk if the hot tier is full
+
+        Args:
+            record (Any): Record to store
+        """
+        self._evict(self._hot.append(record))
+
+    def insert(self, record: Any) -> None:
+        """
+        Add a record that may be older than the newest ones, keeping time order in memory
+
+        Records already spilled to disk are not reordered; a record older
+        than all in-memory records becomes the oldest one in memory.
+
+        Args:
+            record (Any): Record to store
+        """
+        self._evict(self._hot.insert(record))
+
+    def _evict(self, evicted: Any) -> None:
+        """Queue a record evicted from the hot tier for the next spill"""
+        if evicted is not None:
+            pending = self._pending
+            pending.append(evicted)
+            if len(pending) >= self.SPILL_BATCH_SIZE:
+                self._spill()
+
+    def _spill(self) -> None:
+        """Write the pending evicted records to the current segment"""
+        pending = self._pending
+        if not pending:
+            return
+        try:
+            if self._file is None or self._segments[-1]['size'] >= self.segment_size:
+                self._open_segment(pending[0].created)
+            data = self._encoder.encode(pending)
+            self._file.write(data)
+
+            segment = self._segments[-1]
+            segment['size'] += len(data)
+            segment['count'] += len(pending)
+            times = [record.created for record in pending]
+            levels = [record.level for record in pending]
+            segment['first'] = min(segment['first'], min(times))
+            segment['last'] = max(segment['last'], max(times))
+            segment['min_level'] = min(segment['min_level'], min(levels))
+            segment['max_level'] = max(segment['max_level'], max(levels))
+            self._cold_count += len(pending)
+            self._trim_segments()
+        except Exception as e:
+            # The records are dropped, as a plain RecordStore would have done
+            print(f"Error writing record history segment: {e}", file=sys.stderr)
+        finally:
+            pending.clear()
+
+    def _open_segment(self, now: float) -> None:
+        """Close the current segment and start a new one"""
+        self._close_file()
+        if self._directory is None or not os.path.isdir(self._directory):
+            if self._parent_directory:
+                os.makedirs(self._parent_directory, exist_ok=True)
+            self._directory = tempfile.mkdtemp(prefix="modern_logger_history_", dir=self._parent_directory)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._directory, True)
+        self._segment_number += 1
+        path = os.path.join(self._directory, f"segment-{self._segment_number:06d}.mlog")
+        self._file = open(path, 'wb')
+        header = HEADER + self._encoder.sync(now)
+        self._file.write(header)
+        self._segments.append({
+            'path': path, 'size': len(header), 'count': 0,
+            'first': float('inf'), 'last': float('-inf'),
+            'min_level': sys.maxsize, 'max_level': -sys.maxsize,
+        })
+
+    def _trim_segments(self) -> None:
+        """Delete the oldest segments while the cold tier exceeds max_disk_bytes"""
+        if self.max_disk_bytes is None:
+            return
+        # The segment being written is never deleted
+        while len(self._segments) > 1 and self.disk_bytes > self.max_disk_bytes:
+            segment = self._segments.pop(0)
+            self._cold_count -= segment['count']
+            try:
+                os.remove(segment['path'])
+            except OSError as e:
+                print(f"Error removing record history segment: {e}", file=sys.stderr)
+
+    def _close_file(self) -> None:
+        """Close the segment being written"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception as e:
+                print(f"Error closing record history segment: {e}", file=sys.stderr)
+            self._file = None
+
+    def flush(self) -> None:
+        """Write the pending evicted records and flush the current segment"""
+        self._spill()
+        if self._file is not None:
+            self._file.flush()
+
+    def _iter_cold(self, level_filter, start_time, end_time, logger_name) -> Iterator[Any]:
+        """Iterate over matching cold-tier records, oldest first"""
+        if self._file is not None:
+            # Make everything written so far visible to the readers
+            self._file.flush()
+        for segment in list(self._segments):
+            if not self._segment_matches(segment, level_filter, start_time, end_time):
+                continue
+            with BinaryLogReader(segment['path']) as reader:
+                yield from reader.records(level_filter, start_time, end_time, logger_name)
+
+        yield from (
+            r for r in list(self._pending)
+            if (level_filter is None or r.level >= level_filter)
+            and (start_time is None or r.created >= start_time)
+            and (end_time is None or r.created < end_time)
+            and (logger_name is None or r.logger_name == logger_name)
+        )
+
+    @staticmethod
+    def _segment_matches(segment: Dict[str, Any], level_filter, start_time, end_time) -> bool:
+        """Check whether a segment can hold records matching the filters"""
+        return (segment['count'] > 0
+                and (level_filter is None or segment['max_level'] >= level_filter)
+                and (start_time is None or segment['last'] >= start_time)
+                and (end_time is None or segment['first'] < end_time))
+
+    @staticmethod
+    def _time_range(start_time, end_time) -> tuple:
+        """Convert datetime bounds to epoch seconds"""
+        if isinstance(start_time, datetime):
+            start_time = start_time.timestamp()
+        if isinstance(end_time, datetime):
+            end_time = end_time.timestamp()
+        return start_time, end_time
+
+    def last(self, count: int) -> List[Any]:
+        """
+        Get the most recent records
+
+        Args:
+            count (int): Number of records to return
+
+        Returns:
+            List[Any]: Up to count records, oldest first
+        """
+        return self.query(limit=count)
+
+    def to_list(self) -> List[Any]:
+        """
+        Get all records, including the cold tier, as a list
+
+        Returns:
+            List[Any]: All records, oldest first
+        """
+        return list(self)
+
+    def query(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[Union[datetime, float]] = None,
+              end_time: Optional[Union[datetime, float]] = None,
+              logger_name: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Any]:
+        """
+        Get records from both tiers matching all of the given filters
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+            limit (Optional[int]): Maximum number of records to return (most recent)
+
+        Returns:
+            List[Any]: Matching records, oldest first
+        """
+        start_time, end_time = self._time_range(start_time, end_time)
+        if limit is None:
+            return list(self.iter_query(level_filter, start_time, end_time, logger_name))
+        if limit <= 0:
+            return []
+
+        # The newest records are in memory; only read the disk for what they do not cover
+        records = self._hot.query(level_filter, start_time, end_time, logger_name, limit)
+        if len(records) < limit and self.spilled_count:
+            older = deque(self._iter_cold(level_filter, start_time, end_time, logger_name),
+                          maxlen=limit - len(records))
+            records = list(older) + records
+        return records
+
+    def iter_query(self,
+                   level_filter: Optional[int] = None,
+                   start_time: Optional[Union[datetime, float]] = None,
+                   end_time: Optional[Union[datetime, float]] = None,
+                   logger_name: Optional[str] = None) -> Iterator[Any]:
+        """
+        Stream records from both tiers matching all of the given filters
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            Iterator[Any]: Matching records, oldest first
+        """
+        start_time, end_time = self._time_range(start_time, end_time)
+        return chain(self._iter_cold(level_filter, start_time, end_time, logger_name),
+                     self._hot.iter_query(level_filter, start_time, end_time, logger_name))
+
+    def count(self,
+              level_filter: Optional[int] = None,
+              start_time: Optional[Union[datetime, float]] = None,
+              end_time: Optional[Union[datetime, float]] = None,
+              logger_name: Optional[str] = None) -> int:
+        """
+        Count records in both tiers matching all of the given filters
+
+        Args:
+            level_filter (Optional[int]): Minimum level to include
+            start_time (Optional[Union[datetime, float]]): Earliest record time to include (inclusive)
+            end_time (Optional[Union[datetime, float]]): Latest record time to include (exclusive)
+            logger_name (Optional[str]): Only include records from this logger
+
+        Returns:
+            int: Number of matching records
+        """
+        start_time, end_time = self._time_range(start_time, end_time)
+        if level_filter is None and start_time is None and end_time is None and logger_name is None:
+            return len(self)
+
+        total = self._hot.count(level_filter, start_time, end_time, logger_name)
+        total += sum(
+            1 for r in self._pending
+            if (level_filter is None or r.level >= level_filter)
+            and (start_time is None or r.created >= start_time)
+            and (end_time is None or r.created < end_time)
+            and (logger_name is None or r.logger_name == logger_name)
+        )
+        if self._file is not None:
+            self._file.flush()
+        for segment in self._segments:
+            if not self._segment_matches(segment, level_filter, start_time, end_time):
+                continue
+            if (logger_name is None
+                    and (level_filter is None or segment['min_level'] >= level_filter)
+                    and (start_time is None or segment['first'] >= start_time)
+                    and (end_time is None or segment['last'] < end_time)):
+                total += segment['count']
+                continue
+            with BinaryLogReader(segment['path']) as reader:
+                total += reader.count(level_filter, start_time, end_time, logger_name)
+        return total
+
+    def resize(self, capacity: int) -> None:
+        """
+        Change the in-memory capacity; records that no longer fit are spilled to disk
+
+        Args:
+            capacity (int): New maximum number of records kept in memory
+        """
+        capacity = max(0, capacity)
+        overflow = len(self._hot) - capacity
+        if overflow > 0:
+            self._pending.extend(self._hot.to_list()[:overflow])
+            self._spill()
+        self._hot.resize(capacity)
+
+    def clear(self) -> None:
+        """Remove all records and delete the segment files"""
+        self._hot.clear()
+        self._pending.clear()
+        self._close_file()
+        for segment in self._segments:
+            try:
+                os.remove(segment['path'])
+            except OSError as e:
+                print(f"Error removing record history segment: {e}", file=sys.stderr)
+        self._segments = []
+        self._cold_count = 0
+
+    def close(self) -> None:
+        """Remove all records and the segment directory"""
+        self.clear()
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._directory = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Segment files belong to this store; a copy starts with the in-memory tier only
+        return {
+            'capacity': self.capacity,
+            'directory': self._parent_directory,
+            'segment_size': self.segment_size,
+            'max_disk_bytes': self.max_disk_bytes,
+            'records': self._hot.to_list(),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['capacity'], state['directory'], state['segment_size'], state['max_disk_bytes'])
+        for record in state['records']:
+            self._hot.append(record)
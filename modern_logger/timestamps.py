@@ -0,0 +1,78 @@
+"""
+Timestamp formatting for Modern Logger.
+
+Rendering a timestamp with strftime is one of the most expensive steps of
+formatting a log line, yet most formats only change once per second. This
+module provides formatters that cache the rendered text for the current
+second and are shared by every logger in the process that uses the same
+format string.
+"""
+
+import math
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class TimestampFormatter:
+    """Render epoch timestamps with a strftime format, caching the current second"""
+
+    # Directives that change faster than once per second and defeat the cache
+    SUBSECOND_DIRECTIVES = ("%f",)
+
+    def __init__(self, format_str: str):
+        """
+        Initialize a timestamp formatter
+
+        Args:
+            format_str (str): Format string for datetime.strftime()
+        """
+        self.format_str = format_str
+        self._subsecond = any(d in format_str for d in self.SUBSECOND_DIRECTIVES)
+        # (second, rendered text) replaced as a whole so readers never see a torn pair
+        self._cache = (None, "")
+
+    def format(self, created: Optional[float] = None) -> str:
+        """
+        Render a timestamp
+
+        Args:
+            created (Optional[float]): Epoch seconds as returned by time.time(). Defaults to None (now).
+
+        Returns:
+            str: Rendered timestamp
+        """
+        if created is None:
+            created = time.time()
+
+        if self._subsecond:
+            return datetime.fromtimestamp(created).strftime(self.format_str)
+
+        second = math.floor(created)
+        cached = self._cache
+        if cached[0] == second:
+            return cached[1]
+
+        text = datetime.fromtimestamp(second).strftime(self.format_str)
+        self._cache = (second, text)
+        return text
+
+
+# Formatters shared across all loggers, keyed by format string
+_formatters: Dict[str, TimestampFormatter] = {}
+
+
+def get_timestamp_formatter(format_str: str) -> TimestampFormatter:
+    """
+    Get the process-wide formatter for a format string
+
+    Args:
+        format_str (str): Format string for datetime.strftime()
+
+    Returns:
+        TimestampFormatter: Shared formatter for format_str
+    """
+    formatter = _formatters.get(format_str)
+    if formatter is None:
+        formatter = _formatters.setdefault(format_str, TimestampFormatter(format_str))
+    return formatter
@@ -0,0 +1,228 @@
+"""
+Background writers for Modern Logger.
+
+This module provides the asynchronous write pipeline used by sinks that
+should not pay I/O latency on the caller's thread:
+- BackgroundWriter, a bounded queue drained by a dedicated writer thread
+"""
+
+import atexit
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from typing import Any, Callable, List
+
+# Writers still running, drained at interpreter exit so queued items are not lost
+_live_writers = weakref.WeakSet()
+
+
+def _close_all_writers() -> None:
+    """Drain and stop every live writer"""
+    for writer in list(_live_writers):
+        writer.close()
+
+
+atexit.register(_close_all_writers)
+
+
+class BackgroundWriter:
+    """Bounded queue drained in batches by a dedicated writer thread"""
+
+    # Overflow policies applied when the queue is full
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEW = "drop_new"
+
+    OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEW)
+
+    def __init__(self,
+                 write_batch: Callable[[List[Any]], None],
+                 max_queue_size: int = 10000,
+                 batch_size: int = 512,
+                 flush_interval: float = 0.5,
+                 overflow_policy: str = BLOCK,
+                 name: str = "ModernLoggerWriter"):
+        """
+        Initialize and start a background writer
+
+        Args:
+            write_batch (Callable[[List[Any]], None]): Called on the writer thread with each batch of items.
+                A bound method is held weakly; batches queued after its object is collected are dropped.
+            max_queue_size (int, optional): Maximum number of queued items. Defaults to 10000.
+            batch_size (int, optional): Number of queued items that triggers an early write. Defaults to 512.
+            flush_interval (float, optional): Maximum seconds an item waits before being written. Defaults to 0.5.
+            overflow_policy (str, optional): 'block', 'drop_oldest' or 'drop_new'. Defaults to 'block'.
+            name (str, optional): Writer thread name. Defaults to "ModernLoggerWriter".
+        """
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {overflow_policy}. "
+                             f"Supported policies: {', '.join(self.OVERFLOW_POLICIES)}")
+
+        # Bound methods are held weakly so the thread does not keep their owner
+        # (e.g. a FileLogger and its open file) alive; __del__ can still close it
+        if hasattr(write_batch, '__self__') and hasattr(write_batch, '__func__'):
+            self._write_batch = weakref.WeakMethod(write_batch)
+            # Stop the thread if the owner is collected without being closed
+            weakref.finalize(write_batch.__self__, self.close, 0)
+        else:
+            self._write_batch = lambda: write_batch
+        self.max_queue_size = max(1, max_queue_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self.overflow_policy = overflow_policy
+
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._drained = threading.Condition(self._lock)
+        self._in_flight = 0  # Items taken off the queue but not yet written
+        self._flush_requested = False
+        self._closed = False
+        self._dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        _live_writers.add(self)
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of items discarded by the overflow policy"""
+        return self._dropped
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has been closed"""
+        return self._closed
+
+    def put(self, item: Any) -> bool:
+        """
+        Queue an item for writing
+
+        Args:
+            item (Any): Item passed to write_batch on the writer thread
+
+        Returns:
+            bool: True if the item was queued, False if it was dropped
+        """
+        with self._lock:
+            if self._closed:
+                return False
+
+            queue = self._queue
+            if len(queue) >= self.max_queue_size:
+                if self.overflow_policy == self.DROP_NEW:
+                    self._dropped += 1
+                    return False
+                elif self.overflow_policy == self.DROP_OLDEST:
+                    queue.popleft()
+                    self._dropped += 1
+                else:
+                    while len(queue) >= self.max_queue_size and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        return False
+
+            queue.append(item)
+
+            # Wake the writer when work arrives or a full batch is ready
+            size = len(queue)
+            if size == 1 or size == self.batch_size:
+                self._not_empty.notify()
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Write all queued items and wait until they are written
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to None (wait indefinitely).
+
+        Returns:
+            bool: True if the queue was drained, False on timeout
+        """
+        if threading.current_thread() is self._thread:
+            return False
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._flush_requested = True
+            self._not_empty.notify()
+            while (self._queue or self._in_flight) and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._drained.wait(remaining)
+        return True
+
+    def close(self, timeout: float = None) -> None:
+        """
+        Drain the queue and stop the writer thread
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait for the thread. Defaults to None (wait indefinitely).
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        _live_writers.discard(self)
+
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+            return
+
+        # Closed from the writer thread itself, e.g. by the owner's __del__ after the thread
+        # dropped the last reference to it: write what is left while the owner still exists
+        with self._lock:
+            batch = list(self._queue)
+            self._queue.clear()
+        write_batch = self._write_batch()
+        if batch and write_batch is not None:
+            try:
+                write_batch(batch)
+            except Exception:
+                print(f"Error in background writer: {traceback.format_exc()}", file=sys.stderr)
+
+    def _run(self) -> None:
+        """Writer thread main loop"""
+        while True:
+            with self._lock:
+                # Sleep until there is work
+                while not self._queue and not self._closed and not self._flush_requested:
+                    self._not_empty.wait()
+
+                # Coalesce until a full batch is ready or the flush interval expires
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._queue) < self.batch_size and not self._closed and not self._flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._not_empty.wait(remaining)
+
+                batch = list(self._queue)
+                self._queue.clear()
+                self._in_flight = len(batch)
+                self._flush_requested = False
+                self._not_full.notify_all()
+
+            if batch:
+                write_batch = self._write_batch()
+                if write_batch is not None:
+                    try:
+                        write_batch(batch)
+                    except Exception:
+                        print(f"Error in background writer: {traceback.format_exc()}", file=sys.stderr)
+                # Do not hold the owner while waiting for the next batch
+                write_batch = None
+
+            with self._lock:
+                self._in_flight = 0
+                self._drained.notify_all()
+                if self._closed and not self._queue:
+                    return
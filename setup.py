@@ -15,6 +15,7 @@ setup(
     ],
     extras_require={
         "gui": ["PySide6>=6.0.0"],
+        "columnar": ["numpy>=1.17"],
         "dev": ["PySide6>=6.0.0"],
     },
     classifiers=[
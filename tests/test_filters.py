@@ -0,0 +1,23 @@
+"""
+Tests that per-template rate limits key on the template under MultiLogger fan-out.
+"""
+
+import io
+
+from modern_logger import ConsoleLogger, KeyRateLimitFilter, MultiLogger
+
+
+def test_children_limit_by_template_across_arguments():
+    console = ConsoleLogger(stream=io.StringIO(), use_colors=False)
+    key_filter = KeyRateLimitFilter(rate=0.001, burst=5)
+    console.add_filter(key_filter)
+    logger = MultiLogger(loggers=[MultiLogger(name="Inner", loggers=[console])])
+
+    for i in range(100):
+        logger.error("timeout on host %s", f"10.0.0.{i}")
+    logger.error("disk full")
+
+    lines = console.stream.getvalue().splitlines()
+    assert len(lines) == 6
+    assert lines[-1].endswith("disk full")
+    assert key_filter.suppressed_count == 95
@@ -0,0 +1,49 @@
+"""
+Tests that LogFileReader follows a log file that is truncated, rotated or uses CRLF line endings.
+"""
+
+import os
+
+from modern_logger import FileLogger, LogFileReader
+
+
+def write(path, mode, count, prefix):
+    logger = FileLogger(filename=path, mode=mode)
+    for i in range(count):
+        logger.info("%s %d", prefix, i)
+    logger.close()
+
+
+def test_refresh_rebuilds_the_index_after_truncation(tmp_path):
+    path = str(tmp_path / "app.log")
+    write(path, "w", 2000, "old")
+    with LogFileReader(path, block_size=4096) as reader:
+        assert reader.count() == 2000
+        write(path, "w", 10, "new")
+        reader.refresh()
+        assert [record.message for record in reader.records()] == [f"new {i}" for i in range(10)]
+
+    # The saved index was rebuilt too
+    with LogFileReader(path, block_size=4096) as reader:
+        assert reader.count() == 10
+
+
+def test_refresh_follows_a_rotated_file(tmp_path):
+    path = str(tmp_path / "app.log")
+    write(path, "w", 500, "old")
+    with LogFileReader(path) as reader:
+        os.replace(path, path + ".1")
+        write(path, "w", 600, "new")
+        reader.refresh()
+        messages = [record.message for record in reader.records()]
+    assert messages == [f"new {i}" for i in range(600)]
+
+
+def test_crlf_line_endings_are_stripped(tmp_path):
+    path = str(tmp_path / "app.log")
+    with open(path, "wb") as f:
+        f.write(b"[2024-06-10 12:00:00] [INFO]     first\r\n"
+                b"[2024-06-10 12:00:01] [ERROR]    Traceback:\r\n  line 2\r\n"
+                b"[2024-06-10 12:00:02] [WARNING]  last\r\n")
+    with LogFileReader(path, persist_index=False) as reader:
+        assert [record.message for record in reader.records()] == ["first", "Traceback:\n  line 2", "last"]
@@ -0,0 +1,50 @@
+"""
+Tests that records logged from several threads are stored in time order.
+"""
+
+import threading
+import time
+
+from modern_logger import Logger
+
+
+def test_records_from_threads_at_different_rates_are_sorted():
+    logger = Logger("Threads")
+    logger.set_max_records(100_000)
+
+    def worker(index):
+        for i in range(4000):
+            logger.info("worker %d record %d", index, i)
+            if index % 2 and i % 100 == 0:
+                time.sleep(0.001 * index)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    records = logger.get_records()
+    created = [record.created for record in records]
+    assert len(records) == 32_000
+    assert created == sorted(created)
+    assert [record.created for record in logger.get_records(limit=100)] == created[-100:]
+
+
+def test_full_store_keeps_the_newest_records_in_order():
+    logger = Logger("Threads")
+    logger.set_max_records(500)
+
+    def worker(index):
+        for i in range(3000):
+            logger.info("worker %d record %d", index, i)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    created = [record.created for record in logger.get_records()]
+    assert len(created) == 500
+    assert created == sorted(created)
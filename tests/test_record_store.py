@@ -0,0 +1,67 @@
+"""
+Tests for inserting late records into the record stores.
+"""
+
+import pytest
+
+from modern_logger import ColumnarRecordStore, Logger, RecordStore, TieredRecordStore
+from modern_logger.logger import LogRecord
+
+
+def record(created):
+    return LogRecord(created, 20, "INFO", f"at {created}", "Test")
+
+
+@pytest.mark.parametrize("store_class", [RecordStore, ColumnarRecordStore])
+@pytest.mark.parametrize("capacity", [1, 4, 50])
+def test_insert_keeps_time_order(store_class, capacity):
+    store = store_class(capacity)
+    times = []
+    for i in range(200):
+        # Every fifth record arrives late, up to a few places behind the newest
+        created = i - (i % 7) / 2 if i % 5 == 0 else float(i)
+        if times and created < times[-1]:
+            store.insert(record(created))
+        else:
+            store.append(record(created))
+        times = sorted(times + [created])
+
+    assert [stored.created for stored in store.to_list()] == times[-capacity:]
+
+
+def test_tiered_insert_orders_the_memory_tier(tmp_path):
+    store = TieredRecordStore(capacity=10, directory=str(tmp_path))
+    for i in range(20):
+        store.append(record(float(i)))
+    store.insert(record(14.5))
+
+    assert [stored.created for stored in store.last(6)] == [14.5, 15.0, 16.0, 17.0, 18.0, 19.0]
+    store.close()
+
+
+def test_attached_tiered_store_keeps_its_capacity_and_spills(tmp_path):
+    logger = Logger("Tiered")
+    store = TieredRecordStore(capacity=100, directory=str(tmp_path))
+    logger.set_record_store(store)
+    for i in range(1000):
+        logger.info("record %d", i)
+
+    records = logger.get_records()
+    assert store.capacity == 100
+    assert store.spilled_count == 900
+    assert len(records) == 1000
+    assert [record.message for record in records[:2]] == ["record 0", "record 1"]
+    store.close()
+
+
+def test_attached_store_keeps_the_newest_existing_records():
+    logger = Logger("Columnar")
+    for i in range(50):
+        logger.info("record %d", i)
+    logger.set_record_store(ColumnarRecordStore(capacity=10))
+
+    assert [record.message for record in logger.get_records()] == [f"record {i}" for i in range(40, 50)]
+    logger.set_max_records(20)
+    for i in range(50, 70):
+        logger.info("record %d", i)
+    assert len(logger.get_records()) == 20
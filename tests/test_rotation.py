@@ -0,0 +1,60 @@
+"""
+Tests that size-based rotation keeps every file close to max_size.
+"""
+
+import glob
+import os
+
+import pytest
+
+from modern_logger import BinaryFileLogger, BinaryLogReader, FileLogger, Logger
+from modern_logger.logger import LogRecord
+
+MAX_SIZE = 50_000
+
+
+def batch(count):
+    return [LogRecord(1_700_000_000 + i / 10, Logger.INFO, "INFO", f"request {i} handled in {i % 997} ms", "Test")
+            for i in range(count)]
+
+
+@pytest.mark.parametrize("logger_class, filename", [(FileLogger, "app.log"), (BinaryFileLogger, "app.mlog")])
+def test_one_large_batch_is_split_across_rotated_files(tmp_path, logger_class, filename):
+    path = str(tmp_path / filename)
+    logger = logger_class(filename=path, mode="w", max_size=MAX_SIZE, backup_count=20)
+    records = batch(10_000)
+    logger._emit_batch(records)
+    logger.close()
+
+    backups = [name for name in glob.glob(path + ".*") if not name.endswith(".idx")]
+    assert len(backups) >= 5
+    for backup in backups:
+        # Each file ends at the line that reached max_size
+        assert MAX_SIZE <= os.path.getsize(backup) < MAX_SIZE * 1.05, backup
+    assert os.path.getsize(path) < MAX_SIZE * 1.05
+
+
+def test_split_batch_keeps_every_line(tmp_path):
+    path = str(tmp_path / "app.log")
+    logger = FileLogger(filename=path, mode="w", max_size=MAX_SIZE, backup_count=50)
+    logger._emit_batch(batch(10_000))
+    logger.close()
+
+    lines = 0
+    for name in glob.glob(path + "*"):
+        with open(name, encoding="utf-8") as f:
+            lines += sum(1 for _ in f)
+    assert lines == 10_000
+
+
+def test_split_binary_batch_keeps_every_record(tmp_path):
+    path = str(tmp_path / "app.mlog")
+    logger = BinaryFileLogger(filename=path, mode="w", max_size=MAX_SIZE, backup_count=50)
+    logger._emit_batch(batch(10_000))
+    logger.close()
+
+    messages = []
+    for name in sorted(glob.glob(path + "*"), key=lambda name: -int(name.rsplit(".", 1)[1]) if name != path else 0):
+        with BinaryLogReader(name) as reader:
+            messages.extend(record.message for record in reader)
+    assert messages == [record.message for record in batch(10_000)]